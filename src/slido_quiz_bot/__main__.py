@@ -8,40 +8,239 @@ Usage:
     python slido_bot.py -u <slido_url> -n <participant_name>
     poetry run slido-quiz-bot -u <slido_url> -n <participant_name>
     slido-quiz-bot -u <slido_url> -n <participant_name>
+    slido-quiz-bot -u <slido_url> -n <participant_name> <participant_name> ...
+    slido-quiz-bot -u <slido_url> -n <participant_name> -c <participant_count>
+    slido-quiz-bot benchmark <dataset> [--stub]
+    slido-quiz-bot load-test <dataset> [--participants N]
+    slido-quiz-bot daemon [--workers N] [--port PORT]
+    slido-quiz-bot startup [--max_import_time SECONDS]
+
+Playwright, `google.generativeai` and the subcommands are only imported once the arguments are
+parsed and known to need them, and the model clients are created and warmed up in a background
+thread while the browser is launched and navigates to the quiz.
 """
 
 import argparse
+import asyncio
+import importlib
+import sys
+import threading
+
+from rich.console import Console
+
+from slido_quiz_bot.answer_quiz_question import Answerer, set_default_answerer, warm_up_default_answerer
+from slido_quiz_bot.flight_recorder import FlightRecorder
+from slido_quiz_bot.memory import LAUNCH_PROFILES
+from slido_quiz_bot.metrics import Metrics, set_metrics
+from slido_quiz_bot.network_filter import NETWORK_PROFILES
+from slido_quiz_bot.quota import QuotaScheduler
+from slido_quiz_bot.similarity_index import SimilarityIndex
+from slido_quiz_bot.single_flight import ANSWER_STRATEGIES
+
+# Subcommands, dispatched on the first command line argument, as the lazily imported "module:function" handling them
+SUBCOMMANDS = {
+    "benchmark": "slido_quiz_bot.benchmark:benchmark_main",
+    "load-test": "slido_quiz_bot.load_test:load_test_main",
+    "daemon": "slido_quiz_bot.daemon:daemon_main",
+    "startup": "slido_quiz_bot.startup:startup_main",
+}
 
-from slido_quiz_bot.slido_bot import respond_to_slido_quiz
+console = Console()
+
+
+def load_subcommand(name):
+    """Imports the function handling a subcommand.
+
+    Args:
+        name (str): The name of the subcommand, a key of `SUBCOMMANDS`.
+
+    Returns:
+        Callable[[list[str]], Any]: The function handling the subcommand's arguments.
+    """
+    module_name, function_name = SUBCOMMANDS[name].split(":")
+    return getattr(importlib.import_module(module_name), function_name)
 
 
 # Define the CLI entry point
-def main():
+def main(argv=None):
     """Main function to handle the Slido quiz participation.
 
     This function sets up an argument parser to accept a Slido quiz URL and
     participant name, then calls the `respond_to_slido_quiz` function to
-    simulate answering the quiz.
+    simulate answering the quiz. When several participants are requested,
+    they all run concurrently from one browser with `respond_to_slido_quiz_async`.
 
     Arguments:
         - slio_url (str): The URL of the Slido quiz.
-        - participant_name (str): The name of the participant (defaults to "Alan Turing").
+        - participant_name (list[str]): The names of the participants (defaults to "Alan Turing").
+        - participant_count (int): The number of participants to run, numbering the first name as needed.
+        - cache_path (str): The path of a persistent answer cache (disabled by default).
+        - strategy (str): How concurrent participants pick their answers (defaults to "consensus").
+        - no_warm_up (bool): Skip warming up the model clients at startup.
+        - hedge_after (float): Seconds after which a slow model is hedged with the next one (disabled by default).
+        - network_profile (str): Which requests the participant pages block (defaults to "default").
+        - state_dir (str): A directory where the participants' storage states are saved to rejoin after a restart.
+        - metrics_port (int): Serve per-stage latency metrics on http://127.0.0.1:<port>/metrics (disabled by default).
+        - trace_path (str): Append every timed stage to this JSONL trace file (disabled by default).
+        - index_path (str): The JSONL log of a similarity index answering reworded past questions (disabled by default).
+        - requests_per_minute (float): Pace the requests to every model within this quota, backing off on 429s (disabled by default).
+        - quota_dir (str): A directory sharing the request quota with the other bot processes using it (disabled by default).
+        - flight_recorder_dir (str): Where the flight records of failed participants and slow questions are written (defaults to "flight_records").
+        - slow_question_threshold (float): Seconds from reading to submission past which a question is written to a flight record (defaults to 10).
+        - no_flight_recorder (bool): Do not keep the recent events of every participant in memory.
+        - launch_profile (str): The Chromium switches of the browser: "default", "low_memory" or "minimal" (defaults to "default").
+        - memory_budget_mb (float): The JavaScript heap, in MB, past which a participant's context is recycled between questions
+          (disabled by default).
+
+    The first argument may also name one of the `SUBCOMMANDS` (e.g. `benchmark`),
+    in which case the remaining arguments are handed over to that subcommand.
+
+    Args:
+        argv (list[str]|None): The command line arguments. Defaults to `sys.argv[1:]`.
 
     Usage:
         python slido_bot.py -u <slido_url> -n <participant_name>
         poetry run slido-quiz-bot -u <slido_url> -n <participant_name>
         slido-quiz-bot -u <slido_url> -n <participant_name>
+        slido-quiz-bot benchmark <dataset> [--stub]
+        slido-quiz-bot load-test <dataset> [--participants N]
+        slido-quiz-bot daemon [--workers N] [--port PORT]
+        slido-quiz-bot startup [--max_import_time SECONDS]
     """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in SUBCOMMANDS:
+        load_subcommand(argv[0])(argv[1:])
+        return
+
     # Create an argument parser
     parser = argparse.ArgumentParser(description="Respond to a Slido quiz.")
     parser.add_argument("-u", "--slio_url", type=str, required=True, help="The Slido quiz URL.")
-    parser.add_argument("-n", "--participant_name", type=str, default="Alan Turing", help="The participant name to answer the quiz.")
+    parser.add_argument("-n", "--participant_name", type=str, nargs="+", default=["Alan Turing"], help="The participant name(s) to answer the quiz.")
+    parser.add_argument("-c", "--participant_count", type=int, default=None, help="The number of participants to run concurrently.")
+    parser.add_argument(
+        "--strategy",
+        type=str,
+        choices=sorted(ANSWER_STRATEGIES),
+        default="consensus",
+        help="How concurrent participants pick their answers: all the same one, or spread across the choices.",
+    )
+    parser.add_argument("--no_warm_up", dest="warm_up", action="store_false", help="Do not warm up the model clients at startup.")
+    parser.add_argument("--hedge_after", type=float, default=None, help="Seconds after which a slow model request is hedged with the next model.")
+    parser.add_argument("--cache_path", type=str, default=None, help="Path of a persistent answer cache shared across runs.")
+    parser.add_argument(
+        "--network_profile",
+        type=str,
+        default="default",
+        help=f"The requests to block: one of {', '.join(NETWORK_PROFILES)}, or the path of a JSON profile.",
+    )
+
+    parser.add_argument(
+        "--state_dir", type=str, default=None, help="Directory of saved participant storage states, to rejoin without the name form after a restart."
+    )
+
+    parser.add_argument("--metrics_port", type=int, default=None, help="Serve per-stage latency metrics on this local port at /metrics.")
+    parser.add_argument("--trace_path", type=str, default=None, help="Append every timed stage to this JSONL trace file.")
+
+    parser.add_argument("--index_path", type=str, default=None, help="Path of a similarity index answering reworded versions of past questions.")
+
+    parser.add_argument("--requests_per_minute", type=float, default=None, help="Pace the requests to every model within this quota.")
+    parser.add_argument("--quota_dir", type=str, default=None, help="Directory sharing the request quota with the other bot processes using it.")
+
+    parser.add_argument(
+        "--flight_recorder_dir", type=str, default="flight_records", help="Directory of the flight records written on failures and slow questions."
+    )
+    parser.add_argument(
+        "--slow_question_threshold", type=float, default=10.0, help="Seconds from reading to submission past which a question is flight recorded."
+    )
+    parser.add_argument("--launch_profile", choices=sorted(LAUNCH_PROFILES), default="default", help="Chromium switches trading speed for memory.")
+    parser.add_argument(
+        "--memory_budget_mb", type=float, default=None, help="Recycle a participant's context when its JavaScript heap exceeds this many MB."
+    )
+    parser.add_argument("--no_flight_recorder", dest="flight_recorder", action="store_false", help="Keep no flight recorder of the participants.")
 
     # Parse the arguments
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Call the function with parsed arguments
-    respond_to_slido_quiz(args.slio_url, args.participant_name)
+    if args.quota_dir and args.requests_per_minute is None:
+        parser.error("--quota_dir requires --requests_per_minute.")
+    if args.hedge_after is not None or args.index_path or args.requests_per_minute is not None:
+        similarity_index = SimilarityIndex(args.index_path) if args.index_path else None
+        quota = QuotaScheduler(args.requests_per_minute, state_dir=args.quota_dir) if args.requests_per_minute is not None else None
+        set_default_answerer(Answerer(hedge_after=args.hedge_after, similarity_index=similarity_index, quota=quota))
+    recorder = FlightRecorder(args.flight_recorder_dir, slow_question_threshold=args.slow_question_threshold) if args.flight_recorder else None
+    metrics = Metrics(trace_path=args.trace_path, enabled=args.metrics_port is not None or bool(args.trace_path), recorder=recorder)
+    set_metrics(metrics)
+    if args.metrics_port is not None:
+        metrics.serve(port=args.metrics_port)
+    if args.warm_up:
+        threading.Thread(target=warm_up_default_answerer, name="slido-quiz-bot-warm-up", daemon=True).start()
+    try:
+        _respond(args)
+    finally:
+        metrics.close()
+        if recorder is not None:
+            console.log(f"[bold blue]Flight recorder:[/bold blue] {recorder.summary()}.")
+
+
+def participant_names_from_args(participant_names, participant_count=None):
+    """Builds the list of participant names requested on the command line.
+
+    When more participants than names are requested, the first name is reused with a number appended.
+
+    Args:
+        participant_names (list[str]): The names given on the command line.
+        participant_count (int|None): The number of participants to run, or None to run one per name.
+
+    Returns:
+        list[str]: The participant names to use.
+
+    Example:
+        >>> participant_names_from_args(["Alan Turing"], 3)
+        ['Alan Turing', 'Alan Turing 2', 'Alan Turing 3']
+    """
+    if participant_count is None:
+        return list(participant_names)
+    names = list(participant_names[:participant_count])
+    names += [f"{participant_names[0]} {i + 1}" for i in range(len(names), participant_count)]
+    return names
+
+
+def _respond(args):
+    """Answers the quiz with one participant from the sync engine, or several from the async engine.
+
+    The engines are imported here, while the model clients are already being warmed up in the background.
+    """
+    participant_names = participant_names_from_args(args.participant_name, args.participant_count)
+    if len(participant_names) == 1:
+        from slido_quiz_bot.slido_bot import respond_to_slido_quiz
+
+        respond_to_slido_quiz(
+            args.slio_url,
+            participant_names[0],
+            cache_path=args.cache_path,
+            warm_up=False,
+            network_profile=args.network_profile,
+            state_dir=args.state_dir,
+            launch_profile=args.launch_profile,
+            memory_budget_mb=args.memory_budget_mb,
+        )
+    else:
+        from slido_quiz_bot.async_slido_bot import respond_to_slido_quiz_async
+
+        asyncio.run(
+            respond_to_slido_quiz_async(
+                args.slio_url,
+                participant_names,
+                cache_path=args.cache_path,
+                strategy=args.strategy,
+                warm_up=False,
+                network_profile=args.network_profile,
+                state_dir=args.state_dir,
+                launch_profile=args.launch_profile,
+                memory_budget_mb=args.memory_budget_mb,
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,198 @@
+"""This module provides a persistent, SQLite-backed cache for quiz question answers.
+
+Answers are keyed on the normalized question text together with the normalized set of answer
+choices, and the chosen answer is stored as text rather than as an index. This way a cached
+answer can still be resolved when Slido presents the same options in a different order.
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+
+from slido_quiz_bot.quizz_question import QuizQuestion
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalizes a piece of quiz text so that cosmetic differences do not affect lookups.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: The text in NFKC form, case-folded and with collapsed whitespace.
+
+    Example:
+        >>> normalize_text("  What is   the Capital of FRANCE? ")
+        'what is the capital of france?'
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
+
+def cache_key(quiz_question: QuizQuestion) -> str:
+    """Computes the cache key of a quiz question.
+
+    The key is built from the normalized question text and the sorted normalized answer choices,
+    so that a shuffled set of options maps onto the same entry.
+
+    Args:
+        quiz_question (QuizQuestion): The quiz question to compute the key for.
+
+    Returns:
+        str: A hex digest identifying the question and its choice set.
+    """
+    choices = sorted(normalize_text(choice) for choice in quiz_question.answer_choices)
+    payload = "\x1e".join([normalize_text(quiz_question.question), *choices])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AnswerCache:
+    """A persistent cache mapping quiz questions to the text of their chosen answer.
+
+    Entries are evicted when they are older than `ttl` seconds, and the least recently used
+    entries are dropped once the cache holds more than `max_entries` answers. Lookups never write
+    to the database: the time an entry was last used is kept in memory and written with the next
+    `put`, `purge_expired` or `close`.
+
+    Attributes:
+        hits (int): The number of lookups that returned a cached answer.
+        misses (int): The number of lookups that did not return a cached answer.
+    """
+
+    def __init__(self, path: str = ":memory:", max_entries: int = 10_000, ttl: float | None = None):
+        """Opens (and creates if needed) the cache database.
+
+        Args:
+            path (str): The path of the SQLite database file. Defaults to an in-memory database.
+            max_entries (int): The maximum number of answers kept in the cache.
+            ttl (float|None): The number of seconds an answer stays valid, or None to keep answers forever.
+
+        Raises:
+            ValueError: If `max_entries` is not positive.
+        """
+        if max_entries <= 0:
+            raise ValueError("The cache must be able to hold at least one entry.")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending_uses: dict[str, float] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "key TEXT PRIMARY KEY, answer_text TEXT NOT NULL, created_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS answers_last_used_at ON answers (last_used_at)")
+        self._connection.commit()
+
+    def get(self, quiz_question: QuizQuestion) -> int | None:
+        """Looks up the cached answer of a quiz question.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question to look up.
+
+        Returns:
+            int|None: The index of the cached answer within the question's current choices, or None on a miss.
+        """
+        key = cache_key(quiz_question)
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute("SELECT answer_text, created_at FROM answers WHERE key = ?", (key,)).fetchone()
+            if row is not None and self.ttl is not None and now - row[1] > self.ttl:
+                # The expired entry is left to the next `put` or `purge_expired`, so that lookups stay read-only
+                row = None
+
+            answer_index = None if row is None else find_choice(quiz_question, row[0])
+            if answer_index is None:
+                self.misses += 1
+                return None
+
+            self._pending_uses[key] = now
+            self.hits += 1
+            return answer_index
+
+    def put(self, quiz_question: QuizQuestion, answer_index: int) -> None:
+        """Stores the chosen answer of a quiz question.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question that was answered.
+            answer_index (int): The index of the chosen answer in the question's choices.
+
+        Raises:
+            IndexError: If `answer_index` is out of range for the question's choices.
+        """
+        answer_text = quiz_question.answer_choices[answer_index]
+        now = time.time()
+        with self._lock:
+            self._flush_uses()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO answers (key, answer_text, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+                (cache_key(quiz_question), answer_text, now, now),
+            )
+            self._connection.execute(
+                "DELETE FROM answers WHERE key NOT IN (SELECT key FROM answers ORDER BY last_used_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._connection.commit()
+
+    def purge_expired(self) -> int:
+        """Removes every entry older than the cache TTL.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            self._flush_uses()
+            cursor = self._connection.execute("DELETE FROM answers WHERE created_at < ?", (time.time() - self.ttl,))
+            self._connection.commit()
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        """Returns the number of answers currently stored in the cache."""
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    @property
+    def hit_rate(self) -> float:
+        """float: The fraction of lookups that were answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def close(self) -> None:
+        """Writes the pending last use times and closes the underlying database connection."""
+        with self._lock:
+            self._flush_uses()
+            self._connection.commit()
+            self._connection.close()
+
+    def _flush_uses(self) -> None:
+        """Writes the last use times of the cache hits since the previous flush, in the caller's transaction."""
+        if self._pending_uses:
+            uses = [(used_at, key) for key, used_at in self._pending_uses.items()]
+            self._connection.executemany("UPDATE answers SET last_used_at = ? WHERE key = ?", uses)
+            self._pending_uses.clear()
+
+
+def find_choice(quiz_question: QuizQuestion, answer_text: str) -> int | None:
+    """Finds the index of an answer text among the choices of a quiz question, ignoring cosmetic differences.
+
+    Args:
+        quiz_question (QuizQuestion): The quiz question whose choices are searched.
+        answer_text (str): The answer text to look for.
+
+    Returns:
+        int|None: The index of the matching choice, or None if no choice matches.
+    """
+    normalized_answer = normalize_text(answer_text)
+    for index, choice in enumerate(quiz_question.answer_choices):
+        if normalize_text(choice) == normalized_answer:
+            return index
+    return None
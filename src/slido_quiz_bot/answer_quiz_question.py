@@ -1,18 +1,48 @@
 """This module provides tools for answering multiple-choice quiz questions using a generative AI model.
 
+The `Answerer` class holds long-lived model clients and generation configs, so that they (and their
+connections) are created once and reused for every question. Questions can be answered one at a time
+with `answer_quiz_question`, or many at once with `answer_quiz_questions`, which packs several questions
+into each model request. Both functions are thin wrappers around a shared default `Answerer`.
+
+`google.generativeai` takes most of the bot's import time, so it is only imported when the first
+`Answerer` is created (it stays reachable as the `genai` attribute of this module), which lets the
+browser start while the model clients are created and warmed up by `warm_up_default_answerer`.
+
 Known Limitation:
     - Supports a maximum of 10 answer choices (indices 0 through 9).
 """
 
+import contextlib
+import contextvars
 import enum
+import json
+import threading
+import time
+import typing
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-import google.generativeai as genai
 from rich.console import Console
 
+from slido_quiz_bot import flight_recorder
+from slido_quiz_bot.answer_cache import AnswerCache
+from slido_quiz_bot.metrics import get_metrics
+from slido_quiz_bot.model_router import ModelRouter
 from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.quota import Priority, QuotaScheduler, is_rate_limit_error
+from slido_quiz_bot.similarity_index import SimilarityIndex
 
 console = Console()
 
+# List of models to try in order
+MODELS = ["gemini-1.5-flash", "gemini-1.5-pro-latest"]
+
+# Rough number of characters per token, used to keep batched prompts within budget
+CHARS_PER_TOKEN = 4
+
+# Output tokens reserved for each answer of a batched request
+OUTPUT_TOKENS_PER_ANSWER = 16
+
 
 class AnswerIndex(enum.Enum):
     """An enumeration representing answer indices for multiple-choice questions.
@@ -33,6 +63,13 @@ class AnswerIndex(enum.Enum):
     NINE = "9"
 
 
+class BatchAnswer(typing.TypedDict):
+    """The structured answer to one question of a batched request."""
+
+    question_id: int
+    answer_index: int
+
+
 def format_prompt(quiz_question: QuizQuestion) -> str:
     r"""Formats a prompt for a multiple-choice quiz question.
 
@@ -54,38 +91,455 @@ def format_prompt(quiz_question: QuizQuestion) -> str:
     return f"Question: {quiz_question.question}\nChoices:\n{choices_str}\nChoose the best answer (provide the number):"
 
 
-def answer_quiz_question(quiz_question: QuizQuestion) -> int:
+def format_batch_prompt(quiz_questions: list[QuizQuestion]) -> str:
+    r"""Formats a prompt asking for the answers to several multiple-choice quiz questions at once.
+
+    Args:
+        quiz_questions (list[QuizQuestion]): The quiz questions to answer, identified by their position in the list.
+
+    Returns:
+        str: A formatted string containing every question and its choices, ready for input into the model.
+
+    Example:
+        >>> print(format_batch_prompt([QuizQuestion("What is the capital of France?", ["Paris", "London"], None)]))
+        Answer each of the following multiple-choice questions.
+        For every question, return its question_id and the answer_index of the best answer.
+        <BLANKLINE>
+        Question 0: What is the capital of France?
+        Choices:
+        0. Paris
+        1. London
+    """
+    questions_str = "\n\n".join(
+        "Question {}: {}\nChoices:\n{}".format(
+            question_id,
+            quiz_question.question,
+            "\n".join(f"{i}. {choice}" for i, choice in enumerate(quiz_question.answer_choices)),
+        )
+        for question_id, quiz_question in enumerate(quiz_questions)
+    )
+    return (
+        "Answer each of the following multiple-choice questions.\n"
+        "For every question, return its question_id and the answer_index of the best answer.\n\n"
+        f"{questions_str}"
+    )
+
+
+def split_into_batches(quiz_questions: list[QuizQuestion], max_prompt_tokens: int = 8_000, max_batch_size: int = 50) -> list[list[QuizQuestion]]:
+    """Splits quiz questions into batches that fit within a prompt token budget.
+
+    Token counts are estimated from the prompt length, which is precise enough to stay well within the model limits.
+    A single question larger than the budget still gets a batch of its own.
+
+    Args:
+        quiz_questions (list[QuizQuestion]): The quiz questions to split.
+        max_prompt_tokens (int): The estimated number of prompt tokens allowed per batch.
+        max_batch_size (int): The maximum number of questions per batch.
+
+    Returns:
+        list[list[QuizQuestion]]: The batches, preserving the order of the questions.
+    """
+    header_tokens = len(format_batch_prompt([])) // CHARS_PER_TOKEN
+    batches = []
+    batch = []
+    batch_tokens = header_tokens
+    for quiz_question in quiz_questions:
+        question_tokens = len(format_batch_prompt([quiz_question])) // CHARS_PER_TOKEN - header_tokens
+        if batch and (batch_tokens + question_tokens > max_prompt_tokens or len(batch) >= max_batch_size):
+            batches.append(batch)
+            batch = []
+            batch_tokens = header_tokens
+        batch.append(quiz_question)
+        batch_tokens += question_tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def parse_batch_answers(response_text: str, quiz_questions: list[QuizQuestion]) -> dict[int, int]:
+    """Parses the JSON response of a batched request, keeping only valid answers.
+
+    Args:
+        response_text (str): The JSON text returned by the model.
+        quiz_questions (list[QuizQuestion]): The quiz questions of the batch, identified by their position.
+
+    Returns:
+        dict[int, int]: The answer index of every question that received a valid answer, keyed by question id.
+    """
+    try:
+        items = json.loads(response_text)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    answers = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        question_id, answer_index = item.get("question_id"), item.get("answer_index")
+        if not isinstance(question_id, int) or not isinstance(answer_index, int) or not 0 <= question_id < len(quiz_questions):
+            continue
+        if 0 <= answer_index < len(quiz_questions[question_id].answer_choices):
+            answers[question_id] = answer_index
+    return answers
+
+
+class Answerer:
+    """A long-lived answerer holding one model client per model in the fallback list.
+
+    The model clients and generation configs are created once, so every question after the first
+    reuses the same clients and their pooled connections. Models are tried in the order chosen by a
+    `ModelRouter`, fastest healthy model first. With `hedge_after` set, a second model is asked when the
+    first has not answered within that many seconds, and the first valid answer wins.
+
+    Attributes:
+        models (dict[str, genai.GenerativeModel]): The model clients, in their configured order.
+        cache (AnswerCache|None): The answer cache used when no cache is passed to a call.
+        router (ModelRouter): The router tracking the latency and errors of every model.
+        hedge_after (float|None): The number of seconds after which a hedged request is sent, or None to never hedge.
+        similarity_index (SimilarityIndex|None): The index answering reworded versions of past questions, if any.
+        quota (QuotaScheduler|None): The scheduler pacing the requests within the API quota, if any.
+    """
+
+    def __init__(
+        self,
+        model_names: list[str] | None = None,
+        cache: AnswerCache | None = None,
+        max_batch_size: int = 50,
+        router: ModelRouter | None = None,
+        hedge_after: float | None = None,
+        model_factory: typing.Callable[[str], typing.Any] | None = None,
+        similarity_index: SimilarityIndex | None = None,
+        quota: QuotaScheduler | None = None,
+    ):
+        """Creates the model clients and generation configs.
+
+        Args:
+            model_names (list[str]|None): The names of the models to try in order. Defaults to `MODELS`.
+            cache (AnswerCache|None): An optional answer cache used when no cache is passed to a call.
+            max_batch_size (int): The maximum number of questions per batched request.
+            router (ModelRouter|None): The router ordering the models. Defaults to a new router over the models.
+            hedge_after (float|None): The number of seconds after which a hedged request is sent, or None to never hedge.
+            model_factory (Callable[[str], Any]|None): Creates the client of a model from its name. Defaults to
+                `genai.GenerativeModel`; any object with the same `generate_content` and `count_tokens` methods works.
+            similarity_index (SimilarityIndex|None): An optional index of past questions, consulted after the cache and
+                before the models, and updated with every answer.
+            quota (QuotaScheduler|None): An optional scheduler every model request waits for, which backs the
+                models off when they answer with a 429. Single questions are live requests, batches background ones.
+        """
+        genai = _import_genai()
+        model_factory = model_factory or genai.GenerativeModel
+        self.models = {model_name: model_factory(model_name) for model_name in model_names or MODELS}
+        self.cache = cache
+        self.max_batch_size = max_batch_size
+        self.router = router or ModelRouter(list(self.models))
+        self.hedge_after = hedge_after
+        self.similarity_index = similarity_index
+        self.quota = quota
+        self._hedge_executor = None
+        if hedge_after is not None:
+            self._hedge_executor = ThreadPoolExecutor(max_workers=2 * len(self.models), thread_name_prefix="slido-quiz-bot-hedge")
+        self.generation_config = genai.types.GenerationConfig(
+            response_mime_type="text/x.enum",
+            response_schema=AnswerIndex,
+            max_output_tokens=2,
+            temperature=1.0,
+        )
+        self.batch_generation_config = genai.types.GenerationConfig(
+            response_mime_type="application/json",
+            response_schema=list[BatchAnswer],
+            max_output_tokens=OUTPUT_TOKENS_PER_ANSWER * max_batch_size,
+            temperature=1.0,
+        )
+
+    def warm_up(self) -> None:
+        """Sends a cheap request to every model so that the first real question does not pay the connection setup.
+
+        Token counting does not consume generation quota, but it goes through the same client and
+        connection as the answers. Failures are logged and otherwise ignored.
+        """
+        for model_name, model in self.models.items():
+            try:
+                model.count_tokens("warm-up")
+            except Exception as e:
+                console.log(f"[bold red] Warm-up of model {model_name} failed: {e}")
+
+    def answer(self, quiz_question: QuizQuestion, cache: AnswerCache | None = None, priority: Priority = Priority.LIVE) -> int:
+        """Uses a generative AI model to answer a multiple-choice quiz question.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question object containing the question text and answer choices.
+            cache (AnswerCache|None): An optional answer cache that is consulted before, and filled after, the model call.
+                Defaults to the answerer's cache.
+            priority (Priority): The priority of the model requests in the quota scheduler.
+
+        Returns:
+            int: The index of the chosen answer.
+        """
+        cache = cache if cache is not None else self.cache
+        if cache is not None:
+            cached_answer_index = cache.get(quiz_question)
+            if cached_answer_index is not None:
+                get_metrics().increment("cache_hits")
+                return cached_answer_index
+
+        if self.similarity_index is not None:
+            with get_metrics().span("similarity_lookup"):
+                similar_answer_index = self.similarity_index.lookup(quiz_question)
+            if similar_answer_index is not None:
+                get_metrics().increment("similarity_hits")
+                # Not cached: an approximate match must not become an exact answer of the question
+                return similar_answer_index
+
+        # Format the prompt
+        prompt = format_prompt(quiz_question)
+
+        # Generate the answer
+        model_names = self._ranked_models()
+        with get_metrics().span("answer_quiz_question"):
+            if self._hedge_executor is not None and len(model_names) > 1:
+                answer_index = self._generate_hedged(model_names, prompt, priority)
+            else:
+                answer_index = self._generate_in_order(model_names, prompt, priority)
+
+        if cache is not None:
+            cache.put(quiz_question, answer_index)
+        if self.similarity_index is not None:
+            self.similarity_index.add(quiz_question, answer_index)
+        return answer_index
+
+    def _ranked_models(self) -> list[str]:
+        """Returns the models in the order the router prefers them, those within their quota first."""
+        model_names = self.router.ranked_models()
+        return self.quota.rank(model_names) if self.quota is not None else model_names
+
+    @contextlib.contextmanager
+    def _quota_slot(self, model_name: str, priority: Priority):
+        """Waits for the quota scheduler's turn before a model request, and backs the model off if the request is rate limited."""
+        if self.quota is None:
+            yield
+            return
+        with get_metrics().span("quota_wait", model=model_name):
+            self.quota.acquire(model_name, priority)
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limit_error(e):
+                backoff = self.quota.record_rate_limited(model_name)
+                console.log(f"[bold yellow] Model {model_name} is rate limited, backing off for {backoff:.1f}s.")
+                get_metrics().increment("rate_limited", model=model_name)
+            raise
+        self.quota.record_success(model_name)
+
+    def _generate(self, model_name: str, prompt: str, priority: Priority = Priority.LIVE) -> int:
+        """Asks one model for the answer index, recording its latency or failure with the router."""
+        with self._quota_slot(model_name, priority):
+            start = time.perf_counter()
+            response_text = None
+            try:
+                with get_metrics().span("model_request", model=model_name):
+                    answer = self.models[model_name].generate_content(prompt, generation_config=self.generation_config)
+                    response_text = answer.text
+                    answer_index = int(response_text.strip())
+            except ValueError as e:
+                flight_recorder.record("model", model=model_name, prompt=prompt, response=response_text, error=repr(e))
+                self.router.record_failure(model_name)
+                raise ValueError(f"Failed to convert model response to integer for model {model_name}: {e}") from e
+            except Exception as e:
+                flight_recorder.record("model", model=model_name, prompt=prompt, response=response_text, error=repr(e))
+                self.router.record_failure(model_name)
+                raise
+            flight_recorder.record("model", model=model_name, prompt=prompt, response=response_text)
+            self.router.record_success(model_name, time.perf_counter() - start)
+            return answer_index
+
+    def _generate_in_order(self, model_names: list[str], prompt: str, priority: Priority = Priority.LIVE) -> int:
+        """Tries the models one after the other until one of them answers."""
+        for model_name in model_names:
+            try:
+                return self._generate(model_name, prompt, priority)
+            except ValueError:
+                raise
+            except Exception as e:
+                console.log(f"[bold red] Error with model {model_name}: {e}. Trying next model...")
+                get_metrics().increment("model_fallbacks", model=model_name)
+
+        raise RuntimeError("All models failed to generate a valid answer.")
+
+    def _generate_hedged(self, model_names: list[str], prompt: str, priority: Priority = Priority.LIVE) -> int:
+        """Asks the models in order, starting the next one when the requests in flight are slow or have failed.
+
+        The first valid answer is returned; requests still in flight are left to finish in the background
+        so their latency is still recorded.
+        """
+        remaining = list(model_names)
+        in_flight = {}
+
+        def launch_next():
+            model_name = remaining.pop(0)
+            in_flight[self._hedge_executor.submit(contextvars.copy_context().run, self._generate, model_name, prompt, priority)] = model_name
+
+        launch_next()
+        while in_flight:
+            done, _ = wait(in_flight, timeout=self.hedge_after if remaining else None, return_when=FIRST_COMPLETED)
+            if not done:
+                console.log(f"[bold yellow] No answer after {self.hedge_after}s, hedging with model {remaining[0]}...")
+                get_metrics().increment("hedged_requests", model=remaining[0])
+                launch_next()
+                continue
+            for future in done:
+                model_name = in_flight.pop(future)
+                try:
+                    return future.result()
+                except ValueError:
+                    raise
+                except Exception as e:
+                    console.log(f"[bold red] Error with model {model_name}: {e}. Trying next model...")
+                    get_metrics().increment("model_fallbacks", model=model_name)
+            if not in_flight and remaining:
+                launch_next()
+
+        raise RuntimeError("All models failed to generate a valid answer.")
+
+    def _answer_batch(self, quiz_questions: list[QuizQuestion]) -> dict[int, int]:
+        """Answers one batch of quiz questions with a single background request, trying each model in turn."""
+        prompt = format_batch_prompt(quiz_questions)
+        for model_name in self._ranked_models():
+            try:
+                with self._quota_slot(model_name, Priority.BACKGROUND), get_metrics().span("model_batch_request", model=model_name):
+                    answer = self.models[model_name].generate_content(prompt, generation_config=self.batch_generation_config)
+                    flight_recorder.record("model", model=model_name, prompt=prompt, response=answer.text)
+                    return parse_batch_answers(answer.text, quiz_questions)
+            except Exception as e:
+                flight_recorder.record("model", model=model_name, prompt=prompt, error=repr(e))
+                console.log(f"[bold red] Error with model {model_name} on a batch of {len(quiz_questions)} questions: {e}. Trying next model...")
+        return {}
+
+    def answer_many(self, quiz_questions: list[QuizQuestion], cache: AnswerCache | None = None, max_prompt_tokens: int = 8_000) -> list[int]:
+        """Answers many multiple-choice quiz questions with as few model requests as possible.
+
+        Questions already in the cache or the similarity index are answered from them; the others are packed into batches that
+        fit within the token budget and answered with one structured (JSON) request per batch. Any
+        question whose answer is missing or invalid in the batch response falls back to `answer`. All these
+        requests have the background priority in the quota scheduler, behind live questions.
+
+        Args:
+            quiz_questions (list[QuizQuestion]): The quiz questions to answer.
+            cache (AnswerCache|None): An optional answer cache that is consulted before, and filled after, the model calls.
+                Defaults to the answerer's cache.
+            max_prompt_tokens (int): The estimated number of prompt tokens allowed per batched request.
+
+        Returns:
+            list[int]: The index of the chosen answer of every question, in the order of `quiz_questions`.
+
+        Raises:
+            RuntimeError: If a question can be answered neither in a batch nor on its own.
+        """
+        cache = cache if cache is not None else self.cache
+        answers: list[int | None] = [None] * len(quiz_questions)
+        pending = []
+        for position, quiz_question in enumerate(quiz_questions):
+            cached_answer_index = cache.get(quiz_question) if cache is not None else None
+            if cached_answer_index is None and self.similarity_index is not None:
+                cached_answer_index = self.similarity_index.lookup(quiz_question)
+            if cached_answer_index is None:
+                pending.append(position)
+            else:
+                answers[position] = cached_answer_index
+
+        position_batches = []
+        for batch in split_into_batches([quiz_questions[position] for position in pending], max_prompt_tokens, self.max_batch_size):
+            position_batches.append(pending[: len(batch)])
+            pending = pending[len(batch) :]
+
+        for positions in position_batches:
+            batch_answers = self._answer_batch([quiz_questions[position] for position in positions])
+            for question_id, position in enumerate(positions):
+                if question_id in batch_answers:
+                    answers[position] = batch_answers[question_id]
+                    if cache is not None:
+                        cache.put(quiz_questions[position], answers[position])
+                    if self.similarity_index is not None:
+                        self.similarity_index.add(quiz_questions[position], answers[position])
+                else:
+                    answers[position] = self.answer(quiz_questions[position], cache=cache, priority=Priority.BACKGROUND)
+
+        return answers
+
+
+def _import_genai():
+    """Imports `google.generativeai`, on first use only."""
+    import google.generativeai as genai
+
+    return genai
+
+
+def __getattr__(name: str):
+    """Imports `google.generativeai` when the module's `genai` attribute is first accessed."""
+    if name == "genai":
+        return _import_genai()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_default_answerer: Answerer | None = None
+_default_answerer_lock = threading.Lock()
+
+
+def get_default_answerer() -> Answerer:
+    """Returns the shared answerer used by the module-level functions, creating it on first use.
+
+    Returns:
+        Answerer: The default answerer.
+    """
+    global _default_answerer
+    with _default_answerer_lock:
+        if _default_answerer is None:
+            _default_answerer = Answerer()
+        return _default_answerer
+
+
+def set_default_answerer(answerer: Answerer | None) -> None:
+    """Replaces the shared answerer used by the module-level functions.
+
+    Args:
+        answerer (Answerer|None): The new default answerer, or None to create a fresh one on next use.
+    """
+    global _default_answerer
+    with _default_answerer_lock:
+        _default_answerer = answerer
+
+
+def warm_up_default_answerer() -> None:
+    """Creates the default answerer, importing the model library if needed, and warms up its model clients.
+
+    Meant to run in the background while the browser starts, since both take a while.
+    """
+    get_default_answerer().warm_up()
+
+
+def answer_quiz_question(quiz_question: QuizQuestion, cache: AnswerCache | None = None) -> int:
     """Uses a generative AI model to answer a multiple-choice quiz question.
 
     Args:
         quiz_question (QuizQuestion): The quiz question object containing the question text and answer choices.
+        cache (AnswerCache|None): An optional answer cache that is consulted before, and filled after, the model call.
 
     Returns:
         int: The index of the chosen answer.
     """
-    # List of models to try in order
-    models = ["gemini-1.5-flash", "gemini-1.5-pro-latest"]
+    return get_default_answerer().answer(quiz_question, cache=cache)
 
-    # Format the prompt
-    prompt = format_prompt(quiz_question)
 
-    # Generate the answer
-    for model_name in models:
-        try:
-            model = genai.GenerativeModel(model_name)
-            answer = model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    response_mime_type="text/x.enum",
-                    response_schema=AnswerIndex,
-                    max_output_tokens=2,
-                    temperature=1.0,
-                ),
-            )
-            return int(answer.text.strip())
-        except ValueError as e:
-            raise ValueError(f"Failed to convert model response to integer for model {model_name}: {e}") from e
-        except Exception as e:
-            console.log(f"[bold red] Error with model {model_name}: {e}. Trying next model...")
+def answer_quiz_questions(quiz_questions: list[QuizQuestion], cache: AnswerCache | None = None, max_prompt_tokens: int = 8_000) -> list[int]:
+    """Answers many multiple-choice quiz questions with as few model requests as possible (see `Answerer.answer_many`).
+
+    Args:
+        quiz_questions (list[QuizQuestion]): The quiz questions to answer.
+        cache (AnswerCache|None): An optional answer cache that is consulted before, and filled after, the model calls.
+        max_prompt_tokens (int): The estimated number of prompt tokens allowed per batched request.
 
-    raise RuntimeError("All models failed to generate a valid answer.")
+    Returns:
+        list[int]: The index of the chosen answer of every question, in the order of `quiz_questions`.
+    """
+    return get_default_answerer().answer_many(quiz_questions, cache=cache, max_prompt_tokens=max_prompt_tokens)
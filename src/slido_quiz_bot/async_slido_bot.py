@@ -0,0 +1,592 @@
+"""This module drives many Slido quiz participants concurrently from a single process.
+
+It mirrors the flow of `slido_bot` on top of Playwright's asyncio API: one Chromium browser is
+launched and every participant gets its own lightweight `BrowserContext`. Each participant runs
+its wait/answer/check loop as a coroutine, so the cost of adding a participant is a context rather
+than a whole browser process.
+"""
+
+import asyncio
+import functools
+import os
+import time
+from dataclasses import dataclass
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+from rich.console import Console
+
+from slido_quiz_bot import flight_recorder
+from slido_quiz_bot.answer_cache import AnswerCache
+from slido_quiz_bot.answer_quiz_question import answer_quiz_question, warm_up_default_answerer
+from slido_quiz_bot.memory import BYTES_PER_MB, MemorySampler, js_heap_usage, launch_args
+from slido_quiz_bot.metrics import get_metrics, labels
+from slido_quiz_bot.network_filter import NetworkFilter, load_network_profile
+from slido_quiz_bot.question_watcher import (
+    NEXT_QUESTION_EXPRESSION,
+    OPTIONS_CHANGED_EXPRESSION,
+    QUESTION_WATCHER_SCRIPT,
+    SNAPSHOT_EXPRESSION,
+    QuestionSnapshot,
+    option_selector,
+    question_number,
+)
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.single_flight import AnswerCoordinator
+from slido_quiz_bot.slido_bot import (
+    JOIN_BUTTON_SELECTOR,
+    LAST_ANSWER_GRACE_PERIOD,
+    MAX_SPECULATIVE_RESTARTS,
+    OPTIONS_CHECK_INTERVAL,
+    PARTICIPANT_NAME_SELECTOR,
+    REJOIN_CHECK_SELECTOR,
+    REJOIN_CHECK_TIMEOUT,
+    SEND_BUTTON_SELECTOR,
+    is_last_question_counter,
+    is_navigation_error,
+    storage_state_path,
+)
+
+console = Console()
+
+
+async def enter_participant_name(page, participant_name):
+    """Enters the participant's name into the Slido quiz form and submits it.
+
+    Args:
+        page: The Playwright async page object representing the browser page.
+        participant_name (str): The name of the participant to enter into the form.
+
+    Raises:
+        TimeoutError: If the participant name input field or submit button is not found within the timeout.
+        ValueError: If the participant name is empty.
+    """
+    if not participant_name:
+        raise ValueError("Participant name cannot be empty.")
+
+    try:
+        name_input_locator = page.locator(PARTICIPANT_NAME_SELECTOR)
+        await name_input_locator.wait_for(state="visible")
+        await name_input_locator.fill(participant_name)
+        await page.locator(JOIN_BUTTON_SELECTOR).click()
+        console.log(f"[bold blue]Successfully entered participant name: [bold green]{participant_name}[/bold green].")
+    except PlaywrightTimeoutError as exc:
+        raise TimeoutError("The participant name input field or the submit button could not be found.") from exc
+
+
+async def needs_participant_name(page, timeout=REJOIN_CHECK_TIMEOUT):
+    """Checks whether the page asks for the participant's name (see `slido_bot.needs_participant_name`).
+
+    Args:
+        page: The Playwright async page object representing the browser page.
+        timeout (int): How long in milliseconds to wait for the name form or the joined event page.
+
+    Returns:
+        bool: True if the name form is shown, False if the participant has already joined.
+    """
+    try:
+        await page.locator(REJOIN_CHECK_SELECTOR).first.wait_for(state="visible", timeout=timeout)
+    except PlaywrightTimeoutError:
+        return False
+    return await page.locator(PARTICIPANT_NAME_SELECTOR).is_visible()
+
+
+async def install_question_watcher(page):
+    """Installs the in-page question watcher on the page (see `slido_bot.install_question_watcher`).
+
+    Args:
+        page: The Playwright async page object representing the browser page.
+    """
+    await page.add_init_script(QUESTION_WATCHER_SCRIPT)
+    await page.evaluate(QUESTION_WATCHER_SCRIPT)
+
+
+async def wait_for_question(page, timeout=120_000, previous_question=None):
+    """Waits until the in-page question watcher reports a new question ready to be answered.
+
+    If the page navigates or reloads meanwhile, the wait goes on for the rest of the timeout on the new document.
+
+    Args:
+        page: The Playwright async page object representing the browser page.
+        timeout (int): Maximum time in milliseconds to wait for a new question. Default is 120,000 ms.
+        previous_question (str|None): The key of the last answered question, which is not reported again.
+
+    Returns:
+        str: The key identifying the new question (question counter and poll title).
+
+    Raises:
+        TimeoutError: If no new question appears within the specified timeout.
+    """
+    deadline = time.monotonic() + timeout / 1000
+    while True:
+        remaining = max(0, round((deadline - time.monotonic()) * 1000))
+        try:
+            question = await page.evaluate(NEXT_QUESTION_EXPRESSION, [previous_question, remaining])
+            break
+        except Exception as e:
+            if not (is_navigation_error(e) and remaining > 0):
+                raise
+    if question is None:
+        raise TimeoutError(f"No new question with a 'Send' button appeared within {timeout} ms.")
+    return question
+
+
+async def read_question_snapshot(page):
+    """Reads the question, its answer choices and their identifiers, and the question counter in one round-trip.
+
+    Args:
+        page: The Playwright async page object representing the browser page, with the question watcher installed.
+
+    Returns:
+        QuestionSnapshot: The question on the page.
+
+    Raises:
+        ValueError: If the question text or the answer choices cannot be found.
+    """
+    snapshot = QuestionSnapshot.from_dict(await page.evaluate(SNAPSHOT_EXPRESSION))
+    flight_recorder.record_snapshot(snapshot)
+    return snapshot
+
+
+async def answer_question(page, participant_name, coordinator, participant_index=0):
+    """Extracts the quiz question, determines the correct answer, and submits it.
+
+    Identical questions seen by several participants are answered with a single model call
+    through the shared coordinator, which also applies the configured answer strategy. The
+    model call starts as soon as the question is readable and runs alongside locating the
+    'Send' button; it is cancelled and restarted if the answer choices change before it ends.
+    The answer choices are watched in short in-page waits of `OPTIONS_CHECK_INTERVAL` ms, so that
+    no waiter is left pending in the page once the answer is ready.
+
+    Args:
+        page: The Playwright async page object representing the browser page.
+        participant_name (str): The name of the participant answering, used for logging.
+        coordinator (AnswerCoordinator): The coordinator shared by all participants.
+        participant_index (int): The index of the participant, passed on to the answer strategy.
+
+    Returns:
+        QuestionSnapshot: The snapshot of the answered question, with its question counter.
+
+    Raises:
+        ValueError: If no answer choices are found or if the question/answer cannot be processed.
+    """
+    metrics = get_metrics()
+    with metrics.span("extract"):
+        snapshot = await read_question_snapshot(page)
+
+    with metrics.span("answer"):
+        quiz_question = QuizQuestion(question=snapshot.question, answer_choices=snapshot.options, correct_answer_index=None)
+        answer_task = asyncio.create_task(coordinator.answer_async(quiz_question, participant_index))
+        send_button = page.locator(SEND_BUTTON_SELECTOR)
+        try:
+            await send_button.wait_for(state="visible")
+            restarts = 0
+            while restarts < MAX_SPECULATIVE_RESTARTS:
+                options_task = asyncio.create_task(page.evaluate(OPTIONS_CHANGED_EXPRESSION, [quiz_question.answer_choices, OPTIONS_CHECK_INTERVAL]))
+                await asyncio.wait({answer_task, options_task}, return_when=asyncio.FIRST_COMPLETED)
+                if answer_task.done():
+                    # The in-page wait ends by itself within OPTIONS_CHECK_INTERVAL ms
+                    options_task.cancel()
+                    break
+                changed_snapshot = options_task.result()
+                if changed_snapshot is None:
+                    continue
+                restarts += 1
+                console.log(f"[bold magenta]{participant_name}[/bold magenta] [bold yellow]Answer choices changed, asking again...")
+                metrics.increment("speculative_restarts")
+                answer_task.cancel()
+                snapshot = QuestionSnapshot.from_dict(changed_snapshot)
+                flight_recorder.record_snapshot(snapshot)
+                quiz_question = QuizQuestion(question=snapshot.question, answer_choices=snapshot.options, correct_answer_index=None)
+                answer_task = asyncio.create_task(coordinator.answer_async(quiz_question, participant_index))
+            correct_answer_index = await answer_task
+        finally:
+            answer_task.cancel()
+
+    correct_answer = quiz_question.answer_choices[correct_answer_index]
+    console.log(f"[bold magenta]{participant_name}[/bold magenta] [bold yellow]Question:[/bold yellow] {snapshot.question}")
+    console.log(f"[bold magenta]{participant_name}[/bold magenta] [bold green]Answer:[/bold green] {correct_answer}")
+
+    with metrics.span("submit"):
+        await page.locator(option_selector(snapshot.option_ids[correct_answer_index])).click()
+        await send_button.click()
+    return snapshot
+
+
+async def is_last_question(page):
+    """Checks if the current question is the last question based on the question counter.
+
+    Args:
+        page: The Playwright async page object representing the browser page.
+
+    Returns:
+        bool: True if the current question is the last question, False otherwise.
+
+    Raises:
+        ValueError: If the question counter cannot be parsed or is invalid.
+    """
+    question_counter_text = (await page.locator("[data-testid='question-counter']").text_content()).strip()
+    return is_last_question_counter(question_counter_text)
+
+
+async def page_html(page):
+    """Returns the HTML of a page for a flight record, or None if it cannot be read (e.g. the page crashed)."""
+    try:
+        return await page.content()
+    except Exception:
+        return None
+
+
+async def install_network_filter(target, network_filter):
+    """Routes the requests of a page or browser context through a network filter.
+
+    Nothing is routed when the filter's profile blocks nothing, so that the "off" profile costs nothing.
+
+    Args:
+        target: The Playwright async page or browser context.
+        network_filter (NetworkFilter): The filter deciding which requests to block.
+    """
+    if network_filter.profile.is_enabled:
+        await target.route("**/*", network_filter.handle_route)
+    target.on("response", network_filter.record_response)
+
+
+@dataclass
+class PooledParticipant:
+    """A participant that has joined the quiz and is parked on the event page.
+
+    Attributes:
+        name (str): The name of the participant.
+        index (int): The index of the participant, passed on to the answer strategy.
+        context: The participant's Playwright async browser context.
+        page: The participant's page, showing the event.
+        rejoined (bool): Whether the participant rejoined from a saved storage state instead of filling in the name form.
+        recycles (int): The number of times the participant's context was replaced for exceeding its memory budget.
+    """
+
+    name: str
+    index: int
+    context: object
+    page: object
+    rejoined: bool = False
+    recycles: int = 0
+
+
+class ParticipantPool:
+    """Joins participants ahead of the quiz and keeps them parked on the event page.
+
+    Every participant gets its own browser context. When a `state_dir` is given, the storage state
+    (cookies and local storage) of every participant is saved there once it has joined and again when
+    the pool closes, and a participant with a saved state is restored from it, so that a restarted bot
+    rejoins without filling in the name form again.
+
+    With a `memory_budget_mb`, a participant whose page's JavaScript heap outgrows the budget is moved to
+    a fresh context between two questions, restoring the storage state of the old one so that it stays
+    the same participant.
+    """
+
+    def __init__(self, browser, quiz_url, state_dir=None, network_filter=None, join_concurrency=10, memory_budget_mb=None):
+        """Initializes the pool.
+
+        Args:
+            browser: The shared Playwright async browser.
+            quiz_url (str): The URL of the Slido quiz.
+            state_dir (str|None): The directory of the saved storage states, or None to always join with the name form.
+            network_filter (NetworkFilter|None): The filter applied to the participants' requests, or None to load everything.
+            join_concurrency (int): The maximum number of participants loading the quiz page at the same time.
+            memory_budget_mb (float|None): The JavaScript heap, in MB, past which a participant's context is recycled,
+                or None to never recycle contexts.
+        """
+        self.browser = browser
+        self.quiz_url = quiz_url
+        self.state_dir = state_dir
+        self.network_filter = network_filter
+        self.memory_budget_mb = memory_budget_mb
+        self.participants: list[PooledParticipant] = []
+        self._join_semaphore = asyncio.Semaphore(join_concurrency)
+
+    async def __aenter__(self):
+        """Returns the pool."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        """Saves the storage states and closes the contexts of the participants."""
+        await self.close()
+
+    async def join(self, participant_name, participant_index=0):
+        """Joins the quiz with one participant, restoring its saved storage state if there is one.
+
+        Args:
+            participant_name (str): The name of the participant.
+            participant_index (int): The index of the participant, passed on to the answer strategy.
+
+        Returns:
+            PooledParticipant: The joined participant, also added to `participants`.
+        """
+        state_path = storage_state_path(self.state_dir, participant_name) if self.state_dir else None
+        has_saved_state = state_path is not None and state_path.is_file()
+        context, page, rejoined = await self._open(participant_name, state_path if has_saved_state else None)
+        participant = PooledParticipant(participant_name, participant_index, context, page, rejoined)
+        if state_path is not None:
+            try:
+                await page.locator(PARTICIPANT_NAME_SELECTOR).wait_for(state="hidden")
+                await self._save_state(participant)
+            except BaseException:
+                await context.close()
+                raise
+        self.participants.append(participant)
+        return participant
+
+    async def _open(self, participant_name, storage_state=None):
+        """Opens the event in a new context, filling in the name form unless the storage state rejoins the participant.
+
+        Only loading the event page counts towards the join concurrency; the participant does not hold a slot
+        while it checks whether it has rejoined or fills in the name form.
+
+        Args:
+            participant_name (str): The name of the participant.
+            storage_state (str|Path|dict|None): The storage state to restore, as a file or as returned by `storage_state()`.
+
+        Returns:
+            tuple: The new context, its page showing the event, and whether the storage state rejoined the participant.
+        """
+        context = await self.browser.new_context(storage_state=storage_state)
+        try:
+            if self.network_filter is not None:
+                await install_network_filter(context, self.network_filter)
+            page = await context.new_page()
+            await install_question_watcher(page)
+            async with self._join_semaphore:
+                await page.goto(self.quiz_url)
+            rejoined = storage_state is not None and not await needs_participant_name(page)
+            if not rejoined:
+                await enter_participant_name(page, participant_name)
+        except BaseException:
+            await context.close()
+            raise
+        return context, page, rejoined
+
+    async def recycle(self, participant):
+        """Replaces the context of a participant with a fresh one restoring its storage state, freeing the memory of the old page.
+
+        The new context is ready before the old one is closed, so the participant's session is never left without a page.
+
+        Args:
+            participant (PooledParticipant): The participant, which gets the new context and page.
+        """
+        storage_state = await participant.context.storage_state()
+        context, page, rejoined = await self._open(participant.name, storage_state)
+        if not rejoined:
+            console.log(f"[bold magenta]{participant.name}[/bold magenta] [bold red]Lost its session while recycling, joined again by name.")
+        old_context = participant.context
+        participant.context, participant.page = context, page
+        participant.recycles += 1
+        await old_context.close()
+        if self.state_dir:
+            await self._save_state(participant)
+
+    async def check_memory(self, participant):
+        """Recycles the context of a participant if its page's JavaScript heap exceeds the memory budget.
+
+        Args:
+            participant (PooledParticipant): The participant, between two questions.
+
+        Returns:
+            bool: True if the context was recycled.
+        """
+        if self.memory_budget_mb is None:
+            return False
+        heap = await js_heap_usage(participant.context, participant.page)
+        flight_recorder.record("memory", js_heap=heap)
+        if heap <= self.memory_budget_mb * BYTES_PER_MB:
+            return False
+        console.log(
+            f"[bold magenta]{participant.name}[/bold magenta] [bold yellow]JavaScript heap at {heap / BYTES_PER_MB:.0f} MB"
+            f" exceeds {self.memory_budget_mb:g} MB, recycling its context..."
+        )
+        get_metrics().increment("context_recycles")
+        with get_metrics().span("recycle"):
+            await self.recycle(participant)
+        return True
+
+    async def fill(self, participant_names):
+        """Joins the quiz with every participant concurrently.
+
+        Args:
+            participant_names (list[str]): The names of the participants, in the order of their indices.
+
+        Returns:
+            list[PooledParticipant|BaseException]: The joined participant, or the error that prevented it from joining, for every name.
+        """
+        return await asyncio.gather(
+            *(self.join(participant_name, participant_index) for participant_index, participant_name in enumerate(participant_names)),
+            return_exceptions=True,
+        )
+
+    async def _save_state(self, participant):
+        """Saves the storage state of a participant in the state directory."""
+        state_path = storage_state_path(self.state_dir, participant.name)
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        await participant.context.storage_state(path=state_path)
+
+    async def close(self):
+        """Saves the storage states of the participants, if enabled, and closes their contexts."""
+        participants, self.participants = self.participants, []
+        for participant in participants:
+            try:
+                if self.state_dir:
+                    await self._save_state(participant)
+            finally:
+                await participant.context.close()
+
+
+async def participate(participant, coordinator, pool=None):
+    """Answers every question of the quiz as a participant of the pool.
+
+    Args:
+        participant (PooledParticipant): The participant, already joined and parked on the event page.
+        coordinator (AnswerCoordinator): The coordinator shared by all participants.
+        pool (ParticipantPool|None): The pool of the participant, which recycles its context between questions when it
+            exceeds the pool's memory budget, or None to keep the same context throughout.
+
+    Raises:
+        ConnectionAbortedError: If an error occurs while interacting with the quiz.
+    """
+    metrics = get_metrics()
+    is_last_question_answered = False
+    question = None
+    with labels(participant=participant.name):
+        while not is_last_question_answered:
+            try:
+                with metrics.span("detect"):
+                    question = await wait_for_question(participant.page, timeout=120_000, previous_question=question)
+                with labels(question=question_number(question)), metrics.span("question"):
+                    snapshot = await answer_question(participant.page, participant.name, coordinator, participant.index)
+                    # The question may have changed while it was answered: do not detect the answered one again
+                    question = snapshot.key
+                    with metrics.span("check_last"):
+                        is_last_question_answered = is_last_question_counter(snapshot.counter)
+                if pool is not None and not is_last_question_answered:
+                    await pool.check_memory(participant)
+            except Exception as e:
+                if flight_recorder.get_recorder() is not None:
+                    path = flight_recorder.dump("failure", error=repr(e), page_html=await page_html(participant.page))
+                    console.log(f"[bold red]Flight record of {participant.name}:[/bold red] {path}")
+                raise ConnectionAbortedError(f"Error during quiz interaction for {participant.name}: {e}") from e
+        await participant.page.wait_for_timeout(LAST_ANSWER_GRACE_PERIOD)
+
+
+async def answer_with_browser(browser, quiz_url, participant_names, coordinator, network_filter=None, state_dir=None, memory_budget_mb=None):
+    """Joins the quiz with every participant in a browser, then answers every question with all of them.
+
+    Args:
+        browser: The Playwright async browser shared by the participants.
+        quiz_url (str): The URL of the Slido quiz.
+        participant_names (list[str]): The names of the participants to enter in the quiz.
+        coordinator (AnswerCoordinator): The coordinator shared by all participants.
+        network_filter (NetworkFilter|None): The filter applied to the participants' requests, or None to load everything.
+        state_dir (str|None): The directory of the saved storage states, or None to always join with the name form.
+        memory_budget_mb (float|None): The JavaScript heap, in MB, past which a participant's context is recycled between
+            questions, or None to never recycle contexts.
+
+    Returns:
+        list: For every participant, its `PooledParticipant` or the error that prevented it from joining, followed
+            by the result of every joined participant's answer loop (None, or the error that ended it).
+    """
+    async with ParticipantPool(browser, quiz_url, state_dir=state_dir, network_filter=network_filter, memory_budget_mb=memory_budget_mb) as pool:
+        start = time.perf_counter()
+        with console.status(f"[bold blue]Joining with {len(participant_names)} participants..."):
+            results = await pool.fill(participant_names)
+        rejoined = sum(1 for participant in pool.participants if participant.rejoined)
+        console.log(
+            f"[bold blue]{len(pool.participants)} participants ready[/bold blue] in {time.perf_counter() - start:.1f} s"
+            f" ({rejoined} rejoined from a saved state)."
+        )
+        with console.status(f"[bold blue]Answering with {len(pool.participants)} participants..."):
+            answering = (participate(participant, coordinator, pool) for participant in pool.participants)
+            results += await asyncio.gather(*answering, return_exceptions=True)
+    return results
+
+
+async def respond_to_slido_quiz_async(
+    quiz_url,
+    participant_names,
+    cache_path=None,
+    strategy="consensus",
+    warm_up=True,
+    headless=None,
+    network_profile="default",
+    state_dir=None,
+    browser=None,
+    launch_profile="default",
+    memory_budget_mb=None,
+):
+    """Answers a Slido quiz with several participants sharing one browser.
+
+    Args:
+        quiz_url (str): The URL of the Slido quiz.
+        participant_names (list[str]): The names of the participants to enter in the quiz.
+        cache_path (str|None): The path of a persistent answer cache, or None to always ask the model.
+        strategy (str): The name of the answer strategy deciding which choice each participant submits.
+        warm_up (bool): Whether to warm up the model clients in the background while the browser starts.
+        headless (bool|None): Whether to run the browser headless. Defaults to headless inside Docker only.
+        network_profile (str): The name of a built-in network profile, or the path of a JSON profile.
+        state_dir (str|None): A directory where the participants' storage states are saved, so that a restarted bot
+            rejoins without filling in the name form again. Disabled by default.
+        browser: An already launched Playwright async browser to use and leave open, or None to launch one for this quiz.
+        launch_profile (str): The name of the `memory.LAUNCH_PROFILES` entry whose Chromium switches the browser is launched with.
+        memory_budget_mb (float|None): The JavaScript heap, in MB, past which a participant's context is recycled between
+            questions, or None to never recycle contexts.
+
+    Returns:
+        MemoryReport|None: The peak memory of the browser launched for this quiz, or None if it was not measured
+            (with a given browser, or without `/proc`).
+
+    Raises:
+        ValueError: If no participant names are given, or the strategy, network profile or launch profile is unknown.
+        ConnectionAbortedError: If any of the participants failed to complete the quiz.
+    """
+    if not participant_names:
+        raise ValueError("At least one participant name is required.")
+    browser_args = launch_args(launch_profile)
+
+    cache = AnswerCache(cache_path) if cache_path else None
+    coordinator = AnswerCoordinator(functools.partial(answer_quiz_question, cache=cache), strategy=strategy)
+    network_filter = NetworkFilter(load_network_profile(network_profile))
+    warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up_default_answerer)) if warm_up else None
+    memory_sampler = None
+    try:
+        if browser is not None:
+            results = await answer_with_browser(browser, quiz_url, participant_names, coordinator, network_filter, state_dir, memory_budget_mb)
+        else:
+            async with async_playwright() as p:
+                is_docker_env = bool(os.getenv("HOSTNAME"))
+                browser = await p.chromium.launch(headless=is_docker_env if headless is None else headless, args=browser_args)
+                try:
+                    with MemorySampler() as memory_sampler:
+                        results = await answer_with_browser(
+                            browser, quiz_url, participant_names, coordinator, network_filter, state_dir, memory_budget_mb
+                        )
+                finally:
+                    await browser.close()
+    finally:
+        if warm_up_task is not None:
+            await warm_up_task
+
+    console.log(f"[bold blue]Network:[/bold blue] {network_filter.summary()}.")
+    console.log(f"[bold blue]Model calls:[/bold blue] {coordinator.model_calls}, shared with other participants: {coordinator.coalesced}.")
+    if cache is not None:
+        console.log(f"[bold blue]Answer cache:[/bold blue] {cache.hits} hits, {cache.misses} misses.")
+        cache.close()
+    recycles = sum(result.recycles for result in results if isinstance(result, PooledParticipant))
+    memory_report = memory_sampler.report(len(participant_names), recycles) if memory_sampler is not None else None
+    if memory_report is not None:
+        console.log(f"[bold blue]Memory:[/bold blue] {memory_report.summary()}.")
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    for failure in failures:
+        console.log(f"[bold red]Error:[/bold red] {failure}")
+    if failures:
+        raise ConnectionAbortedError(f"{len(failures)} of {len(participant_names)} participants failed to complete the quiz.")
+    console.log("[bold blue]Quiz Completed[/bold blue] - All participants have answered and submitted every question.")
+    return memory_report
@@ -0,0 +1,289 @@
+"""This module benchmarks the accuracy and latency of the answering path over a dataset of quiz questions.
+
+Datasets are JSONL files (one `{"question", "answer_choices", "correct_answer_index"}` object per line)
+or CSV files with `question`, `answer_choices` (separated by `|`) and `correct_answer_index` columns.
+Questions are answered through an `Answerer` with a configurable concurrency, either with the real
+models or with a deterministic local stub model that needs no network, so that runs are reproducible
+and can be compared over time.
+
+Usage:
+    slido-quiz-bot benchmark <dataset> [--stub] [--concurrency N] [--repeat N] [--output report.json]
+"""
+
+import argparse
+import csv
+import functools
+import hashlib
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from slido_quiz_bot.answer_cache import AnswerCache
+from slido_quiz_bot.answer_quiz_question import Answerer, format_prompt
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.similarity_index import SimilarityIndex
+
+console = Console()
+
+
+def load_dataset(path: str | Path) -> list[QuizQuestion]:
+    """Loads quiz questions with their correct answers from a JSONL or CSV file.
+
+    Args:
+        path (str|Path): The path of the dataset, ending in `.jsonl` or `.csv`.
+
+    Returns:
+        list[QuizQuestion]: The quiz questions of the dataset.
+
+    Raises:
+        ValueError: If the file format is not supported or a question has no valid correct answer.
+    """
+    path = Path(path)
+    if path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as file:
+            rows = [json.loads(line) for line in file if line.strip()]
+    elif path.suffix == ".csv":
+        with path.open(encoding="utf-8", newline="") as file:
+            rows = [{**row, "answer_choices": row["answer_choices"].split("|")} for row in csv.DictReader(file)]
+    else:
+        raise ValueError(f"Unsupported dataset format '{path.suffix}'. Expected '.jsonl' or '.csv'.")
+
+    quiz_questions = []
+    for line_number, row in enumerate(rows, start=1):
+        quiz_question = QuizQuestion(
+            question=row["question"],
+            answer_choices=list(row["answer_choices"]),
+            correct_answer_index=int(row["correct_answer_index"]),
+        )
+        if not 0 <= quiz_question.correct_answer_index < len(quiz_question.answer_choices):
+            raise ValueError(f"Question {line_number} of {path} has an out of range correct answer index.")
+        quiz_questions.append(quiz_question)
+    return quiz_questions
+
+
+class StubModel:
+    """A deterministic local stand-in for `genai.GenerativeModel`.
+
+    The stub knows the correct answer of every question of the dataset and answers correctly with
+    probability `accuracy`. Both the correctness of each answer and its simulated latency are derived
+    from a hash of the model name and the prompt, so the same dataset always gives the same results.
+    """
+
+    def __init__(self, model_name: str, answer_key: dict[str, QuizQuestion], accuracy: float = 0.9, latency: float = 0.0):
+        """Initializes the stub.
+
+        Args:
+            model_name (str): The name of the model being simulated.
+            answer_key (dict[str, QuizQuestion]): The questions of the dataset, keyed by their prompt.
+            accuracy (float): The probability of answering a question correctly.
+            latency (float): The mean simulated latency of a request in seconds (uniformly spread between 0.5x and 1.5x).
+        """
+        self.model_name = model_name
+        self.answer_key = answer_key
+        self.accuracy = accuracy
+        self.latency = latency
+
+    def _draws(self, prompt: str) -> tuple[float, float]:
+        """Returns two deterministic pseudo-random numbers in [0, 1) for a prompt."""
+        digest = hashlib.sha256(f"{self.model_name}\n{prompt}".encode()).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64, int.from_bytes(digest[8:16], "big") / 2**64
+
+    def generate_content(self, prompt: str, generation_config=None):
+        """Answers a single-question prompt like the real model would.
+
+        Args:
+            prompt (str): The prompt built by `format_prompt`.
+            generation_config: Ignored; accepted for compatibility with `genai.GenerativeModel`.
+
+        Returns:
+            StubResponse: A response whose `text` is the index of the chosen answer.
+
+        Raises:
+            LookupError: If the prompt does not belong to a question of the dataset.
+        """
+        quiz_question = self.answer_key.get(prompt)
+        if quiz_question is None:
+            raise LookupError("The stub model only answers questions of its dataset.")
+
+        correctness_draw, latency_draw = self._draws(prompt)
+        time.sleep(self.latency * (0.5 + latency_draw))
+
+        answer_index = quiz_question.correct_answer_index
+        if correctness_draw >= self.accuracy and len(quiz_question.answer_choices) > 1:
+            offset = 1 + int(latency_draw * (len(quiz_question.answer_choices) - 1))
+            answer_index = (answer_index + offset) % len(quiz_question.answer_choices)
+        return StubResponse(str(answer_index))
+
+    def count_tokens(self, contents):
+        """Simulates the warm-up request."""
+        return len(str(contents)) // 4
+
+
+@dataclass(frozen=True)
+class StubResponse:
+    """The response of a `StubModel`, exposing the same `text` attribute as a real response."""
+
+    text: str
+
+
+def stub_model_factory(quiz_questions: list[QuizQuestion], accuracy: float = 0.9, latency: float = 0.0):
+    """Builds a model factory creating `StubModel`s that know the answers of the given questions.
+
+    Args:
+        quiz_questions (list[QuizQuestion]): The questions of the dataset.
+        accuracy (float): The probability of answering a question correctly.
+        latency (float): The mean simulated latency of a request in seconds.
+
+    Returns:
+        Callable[[str], StubModel]: A picklable factory suitable for `Answerer(model_factory=...)`.
+    """
+    answer_key = {format_prompt(quiz_question): quiz_question for quiz_question in quiz_questions}
+    return functools.partial(StubModel, answer_key=answer_key, accuracy=accuracy, latency=latency)
+
+
+@dataclass(frozen=True)
+class BenchmarkReport:
+    """The results of a benchmark run.
+
+    Attributes:
+        questions (int): The number of questions asked.
+        correct (int): The number of correctly answered questions.
+        errors (int): The number of questions that could not be answered.
+        accuracy (float): The fraction of correctly answered questions.
+        p50 (float): The median latency per question in seconds.
+        p95 (float): The 95th percentile latency per question in seconds.
+        p99 (float): The 99th percentile latency per question in seconds.
+        throughput (float): The number of questions answered per second of wall-clock time.
+        cache_hit_rate (float): The fraction of questions answered from the cache.
+    """
+
+    questions: int
+    correct: int
+    errors: int
+    accuracy: float
+    p50: float
+    p95: float
+    p99: float
+    throughput: float
+    cache_hit_rate: float
+
+
+def latency_percentiles(latencies: list[float]) -> tuple[float, float, float]:
+    """Returns the p50, p95 and p99 of a list of latencies.
+
+    Args:
+        latencies (list[float]): The latencies, in any order.
+
+    Returns:
+        tuple[float, float, float]: The p50, p95 and p99 latencies, or zeros for an empty list.
+    """
+    if not latencies:
+        return 0.0, 0.0, 0.0
+    if len(latencies) == 1:
+        return latencies[0], latencies[0], latencies[0]
+    cut_points = statistics.quantiles(latencies, n=100, method="inclusive")
+    return cut_points[49], cut_points[94], cut_points[98]
+
+
+def run_benchmark(quiz_questions: list[QuizQuestion], answerer: Answerer, concurrency: int = 1, cache: AnswerCache | None = None) -> BenchmarkReport:
+    """Answers every question of a dataset and measures accuracy, latency and throughput.
+
+    Args:
+        quiz_questions (list[QuizQuestion]): The questions to answer, with their correct answer index.
+        answerer (Answerer): The answerer to benchmark.
+        concurrency (int): The number of questions answered in parallel.
+        cache (AnswerCache|None): An optional answer cache used for every question.
+
+    Returns:
+        BenchmarkReport: The results of the run.
+    """
+    latencies = []
+    outcomes = []
+    lock = threading.Lock()
+
+    def answer(quiz_question):
+        start = time.perf_counter()
+        try:
+            is_correct = answerer.answer(quiz_question, cache=cache) == quiz_question.correct_answer_index
+        except Exception as e:
+            console.log(f"[bold red]Error:[/bold red] {quiz_question.question}: {e}")
+            is_correct = None
+        latency = time.perf_counter() - start
+        with lock:
+            latencies.append(latency)
+            outcomes.append(is_correct)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(answer, quiz_questions))
+    elapsed = time.perf_counter() - start
+
+    correct = sum(1 for outcome in outcomes if outcome)
+    p50, p95, p99 = latency_percentiles(latencies)
+    return BenchmarkReport(
+        questions=len(quiz_questions),
+        correct=correct,
+        errors=sum(1 for outcome in outcomes if outcome is None),
+        accuracy=correct / len(quiz_questions) if quiz_questions else 0.0,
+        p50=p50,
+        p95=p95,
+        p99=p99,
+        throughput=len(quiz_questions) / elapsed if elapsed else 0.0,
+        cache_hit_rate=cache.hit_rate if cache is not None else 0.0,
+    )
+
+
+def print_report(report: BenchmarkReport) -> None:
+    """Prints a benchmark report as a table."""
+    table = Table(title="Benchmark report")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Questions", str(report.questions))
+    table.add_row("Accuracy", f"{report.accuracy:.1%} ({report.correct} correct, {report.errors} errors)")
+    table.add_row("Latency p50", f"{report.p50 * 1000:.1f} ms")
+    table.add_row("Latency p95", f"{report.p95 * 1000:.1f} ms")
+    table.add_row("Latency p99", f"{report.p99 * 1000:.1f} ms")
+    table.add_row("Throughput", f"{report.throughput:.1f} questions/s")
+    table.add_row("Cache hit rate", f"{report.cache_hit_rate:.1%}")
+    console.print(table)
+
+
+def benchmark_main(argv: list[str] | None = None) -> BenchmarkReport:
+    """Command line entry point of the `benchmark` subcommand.
+
+    Args:
+        argv (list[str]|None): The command line arguments after `benchmark`. Defaults to `sys.argv`.
+
+    Returns:
+        BenchmarkReport: The results of the run.
+    """
+    parser = argparse.ArgumentParser(prog="slido-quiz-bot benchmark", description="Benchmark the answering path over a quiz dataset.")
+    parser.add_argument("dataset", type=str, help="The JSONL or CSV dataset of quiz questions with their correct answers.")
+    parser.add_argument("--concurrency", type=int, default=1, help="The number of questions answered in parallel.")
+    parser.add_argument("--repeat", type=int, default=1, help="How many times the dataset is answered (exercises the cache).")
+    parser.add_argument("--cache_path", type=str, default=None, help="Use an answer cache (':memory:' for a throwaway one).")
+    parser.add_argument("--index_path", type=str, default=None, help="Use a similarity index answering reworded past questions.")
+    parser.add_argument("--stub", action="store_true", help="Use the deterministic local stub model instead of Gemini.")
+    parser.add_argument("--stub_accuracy", type=float, default=0.9, help="The probability that the stub model answers correctly.")
+    parser.add_argument("--stub_latency", type=float, default=0.05, help="The mean latency of the stub model in seconds.")
+    parser.add_argument("--output", type=str, default=None, help="Write the report as JSON to this path.")
+    args = parser.parse_args(argv)
+
+    quiz_questions = load_dataset(args.dataset)
+    model_factory = stub_model_factory(quiz_questions, accuracy=args.stub_accuracy, latency=args.stub_latency) if args.stub else None
+    similarity_index = SimilarityIndex(args.index_path) if args.index_path else None
+    answerer = Answerer(model_factory=model_factory, similarity_index=similarity_index)
+    cache = AnswerCache(args.cache_path) if args.cache_path else None
+
+    report = run_benchmark(quiz_questions * args.repeat, answerer, concurrency=args.concurrency, cache=cache)
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(asdict(report), indent=2) + "\n", encoding="utf-8")
+    return report
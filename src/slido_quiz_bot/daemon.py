@@ -0,0 +1,611 @@
+"""This module runs the bot as a long-lived daemon answering quizzes submitted over a local HTTP API.
+
+Every CLI invocation pays the interpreter startup, the imports of `google.generativeai` and
+`playwright` and the launch of Chromium before it can join a single quiz. The `BotDaemon` pays them
+once: it keeps a pool of warm worker processes, each with its own answerer (model clients already
+warmed up) and launched browser. Submitted jobs wait in the daemon until a worker has a free slot, and
+are then sent to the least busy worker over its own queue, so no worker runs more than `jobs_per_worker`
+jobs at once. A supervisor thread follows the workers' progress, restarts crashed workers and fails the
+jobs they were running (jobs a crashed worker had not started yet are queued again).
+
+The API speaks JSON:
+
+    POST /jobs          {"quiz_url": ..., "participant_names": [...], "strategy": ...}  -> 202 the job
+    GET  /jobs          every job, oldest first
+    GET  /jobs/<id>     one job, with its status (queued, running, succeeded or failed) and error
+    GET  /workers       the worker processes, their running jobs and restarts
+
+Usage:
+    slido-quiz-bot daemon [--workers N] [--jobs_per_worker N] [--port PORT]
+    curl -X POST http://127.0.0.1:8470/jobs -d '{"quiz_url": "<SLIDO_URL>", "participant_names": ["Ada"]}'
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from playwright.async_api import async_playwright
+from rich.console import Console
+
+from slido_quiz_bot.answer_quiz_question import Answerer, set_default_answerer, warm_up_default_answerer
+from slido_quiz_bot.async_slido_bot import respond_to_slido_quiz_async
+from slido_quiz_bot.flight_recorder import FlightRecorder
+from slido_quiz_bot.memory import LAUNCH_PROFILES, launch_args
+from slido_quiz_bot.metrics import Metrics, set_metrics
+from slido_quiz_bot.quota import QuotaScheduler
+from slido_quiz_bot.single_flight import ANSWER_STRATEGIES
+
+console = Console()
+
+# How often the supervisor checks that the workers are alive, in seconds
+SUPERVISOR_INTERVAL = 0.5
+
+
+@dataclass
+class Job:
+    """A quiz submitted to the daemon.
+
+    Attributes:
+        job_id (str): The identifier of the job.
+        quiz_url (str): The URL of the Slido quiz.
+        participant_names (list[str]): The names of the participants to enter in the quiz.
+        strategy (str): The name of the answer strategy shared by the participants.
+        status (str): `queued`, `running`, `succeeded` or `failed`.
+        worker (int|None): The worker the job was sent to, if any.
+        error (str|None): Why the job failed, if it did.
+        submitted_at (float): When the job was submitted, as a Unix timestamp.
+        started_at (float|None): When a worker started the job, as a Unix timestamp.
+        finished_at (float|None): When the job succeeded or failed, as a Unix timestamp.
+    """
+
+    job_id: str
+    quiz_url: str
+    participant_names: list[str]
+    strategy: str = "consensus"
+    status: str = "queued"
+    worker: int | None = None
+    error: str | None = None
+    submitted_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the job succeeded or failed."""
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> dict:
+        """Returns the job as a JSON-serializable dictionary."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class _WorkerSettings:
+    """The settings shared by every worker process (picklable, to be sent to spawned processes)."""
+
+    cache_path: str | None
+    headless: bool | None
+    network_profile: str
+    state_dir: str | None
+    launch_browser: bool
+    answerer_factory: object | None
+    flight_recorder_dir: str | None
+    launch_profile: str
+    memory_budget_mb: float | None
+    job_runner: object | None
+
+
+@dataclass
+class _Worker:
+    """The daemon's view of a worker process."""
+
+    worker_id: int
+    process: multiprocessing.Process
+    jobs: multiprocessing.Queue
+    assigned: set[str] = field(default_factory=set)
+    restarts: int = 0
+
+
+class BotDaemon:
+    """A pool of warm worker processes answering the quizzes submitted to a job queue.
+
+    Attributes:
+        workers (int): The number of worker processes.
+        jobs_per_worker (int): The maximum number of jobs a worker runs at once.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        jobs_per_worker: int = 1,
+        cache_path: str | None = None,
+        headless: bool | None = None,
+        network_profile: str = "default",
+        state_dir: str | None = None,
+        launch_browser: bool = True,
+        answerer_factory=None,
+        flight_recorder_dir: str | None = None,
+        launch_profile: str = "default",
+        memory_budget_mb: float | None = None,
+        job_runner=None,
+    ):
+        """Configures the daemon; the workers are started by `start`.
+
+        Args:
+            workers (int): The number of worker processes.
+            jobs_per_worker (int): The maximum number of jobs a worker runs at once.
+            cache_path (str|None): The path of a persistent answer cache shared by every job, or None to always ask the model.
+            headless (bool|None): Whether to run the browsers headless. Defaults to headless inside Docker only.
+            network_profile (str): The name of a built-in network profile, or the path of a JSON profile.
+            state_dir (str|None): The directory of the participants' saved storage states, or None to disable rejoining.
+            launch_browser (bool): Whether the workers launch their browser at startup, rather than on their first browser job.
+            answerer_factory (Callable[[], Answerer]|None): Creates the answerer of a worker. It must be picklable, since
+                the workers are spawned processes. Defaults to the default `Answerer`.
+            flight_recorder_dir (str|None): The directory of the flight records of failed participants and slow questions,
+                or None to keep no flight recorder in the workers.
+            launch_profile (str): The name of the `memory.LAUNCH_PROFILES` entry whose Chromium switches the browsers are launched with.
+            memory_budget_mb (float|None): The JavaScript heap, in MB, past which a participant's context is recycled between
+                questions, or None to never recycle contexts.
+            job_runner (Callable[[dict, _WarmBrowser, _WorkerSettings], Awaitable[None]]|None): Answers the quiz of a job in a
+                worker. It must be picklable too. Defaults to the participants of the async engine, in the worker's browser.
+
+        Raises:
+            ValueError: If the number of workers or of jobs per worker is not positive, or the launch profile is unknown.
+        """
+        if workers < 1 or jobs_per_worker < 1:
+            raise ValueError("The number of workers and of jobs per worker must be positive.")
+        # Reject an unknown launch profile here rather than in every spawned worker
+        launch_args(launch_profile)
+
+        self.workers = workers
+        self.jobs_per_worker = jobs_per_worker
+        self._settings = _WorkerSettings(
+            cache_path=cache_path,
+            headless=headless,
+            network_profile=network_profile,
+            state_dir=state_dir,
+            launch_browser=launch_browser,
+            answerer_factory=answerer_factory,
+            flight_recorder_dir=flight_recorder_dir,
+            launch_profile=launch_profile,
+            memory_budget_mb=memory_budget_mb,
+            job_runner=job_runner,
+        )
+        self._context = multiprocessing.get_context("spawn")
+        self._event_queue = None
+        self._jobs: dict[str, Job] = {}
+        self._pending: deque[str] = deque()
+        self._workers: dict[int, _Worker] = {}
+        self._changed = threading.Condition()
+        self._stopping = threading.Event()
+        self._supervisor = None
+        self._server = None
+
+    def start(self) -> "BotDaemon":
+        """Starts the worker processes and the supervisor thread.
+
+        Returns:
+            BotDaemon: The daemon itself.
+        """
+        self._event_queue = self._context.Queue()
+        for worker_id in range(self.workers):
+            jobs = self._context.Queue()
+            self._workers[worker_id] = _Worker(worker_id, self._spawn(worker_id, jobs), jobs)
+        self._supervisor = threading.Thread(target=self._supervise, name="slido-quiz-bot-supervisor", daemon=True)
+        self._supervisor.start()
+        return self
+
+    def _spawn(self, worker_id: int, jobs: multiprocessing.Queue) -> multiprocessing.Process:
+        """Starts a worker process reading its jobs from a queue."""
+        process = self._context.Process(
+            target=_worker_main,
+            args=(worker_id, jobs, self._event_queue, self._settings),
+            name=f"slido-quiz-bot-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        return process
+
+    def submit(self, quiz_url: str, participant_names: list[str], strategy: str = "consensus") -> Job:
+        """Queues a quiz for the next worker with a free slot.
+
+        Args:
+            quiz_url (str): The URL of the Slido quiz.
+            participant_names (list[str]): The names of the participants to enter in the quiz.
+            strategy (str): The name of the answer strategy shared by the participants.
+
+        Returns:
+            Job: A snapshot of the queued job.
+
+        Raises:
+            ValueError: If the URL is missing, the participant names are not a non-empty list of non-empty strings,
+                or the strategy is unknown.
+            RuntimeError: If the daemon is not running.
+        """
+        if not quiz_url or not isinstance(quiz_url, str):
+            raise ValueError("A quiz URL is required.")
+        if not isinstance(participant_names, list) or not participant_names:
+            raise ValueError("The participant names must be a non-empty list.")
+        if not all(isinstance(name, str) and name.strip() for name in participant_names):
+            raise ValueError("Every participant name must be a non-empty string.")
+        if strategy not in ANSWER_STRATEGIES:
+            raise ValueError(f"Unknown answer strategy {strategy!r}, expected one of {sorted(ANSWER_STRATEGIES)}.")
+        if self._event_queue is None or self._stopping.is_set():
+            raise RuntimeError("The daemon is not running.")
+
+        job = Job(uuid.uuid4().hex, quiz_url, list(participant_names), strategy)
+        with self._changed:
+            self._jobs[job.job_id] = job
+            self._pending.append(job.job_id)
+            self._dispatch()
+            return Job(**job.to_dict())
+
+    def job(self, job_id: str) -> Job | None:
+        """Returns a snapshot of a job, or None if there is no such job."""
+        with self._changed:
+            job = self._jobs.get(job_id)
+            return Job(**job.to_dict()) if job is not None else None
+
+    def jobs(self) -> list[Job]:
+        """Returns a snapshot of every job, oldest first."""
+        with self._changed:
+            return [Job(**job.to_dict()) for job in self._jobs.values()]
+
+    def worker_status(self) -> list[dict]:
+        """Returns the process id, liveness, running jobs and number of restarts of every worker."""
+        with self._changed:
+            return [
+                {
+                    "worker": worker.worker_id,
+                    "pid": worker.process.pid,
+                    "alive": worker.process.is_alive(),
+                    "running_jobs": sorted(job_id for job_id in worker.assigned if self._jobs[job_id].status == "running"),
+                    "restarts": worker.restarts,
+                }
+                for worker in self._workers.values()
+            ]
+
+    def wait(self, job_id: str, timeout: float | None = None) -> Job:
+        """Waits until a job succeeds or fails.
+
+        Args:
+            job_id (str): The identifier of the job.
+            timeout (float|None): The maximum number of seconds to wait, or None to wait forever.
+
+        Returns:
+            Job: A snapshot of the job, done unless the timeout expired.
+
+        Raises:
+            KeyError: If there is no such job.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._jobs[job_id].done, timeout=timeout)
+            return Job(**self._jobs[job_id].to_dict())
+
+    def _supervise(self) -> None:
+        """Applies the workers' events to the jobs, and restarts the workers that died."""
+        while not self._stopping.is_set():
+            try:
+                event = self._event_queue.get(timeout=SUPERVISOR_INTERVAL)
+            except queue.Empty:
+                event = None
+            except (EOFError, OSError):
+                return
+            with self._changed:
+                if event is not None:
+                    self._apply(event)
+                if not self._stopping.is_set():
+                    self._restart_dead_workers()
+                self._changed.notify_all()
+
+    def _apply(self, event: tuple) -> None:
+        """Applies a worker event to its job (the lock must be held)."""
+        kind, job_id, worker_id = event[:3]
+        job, worker = self._jobs.get(job_id), self._workers.get(worker_id)
+        if job is None or job.done:
+            return
+        if kind == "started":
+            job.status, job.started_at = "running", time.time()
+        elif kind == "finished":
+            error = event[3]
+            job.status, job.error, job.finished_at = ("failed" if error else "succeeded"), error, time.time()
+            if worker is not None:
+                worker.assigned.discard(job_id)
+            self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Sends the pending jobs to the least busy live workers with a free slot (the lock must be held)."""
+        while self._pending and not self._stopping.is_set():
+            available = [worker for worker in self._workers.values() if len(worker.assigned) < self.jobs_per_worker and worker.process.is_alive()]
+            if not available:
+                return
+            worker = min(available, key=lambda worker: (len(worker.assigned), worker.worker_id))
+            job = self._jobs[self._pending.popleft()]
+            job.worker = worker.worker_id
+            worker.assigned.add(job.job_id)
+            worker.jobs.put(job.to_dict())
+
+    def _restart_dead_workers(self) -> None:
+        """Fails the jobs of the workers that died and starts new processes in their place (the lock must be held)."""
+        for worker in self._workers.values():
+            if worker.process.is_alive():
+                continue
+            exit_code = worker.process.exitcode
+            console.log(f"[bold red]Worker {worker.worker_id} exited with code {exit_code}[/bold red], restarting it.")
+            for job_id in sorted(worker.assigned, key=lambda job_id: self._jobs[job_id].submitted_at, reverse=True):
+                job = self._jobs[job_id]
+                if job.status == "queued":
+                    job.worker = None
+                    self._pending.appendleft(job_id)
+                else:
+                    job.status, job.error, job.finished_at = "failed", f"Worker {worker.worker_id} crashed (exit code {exit_code}).", time.time()
+            worker.assigned.clear()
+            worker.process.close()
+            worker.jobs.close()
+            worker.jobs = self._context.Queue()
+            worker.process = self._spawn(worker.worker_id, worker.jobs)
+            worker.restarts += 1
+        self._dispatch()
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8470) -> str:
+        """Serves the job API from a background thread.
+
+        Args:
+            host (str): The host to bind.
+            port (int): The port to bind, or 0 for any free port.
+
+        Returns:
+            str: The base URL of the API.
+        """
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="slido-quiz-bot-daemon-api", daemon=True).start()
+        return f"http://{host}:{self._server.server_address[1]}"
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stops the API, lets the workers finish the jobs sent to them, and stops them; pending jobs fail.
+
+        Args:
+            timeout (float): The number of seconds to wait for every worker before terminating it.
+        """
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._event_queue is None:
+            return
+        self._stopping.set()
+        self._supervisor.join()
+        for worker in self._workers.values():
+            worker.jobs.put(None)
+        deadline = time.monotonic() + timeout
+        for worker in self._workers.values():
+            worker.process.join(max(deadline - time.monotonic(), 0))
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+        while True:
+            try:
+                event = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+            with self._changed:
+                self._apply(event)
+        with self._changed:
+            for job in self._jobs.values():
+                if not job.done:
+                    job.status, job.error, job.finished_at = "failed", "The daemon stopped before the job finished.", time.time()
+            self._changed.notify_all()
+        self._event_queue = None
+
+    def __enter__(self):
+        """Starts the daemon when entering a `with` block."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Stops the daemon when leaving a `with` block."""
+        self.stop()
+
+
+class _WarmBrowser:
+    """The browser of a worker process, launched once and relaunched if it disconnects."""
+
+    def __init__(self, headless: bool | None, launch_profile: str = "default"):
+        self._headless = headless
+        self._launch_args = launch_args(launch_profile)
+        self._playwright = None
+        self._browser = None
+        self._lock = asyncio.Lock()
+
+    async def get(self):
+        """Returns the launched browser, launching it first if needed."""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                is_docker_env = bool(os.getenv("HOSTNAME"))
+                self._browser = await self._playwright.chromium.launch(
+                    headless=is_docker_env if self._headless is None else self._headless, args=self._launch_args
+                )
+            return self._browser
+
+    async def close(self):
+        """Closes the browser and stops Playwright."""
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+
+def _worker_main(worker_id: int, job_queue, event_queue, settings: _WorkerSettings) -> None:
+    """The entry point of a worker process: warms up the answerer, then runs jobs until told to stop."""
+    answerer = settings.answerer_factory() if settings.answerer_factory is not None else Answerer()
+    set_default_answerer(answerer)
+    if settings.flight_recorder_dir is not None:
+        set_metrics(Metrics(enabled=False, recorder=FlightRecorder(settings.flight_recorder_dir)))
+    warm_up_default_answerer()
+    asyncio.run(_run_worker(worker_id, job_queue, event_queue, settings))
+
+
+async def _run_worker(worker_id: int, job_queue, event_queue, settings: _WorkerSettings) -> None:
+    """Runs every job sent to the worker concurrently (the daemon enforces the per-worker limit), until told to stop."""
+    browser = _WarmBrowser(settings.headless, settings.launch_profile)
+    if settings.launch_browser:
+        await browser.get()
+    running = set()
+    try:
+        while True:
+            job = await asyncio.to_thread(job_queue.get)
+            if job is None:
+                break
+            event_queue.put(("started", job["job_id"], worker_id))
+            task = asyncio.create_task((settings.job_runner or _run_job)(job, browser, settings))
+            running.add(task)
+            task.add_done_callback(running.discard)
+            task.add_done_callback(lambda task, job_id=job["job_id"]: _job_done(task, job_id, worker_id, event_queue))
+        await asyncio.gather(*running, return_exceptions=True)
+    finally:
+        await browser.close()
+
+
+def _job_done(task: asyncio.Task, job_id: str, worker_id: int, event_queue) -> None:
+    """Reports the outcome of a job to the daemon."""
+    error = None
+    if task.cancelled():
+        error = "The job was cancelled."
+    elif task.exception() is not None:
+        error = f"{type(task.exception()).__name__}: {task.exception()}"
+    event_queue.put(("finished", job_id, worker_id, error))
+
+
+async def _run_job(job: dict, browser: _WarmBrowser, settings: _WorkerSettings) -> None:
+    """Answers the quiz of a job with the worker's warm answerer and browser."""
+    await respond_to_slido_quiz_async(
+        job["quiz_url"],
+        job["participant_names"],
+        cache_path=settings.cache_path,
+        strategy=job["strategy"],
+        warm_up=False,
+        network_profile=settings.network_profile,
+        state_dir=settings.state_dir,
+        browser=await browser.get(),
+        memory_budget_mb=settings.memory_budget_mb,
+    )
+
+
+def _make_handler(daemon: BotDaemon):
+    """Creates the request handler class bound to a daemon."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serves the job API."""
+
+        def log_message(self, format, *args):
+            """Silences the default per-request logging."""
+
+        def _send_json(self, payload, status=HTTPStatus.OK):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            """Returns the jobs, one job or the workers."""
+            if self.path == "/jobs":
+                self._send_json([job.to_dict() for job in daemon.jobs()])
+            elif self.path.startswith("/jobs/"):
+                job = daemon.job(self.path.removeprefix("/jobs/"))
+                if job is None:
+                    self._send_json({"error": "unknown job"}, HTTPStatus.NOT_FOUND)
+                else:
+                    self._send_json(job.to_dict())
+            elif self.path == "/workers":
+                self._send_json(daemon.worker_status())
+            else:
+                self._send_json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+
+        def do_POST(self):
+            """Queues a job."""
+            if self.path != "/jobs":
+                self._send_json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+                return
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                job = daemon.submit(
+                    payload.get("quiz_url"),
+                    payload.get("participant_names"),
+                    strategy=payload.get("strategy", "consensus"),
+                )
+            except (json.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+                self._send_json({"error": str(e)}, HTTPStatus.BAD_REQUEST)
+            except RuntimeError as e:
+                self._send_json({"error": str(e)}, HTTPStatus.SERVICE_UNAVAILABLE)
+            else:
+                self._send_json(job.to_dict(), HTTPStatus.ACCEPTED)
+
+    return Handler
+
+
+def daemon_main(argv: list[str] | None = None) -> None:
+    """Command line entry point of the `daemon` subcommand; runs until interrupted.
+
+    Args:
+        argv (list[str]|None): The command line arguments after `daemon`. Defaults to `sys.argv`.
+    """
+    parser = argparse.ArgumentParser(prog="slido-quiz-bot daemon", description="Answer the quizzes submitted to a local job API.")
+    parser.add_argument("--workers", type=int, default=2, help="The number of warm worker processes.")
+    parser.add_argument("--jobs_per_worker", type=int, default=1, help="The maximum number of jobs a worker runs at once.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="The host of the job API.")
+    parser.add_argument("--port", type=int, default=8470, help="The port of the job API.")
+    parser.add_argument("--cache_path", type=str, default=None, help="Path of a persistent answer cache shared by every job.")
+    parser.add_argument("--network_profile", type=str, default="default", help="The network profile of the participants (e.g. off, default, strict).")
+    parser.add_argument("--state_dir", type=str, default=None, help="Directory of saved participant storage states.")
+    parser.add_argument("--headed", dest="headless", action="store_false", default=None, help="Show the browser windows.")
+    parser.add_argument("--no_browser", dest="launch_browser", action="store_false", help="Launch the browsers on the first browser job only.")
+    parser.add_argument("--requests_per_minute", type=float, default=None, help="Pace the workers' requests to every model within this quota.")
+    parser.add_argument("--quota_dir", type=str, default=None, help="Directory sharing the request quota, also with other bot processes.")
+    parser.add_argument("--launch_profile", choices=sorted(LAUNCH_PROFILES), default="default", help="Chromium switches trading speed for memory.")
+    parser.add_argument("--memory_budget_mb", type=float, default=None, help="Recycle a participant's context when its JavaScript heap exceeds this.")
+    parser.add_argument("--flight_recorder_dir", type=str, default="flight_records", help="Directory of the workers' flight records.")
+    parser.add_argument("--no_flight_recorder", dest="flight_recorder", action="store_false", help="Keep no flight recorder of the participants.")
+    args = parser.parse_args(argv)
+
+    answerer_factory = None
+    if args.requests_per_minute is not None:
+        quota_dir = args.quota_dir or tempfile.mkdtemp(prefix="slido-quiz-bot-quota-")
+        answerer_factory = functools.partial(Answerer, quota=QuotaScheduler(args.requests_per_minute, state_dir=quota_dir))
+
+    daemon = BotDaemon(
+        workers=args.workers,
+        jobs_per_worker=args.jobs_per_worker,
+        cache_path=args.cache_path,
+        headless=args.headless,
+        network_profile=args.network_profile,
+        state_dir=args.state_dir,
+        launch_browser=args.launch_browser,
+        answerer_factory=answerer_factory,
+        flight_recorder_dir=args.flight_recorder_dir if args.flight_recorder else None,
+        launch_profile=args.launch_profile,
+        memory_budget_mb=args.memory_budget_mb,
+    )
+    with daemon:
+        url = daemon.serve(args.host, args.port)
+        console.log(f"[bold blue]Daemon ready[/bold blue] with {args.workers} workers, accepting jobs at {url}/jobs.")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            console.log("[bold blue]Stopping the daemon...")
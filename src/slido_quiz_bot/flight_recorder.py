@@ -0,0 +1,175 @@
+"""This module keeps an always-on, low-overhead flight recorder of every participant's recent activity.
+
+A failed run (a question that never appeared, a click that timed out, a stream that broke) leaves
+nothing to debug with, and full Playwright tracing costs too much CPU and disk to be left on for every
+participant. The `FlightRecorder` instead keeps the last `capacity` events of each participant in a
+bounded in-memory ring buffer:
+
+- `stage` events: every span timed with `get_metrics().span(...)`, even when metrics are disabled;
+- `snapshot` events: the question snapshot read from the page (question, choices, counter);
+- `model` events: every model request with its response or error.
+
+Events only reference data the bot already holds, so recording one is a dictionary and a deque
+append. The buffers are written to a JSON file only when a participant fails (`dump`) or a question
+takes longer than `slow_question_threshold` from reading to submission. The recorder measures the
+time it spends recording and, past `overhead_budget` (a fraction of the run's wall time), drops events
+rather than slow the bot down.
+
+The recorder is attached to the metrics registry (`Metrics(recorder=...)`); `record` and `dump` are
+no-ops when there is none.
+"""
+
+import json
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+
+from slido_quiz_bot.metrics import current_labels, get_metrics
+
+# The stage timing a question from the moment it is read to the submission of its answer
+QUESTION_STAGE = "question"
+
+
+class FlightRecorder:
+    """Bounded per-participant ring buffers of recent events, written to disk on failures and slow questions.
+
+    Attributes:
+        dump_dir (Path): The directory where the flight records are written.
+        capacity (int): The number of events kept per participant.
+        slow_question_threshold (float|None): The number of seconds from reading to submission past which a
+            question is dumped, or None to only dump failures.
+        overhead_budget (float): The fraction of the wall time the recorder may spend recording before dropping events.
+        events (int): The number of events recorded.
+        dropped (int): The number of events dropped to stay within the overhead budget.
+        dumps (list[Path]): The flight records written so far.
+    """
+
+    def __init__(
+        self,
+        dump_dir: str | Path = "flight_records",
+        capacity: int = 256,
+        slow_question_threshold: float | None = 10.0,
+        overhead_budget: float = 0.01,
+    ):
+        """Initializes the recorder with empty buffers.
+
+        Args:
+            dump_dir (str|Path): The directory where the flight records are written, created on the first dump.
+            capacity (int): The number of events kept per participant.
+            slow_question_threshold (float|None): The number of seconds from reading to submission past which a
+                question is dumped, or None to only dump failures.
+            overhead_budget (float): The fraction of the wall time the recorder may spend recording before dropping events.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("The flight recorder capacity must be positive.")
+
+        self.dump_dir = Path(dump_dir)
+        self.capacity = capacity
+        self.slow_question_threshold = slow_question_threshold
+        self.overhead_budget = overhead_budget
+        self.events = 0
+        self.dropped = 0
+        self.dumps: list[Path] = []
+        self._buffers: dict[str, deque] = defaultdict(lambda: deque(maxlen=self.capacity))
+        self._overhead = 0.0
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, **data) -> None:
+        """Appends an event to the ring buffer of the current participant (from the `participant` label).
+
+        Args:
+            kind (str): The kind of event, e.g. `stage`, `snapshot` or `model`.
+            **data: The data of the event; it is only serialized if the buffer is dumped.
+        """
+        start = time.perf_counter()
+        event_labels = current_labels()
+        with self._lock:
+            if self._overhead > self.overhead_budget * (start - self._started):
+                self.dropped += 1
+                return
+            event = {"time": time.time(), "kind": kind, "question": event_labels.get("question"), **data}
+            self._buffers[event_labels.get("participant", "")].append(event)
+            self.events += 1
+            self._overhead += time.perf_counter() - start
+
+    def record_stage(self, stage: str, duration: float, error: str | None, stage_labels: dict) -> None:
+        """Records a timed stage, and dumps the participant's buffer if the question was slow.
+
+        Args:
+            stage (str): The name of the stage.
+            duration (float): The duration of the stage in seconds.
+            error (str|None): The name of the exception that ended the stage, if any.
+            stage_labels (dict): The labels of the stage's span.
+        """
+        self.record("stage", stage=stage, duration=duration, error=error, model=stage_labels.get("model"))
+        if stage == QUESTION_STAGE and self.slow_question_threshold is not None and duration > self.slow_question_threshold:
+            self.dump("slow_question", duration=duration)
+
+    def dump(self, reason: str, **details) -> Path:
+        """Writes the current participant's buffer (and the events recorded outside any participant) to a JSON file.
+
+        Args:
+            reason (str): Why the buffer is dumped, e.g. `failure` or `slow_question`.
+            **details: Extra data to write along, e.g. the error or the page's HTML.
+
+        Returns:
+            Path: The path of the flight record.
+        """
+        participant = current_labels().get("participant", "")
+        with self._lock:
+            events = [*self._buffers.get(participant, ()), *(self._buffers.get("", ()) if participant else ())]
+            overhead = self._overhead
+        events.sort(key=lambda event: event["time"])
+        record = {"reason": reason, "participant": participant, "time": time.time(), "overhead_seconds": overhead, **details, "events": events}
+        self.dump_dir.mkdir(parents=True, exist_ok=True)
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", participant).strip("_") or "bot"
+        path = self.dump_dir / f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}-{reason}-{len(self.dumps) + 1}.json"
+        path.write_text(json.dumps(record, default=str, indent=1), encoding="utf-8")
+        with self._lock:
+            self.dumps.append(path)
+        return path
+
+    @property
+    def overhead(self) -> float:
+        """float: The fraction of the wall time spent recording so far."""
+        return self._overhead / max(time.perf_counter() - self._started, 1e-9)
+
+    def summary(self) -> str:
+        """Returns a one-line summary of the recorded events, the dumps and the overhead."""
+        return (
+            f"{self.events} events recorded ({self.dropped} dropped), {len(self.dumps)} flight records written,"
+            f" overhead {self._overhead * 1000:.1f} ms ({self.overhead:.3%} of the run, budget {self.overhead_budget:.1%})"
+        )
+
+
+def get_recorder() -> FlightRecorder | None:
+    """Returns the flight recorder attached to the metrics registry, if any."""
+    return get_metrics().recorder
+
+
+def record(kind: str, **data) -> None:
+    """Records an event with the flight recorder, if there is one (see `FlightRecorder.record`)."""
+    recorder = get_metrics().recorder
+    if recorder is not None:
+        recorder.record(kind, **data)
+
+
+def record_snapshot(snapshot) -> None:
+    """Records a question snapshot read from the page (see `question_watcher.QuestionSnapshot`)."""
+    record("snapshot", question=snapshot.question, options=snapshot.options, counter=snapshot.counter)
+
+
+def dump(reason: str, **details) -> Path | None:
+    """Dumps the current participant's buffer, if there is a flight recorder (see `FlightRecorder.dump`).
+
+    Returns:
+        Path|None: The path of the flight record, or None without a flight recorder.
+    """
+    recorder = get_metrics().recorder
+    return recorder.dump(reason, **details) if recorder is not None else None
@@ -0,0 +1,205 @@
+"""This module load-tests the browser loop against the local Slido stand-in server, fully offline.
+
+A `SlidoStandInServer` plays a quiz dataset while `respond_to_slido_quiz_async` drives the requested
+number of participants through it, answering with the deterministic stub model. The server records
+when every poll was pushed and when every vote arrived, which gives the time-to-answer as seen by Slido.
+With the browser backend, the peak memory of the browser is also sampled, to tell how many participants
+fit per GB of memory with a given launch profile and memory budget.
+
+Usage:
+    slido-quiz-bot load-test <dataset> [--participants N] [--stub_latency SECONDS] [--launch_profile low_memory]
+"""
+
+import argparse
+import asyncio
+import time
+from dataclasses import dataclass
+
+from rich.console import Console
+from rich.table import Table
+
+from slido_quiz_bot.answer_quiz_question import Answerer, set_default_answerer
+from slido_quiz_bot.async_slido_bot import respond_to_slido_quiz_async
+from slido_quiz_bot.benchmark import latency_percentiles, load_dataset, stub_model_factory
+from slido_quiz_bot.memory import BYTES_PER_MB, LAUNCH_PROFILES, MemoryReport
+from slido_quiz_bot.protocol_client import respond_to_slido_quiz_protocol
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.stand_in_server import SlidoStandInServer
+
+console = Console()
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    """The results of a load test.
+
+    Attributes:
+        participants (int): The number of participants that were run.
+        questions (int): The number of questions in the quiz.
+        votes (int): The number of votes received by the server.
+        expected_votes (int): The number of votes if every participant answered every question.
+        accuracy (float): The fraction of votes for the correct option.
+        p50 (float): The median time-to-answer in seconds.
+        p95 (float): The 95th percentile time-to-answer in seconds.
+        p99 (float): The 99th percentile time-to-answer in seconds.
+        wall_time (float): The duration of the whole run in seconds, including browser start and joins.
+        memory (MemoryReport|None): The peak memory of the browser, or None if it was not measured (protocol backend, no `/proc`).
+    """
+
+    participants: int
+    questions: int
+    votes: int
+    expected_votes: int
+    accuracy: float
+    p50: float
+    p95: float
+    p99: float
+    wall_time: float
+    memory: MemoryReport | None = None
+
+
+def summarize_results(results: dict, participants: int, questions: int, wall_time: float, memory: MemoryReport | None = None) -> LoadTestReport:
+    """Builds a load test report from the results recorded by the stand-in server.
+
+    Args:
+        results (dict): The results returned by `SlidoStandInServer.results`.
+        participants (int): The number of participants that were run.
+        questions (int): The number of questions in the quiz.
+        wall_time (float): The duration of the whole run in seconds.
+        memory (MemoryReport|None): The peak memory of the browser, if it was measured.
+
+    Returns:
+        LoadTestReport: The report of the run.
+    """
+    votes = [(vote, poll["correct_option_id"]) for poll in results["polls"] for vote in poll["votes"]]
+    p50, p95, p99 = latency_percentiles([vote["time_to_answer"] for vote, _ in votes])
+    correct = sum(1 for vote, correct_option_id in votes if vote["option_id"] == correct_option_id)
+    return LoadTestReport(
+        participants=participants,
+        questions=questions,
+        votes=len(votes),
+        expected_votes=participants * questions,
+        accuracy=correct / len(votes) if votes else 0.0,
+        p50=p50,
+        p95=p95,
+        p99=p99,
+        wall_time=wall_time,
+        memory=memory,
+    )
+
+
+def run_load_test(
+    quiz_questions: list[QuizQuestion],
+    participants: int = 10,
+    stub_accuracy: float = 1.0,
+    stub_latency: float = 0.05,
+    question_duration: float = 30.0,
+    headless: bool = True,
+    network_profile: str = "default",
+    backend: str = "browser",
+    launch_profile: str = "default",
+    memory_budget_mb: float | None = None,
+) -> LoadTestReport:
+    """Runs participants through a scripted quiz on a local stand-in server and measures their time-to-answer.
+
+    Args:
+        quiz_questions (list[QuizQuestion]): The questions of the quiz, with their correct answer index.
+        participants (int): The number of participants to run concurrently.
+        stub_accuracy (float): The probability that the stub model answers correctly.
+        stub_latency (float): The mean latency of the stub model in seconds.
+        question_duration (float): The maximum number of seconds a question stays open.
+        headless (bool): Whether to run the browser headless.
+        network_profile (str): The name of a built-in network profile, or the path of a JSON profile.
+        backend (str): `browser` to drive Playwright pages, or `protocol` to use browserless protocol clients.
+        launch_profile (str): The name of the `memory.LAUNCH_PROFILES` entry whose Chromium switches the browser is launched with.
+        memory_budget_mb (float|None): The JavaScript heap, in MB, past which a participant's context is recycled between
+            questions, or None to never recycle contexts.
+
+    Returns:
+        LoadTestReport: The report of the run.
+    """
+    set_default_answerer(Answerer(model_factory=stub_model_factory(quiz_questions, accuracy=stub_accuracy, latency=stub_latency)))
+    participant_names = [f"Load Tester {i + 1}" for i in range(participants)]
+    start = time.perf_counter()
+    memory = None
+    try:
+        with SlidoStandInServer(quiz_questions, expected_participants=participants, question_duration=question_duration) as server:
+            if backend == "protocol":
+                asyncio.run(respond_to_slido_quiz_protocol(server.url, participant_names, warm_up=False))
+            else:
+                memory = asyncio.run(
+                    respond_to_slido_quiz_async(
+                        server.url,
+                        participant_names,
+                        warm_up=False,
+                        headless=headless,
+                        network_profile=network_profile,
+                        launch_profile=launch_profile,
+                        memory_budget_mb=memory_budget_mb,
+                    )
+                )
+            wall_time = time.perf_counter() - start
+            results = server.results()
+    finally:
+        set_default_answerer(None)
+    return summarize_results(results, participants, len(quiz_questions), wall_time, memory)
+
+
+def print_report(report: LoadTestReport) -> None:
+    """Prints a load test report as a table."""
+    table = Table(title="Load test report")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("Participants", str(report.participants))
+    table.add_row("Votes", f"{report.votes}/{report.expected_votes}")
+    table.add_row("Accuracy", f"{report.accuracy:.1%}")
+    table.add_row("Time-to-answer p50", f"{report.p50 * 1000:.1f} ms")
+    table.add_row("Time-to-answer p95", f"{report.p95 * 1000:.1f} ms")
+    table.add_row("Time-to-answer p99", f"{report.p99 * 1000:.1f} ms")
+    table.add_row("Wall time", f"{report.wall_time:.1f} s")
+    if report.memory is not None:
+        table.add_row("Peak browser memory", f"{report.memory.peak_bytes / BYTES_PER_MB:.0f} MB")
+        table.add_row("Memory per participant", f"{report.memory.per_participant_mb:.1f} MB")
+        table.add_row("Participants per GB", f"{report.memory.participants_per_gb:.1f}")
+        table.add_row("Contexts recycled", str(report.memory.recycles))
+    console.print(table)
+
+
+def load_test_main(argv: list[str] | None = None) -> LoadTestReport:
+    """Command line entry point of the `load-test` subcommand.
+
+    Args:
+        argv (list[str]|None): The command line arguments after `load-test`. Defaults to `sys.argv`.
+
+    Returns:
+        LoadTestReport: The report of the run.
+    """
+    parser = argparse.ArgumentParser(prog="slido-quiz-bot load-test", description="Load-test the browser loop against a local Slido stand-in.")
+    parser.add_argument("dataset", type=str, help="The JSONL or CSV dataset of quiz questions played by the stand-in server.")
+    parser.add_argument("--participants", type=int, default=10, help="The number of participants to run concurrently.")
+    parser.add_argument("--stub_accuracy", type=float, default=1.0, help="The probability that the stub model answers correctly.")
+    parser.add_argument("--stub_latency", type=float, default=0.05, help="The mean latency of the stub model in seconds.")
+    parser.add_argument("--question_duration", type=float, default=30.0, help="The maximum number of seconds a question stays open.")
+    parser.add_argument("--headed", dest="headless", action="store_false", help="Show the browser windows.")
+    parser.add_argument("--network_profile", type=str, default="default", help="The network profile of the participants (e.g. off, default, strict).")
+    parser.add_argument(
+        "--backend", choices=("browser", "protocol"), default="browser", help="Drive browser pages, or speak the participant protocol directly."
+    )
+    parser.add_argument("--launch_profile", choices=sorted(LAUNCH_PROFILES), default="default", help="Chromium switches trading speed for memory.")
+    parser.add_argument("--memory_budget_mb", type=float, default=None, help="Recycle a participant's context when its JavaScript heap exceeds this.")
+    args = parser.parse_args(argv)
+
+    report = run_load_test(
+        load_dataset(args.dataset),
+        participants=args.participants,
+        stub_accuracy=args.stub_accuracy,
+        stub_latency=args.stub_latency,
+        question_duration=args.question_duration,
+        headless=args.headless,
+        network_profile=args.network_profile,
+        backend=args.backend,
+        launch_profile=args.launch_profile,
+        memory_budget_mb=args.memory_budget_mb,
+    )
+    print_report(report)
+    return report
@@ -0,0 +1,271 @@
+"""This module budgets the memory of the participants' browser contexts and measures the browser's footprint.
+
+A participant keeps one page open for the whole event, and the Slido single-page application keeps
+growing in memory on every poll, so on long sessions the memory of the host, not its CPU, limits how
+many participants fit on it. Three tools keep it in check:
+
+- `LAUNCH_PROFILES`: Chromium switches trading a little speed for memory. `low_memory` turns off the
+  GPU, background services and caches that a headless participant never needs; `minimal` also runs every
+  page of the Slido site in a single renderer process, which saves the most memory but serializes the
+  participants' JavaScript on that renderer's main thread;
+- `js_heap_usage`: the JavaScript heap of a participant's page, read over the Chrome DevTools Protocol.
+  The engines check it between questions, and recycle a context over its budget: its storage state
+  (the session cookies and local storage) is copied into a fresh context, which reopens the event as the
+  same participant, and the old context is closed;
+- `MemorySampler`: samples the proportional set size (PSS, or the RSS where it is not available) of the
+  bot's child processes (the Playwright driver and the whole Chromium process tree) from `/proc`, to
+  report its peak and the participants that fit per GB of memory.
+
+Reading process memory relies on Linux's `/proc`; elsewhere the sampler reports nothing.
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+PROC = Path("/proc")
+
+# Chromium switches of the launch profiles, from the default footprint to the smallest one
+_LOW_MEMORY_ARGS = (
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--mute-audio",
+    "--no-first-run",
+    "--disk-cache-size=1048576",
+    "--aggressive-cache-discard",
+    "--disable-features=Translate,BackForwardCache,MediaRouter,OptimizationHints,AutofillServerCommunication",
+)
+LAUNCH_PROFILES = {
+    "default": (),
+    "low_memory": (*_LOW_MEMORY_ARGS, "--js-flags=--optimize-for-size"),
+    "minimal": (
+        *_LOW_MEMORY_ARGS,
+        "--process-per-site",
+        "--renderer-process-limit=1",
+        "--disable-site-isolation-trials",
+        "--js-flags=--optimize-for-size --max-old-space-size=256",
+    ),
+}
+
+BYTES_PER_MB = 1024**2
+BYTES_PER_GB = 1024**3
+
+
+def launch_args(profile: str) -> list[str]:
+    """Returns the Chromium command line switches of a launch profile.
+
+    Args:
+        profile (str): The name of one of the `LAUNCH_PROFILES`.
+
+    Returns:
+        list[str]: The switches to pass as the `args` of `chromium.launch`.
+
+    Raises:
+        ValueError: If the profile is unknown.
+    """
+    if profile not in LAUNCH_PROFILES:
+        raise ValueError(f"Unknown launch profile '{profile}', expected one of: {', '.join(LAUNCH_PROFILES)}.")
+    return list(LAUNCH_PROFILES[profile])
+
+
+def process_memory(pid: int) -> int | None:
+    """Returns the memory of a process in bytes: its PSS if the kernel reports it, otherwise its RSS.
+
+    The PSS splits the pages shared between processes (such as Chromium's code) among them, so that summing
+    it over the Chromium processes does not count their shared memory many times.
+
+    Args:
+        pid (int): The identifier of the process.
+
+    Returns:
+        int|None: The memory of the process, or None if it cannot be read (e.g. the process has exited).
+    """
+    for path, field in ((PROC / str(pid) / "smaps_rollup", "Pss:"), (PROC / str(pid) / "status", "VmRSS:")):
+        try:
+            for line in path.read_text().splitlines():
+                if line.startswith(field):
+                    return int(line.split()[1]) * 1024
+        except (OSError, ValueError):
+            continue
+    return None
+
+
+def child_processes(pid: int) -> list[int]:
+    """Returns the identifiers of every descendant of a process, from `/proc`.
+
+    Args:
+        pid (int): The identifier of the process.
+
+    Returns:
+        list[int]: The identifiers of its children, their children, and so on.
+    """
+    children = {}
+    try:
+        entries = list(PROC.iterdir())
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.name.isdigit():
+            continue
+        try:
+            # The parent is the second field after the command name, which may itself contain spaces and parentheses
+            parent = int((entry / "stat").read_text().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry.name))
+    descendants, pending = [], [pid]
+    while pending:
+        for child in children.get(pending.pop(), ()):
+            descendants.append(child)
+            pending.append(child)
+    return descendants
+
+
+def browser_memory(pid: int | None = None) -> int | None:
+    """Returns the memory of the child processes of the bot, i.e. the Playwright driver and the browsers it launched.
+
+    Args:
+        pid (int|None): The identifier of the bot process. Defaults to the current process.
+
+    Returns:
+        int|None: The total memory of the child processes in bytes, or None if `/proc` is not available.
+    """
+    if not PROC.is_dir():
+        return None
+    return sum(memory for child in child_processes(os.getpid() if pid is None else pid) if (memory := process_memory(child)) is not None)
+
+
+async def js_heap_usage(context, page) -> int:
+    """Returns the used JavaScript heap of a page, over the Chrome DevTools Protocol (Chromium only).
+
+    Args:
+        context: The Playwright async browser context of the page.
+        page: The Playwright async page.
+
+    Returns:
+        int: The used JavaScript heap of the page in bytes.
+    """
+    session = await context.new_cdp_session(page)
+    try:
+        return int((await session.send("Runtime.getHeapUsage"))["usedSize"])
+    finally:
+        await session.detach()
+
+
+def js_heap_usage_sync(context, page) -> int:
+    """Returns the used JavaScript heap of a page with Playwright's sync API (see `js_heap_usage`)."""
+    session = context.new_cdp_session(page)
+    try:
+        return int(session.send("Runtime.getHeapUsage")["usedSize"])
+    finally:
+        session.detach()
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """The memory used by the browser while answering a quiz.
+
+    Attributes:
+        participants (int): The number of participants that were run.
+        peak_bytes (int): The peak memory of the bot's child processes, in bytes.
+        recycles (int): The number of contexts recycled because they exceeded their memory budget.
+    """
+
+    participants: int
+    peak_bytes: int
+    recycles: int = 0
+
+    @property
+    def per_participant_mb(self) -> float:
+        """float: The peak memory per participant, in MB."""
+        return self.peak_bytes / BYTES_PER_MB / max(self.participants, 1)
+
+    @property
+    def participants_per_gb(self) -> float:
+        """float: The number of participants that fit in 1 GB of memory at the measured peak."""
+        return self.participants * BYTES_PER_GB / self.peak_bytes if self.peak_bytes else 0.0
+
+    def summary(self) -> str:
+        """Returns a one-line summary of the report."""
+        return (
+            f"peak {self.peak_bytes / BYTES_PER_MB:.0f} MB for {self.participants} participants"
+            f" ({self.per_participant_mb:.1f} MB each, {self.participants_per_gb:.1f} participants per GB), {self.recycles} contexts recycled"
+        )
+
+
+class MemorySampler:
+    """Samples the memory of the bot's child processes in a background thread and keeps its peak.
+
+    Use it as a context manager around the run to measure.
+
+    Attributes:
+        interval (float): The number of seconds between two samples.
+        peak_bytes (int): The highest memory sampled so far, in bytes.
+        samples (int): The number of samples taken.
+    """
+
+    def __init__(self, interval: float = 1.0, pid: int | None = None):
+        """Initializes the sampler.
+
+        Args:
+            interval (float): The number of seconds between two samples.
+            pid (int|None): The identifier of the bot process whose children are sampled. Defaults to the current process.
+        """
+        self.interval = interval
+        self.pid = os.getpid() if pid is None else pid
+        self.peak_bytes = 0
+        self.samples = 0
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def available(self) -> bool:
+        """bool: Whether process memory can be read on this system."""
+        return PROC.is_dir()
+
+    def sample(self) -> int | None:
+        """Takes one sample now, and returns it in bytes (None if process memory cannot be read)."""
+        memory = browser_memory(self.pid)
+        if memory is not None:
+            self.peak_bytes = max(self.peak_bytes, memory)
+            self.samples += 1
+        return memory
+
+    def _run(self):
+        """Samples until stopped."""
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def __enter__(self):
+        """Starts sampling in a background thread."""
+        if self.available:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="slido-quiz-bot-memory", daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        """Takes a last sample, so that short runs are measured too, and stops sampling."""
+        if self._thread is not None:
+            self.sample()
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+        return False
+
+    def report(self, participants: int, recycles: int = 0) -> MemoryReport | None:
+        """Returns the memory report of the sampled run, or None if nothing could be sampled.
+
+        Args:
+            participants (int): The number of participants that were run.
+            recycles (int): The number of contexts recycled during the run.
+        """
+        if not self.samples:
+            return None
+        return MemoryReport(participants=participants, peak_bytes=self.peak_bytes, recycles=recycles)
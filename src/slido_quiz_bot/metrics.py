@@ -0,0 +1,337 @@
+"""This module records per-stage latencies and counters of the bot and exports them.
+
+Every stage of the answer loop (question detection, DOM extraction, waiting for the answer, submission)
+and every model request is timed with `get_metrics().span(stage, **labels)`. Spans are aggregated into
+histograms and counters exposed in the OpenMetrics text format, optionally on a local `/metrics` HTTP
+endpoint, and each span can also be appended to a JSONL trace file.
+
+Histograms and counters are only labelled with the low-cardinality labels of `AGGREGATED_LABELS`
+(the stage and the model); the trace keeps every label, including the participant and the question
+number set with `labels(...)` for all the spans of a block of code, even in other threads when the
+context is copied (`contextvars.copy_context().run`).
+
+Metrics are disabled by default: `get_metrics()` then returns a `Metrics` whose spans are a shared
+no-op context manager, so instrumented code costs a function call per stage. A registry with a flight
+recorder (see `flight_recorder.py`) still times every span for the recorder, even when disabled.
+"""
+
+import bisect
+import contextlib
+import contextvars
+import json
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Upper bounds in seconds of the latency histogram buckets, from DOM reads to slow model requests
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+# The only labels kept in the aggregated histograms and counters; the trace keeps all labels
+AGGREGATED_LABELS = ("stage", "model")
+
+METRIC_PREFIX = "slido_quiz_bot"
+
+_context_labels = contextvars.ContextVar("slido_quiz_bot_metric_labels", default=None)
+
+
+@contextlib.contextmanager
+def labels(**extra_labels):
+    """Adds labels (e.g. `participant`, `question`) to every span and counter recorded in the block.
+
+    Args:
+        **extra_labels: The labels to add.
+    """
+    token = _context_labels.set({**(_context_labels.get() or {}), **extra_labels})
+    try:
+        yield
+    finally:
+        _context_labels.reset(token)
+
+
+def current_labels() -> dict:
+    """Returns the labels set with `labels(...)` for the current block (do not modify them)."""
+    return _context_labels.get() or {}
+
+
+class _Histogram:
+    """A cumulative latency histogram."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class _Span:
+    """Times a block of code and records it with its metrics when the block exits."""
+
+    __slots__ = ("metrics", "stage", "labels", "start")
+
+    def __init__(self, metrics, stage, labels):
+        self.metrics = metrics
+        self.stage = stage
+        self.labels = labels
+        self.start = 0.0
+
+    def set(self, **extra_labels):
+        """Adds labels to the span once it is known what they are (e.g. which model answered)."""
+        self.labels.update(extra_labels)
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start, error=exc_type.__name__ if exc_type else None, **self.labels)
+        return False
+
+
+class _NullSpan:
+    """The span returned when metrics are disabled: it records nothing."""
+
+    __slots__ = ()
+
+    def set(self, **extra_labels):
+        """Ignores the labels."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Metrics:
+    """A registry of latency histograms and counters, with an optional JSONL trace and flight recorder.
+
+    Attributes:
+        enabled (bool): Whether histograms, counters and the trace are recorded.
+        trace_path (Path|None): The path of the JSONL trace file, or None to keep no trace.
+        recorder (FlightRecorder|None): The flight recorder to which every span is forwarded, even when disabled.
+    """
+
+    def __init__(
+        self,
+        trace_path: str | Path | None = None,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        enabled: bool = True,
+        recorder=None,
+    ):
+        """Initializes the registry.
+
+        Args:
+            trace_path (str|Path|None): The path of a JSONL file to which every span is appended, or None to keep no trace.
+            buckets (tuple[float, ...]): The upper bounds in seconds of the histogram buckets, in increasing order.
+            enabled (bool): Whether histograms, counters and the trace are recorded.
+            recorder (FlightRecorder|None): A flight recorder to which every span is forwarded, even when disabled.
+        """
+        self.enabled = enabled
+        self.recorder = recorder
+        self.buckets = tuple(buckets)
+        self.trace_path = Path(trace_path) if trace_path else None
+        self._histograms = defaultdict(lambda: _Histogram(self.buckets))
+        self._counters = defaultdict(float)
+        self._lock = threading.Lock()
+        self._trace_file = self.trace_path.open("a", encoding="utf-8", buffering=1) if self.trace_path and enabled else None
+        self._server = None
+
+    def span(self, stage: str, **span_labels):
+        """Returns a context manager timing a stage.
+
+        Args:
+            stage (str): The name of the stage, e.g. `detect` or `model_request`.
+            **span_labels: Labels of the span, e.g. `model`.
+
+        Returns:
+            A context manager; its `set(**labels)` method adds labels before the span ends.
+        """
+        if not self.enabled and self.recorder is None:
+            return _NULL_SPAN
+        return _Span(self, stage, span_labels)
+
+    def observe(self, stage: str, duration: float, error: str | None = None, **span_labels) -> None:
+        """Records the duration of a stage.
+
+        Args:
+            stage (str): The name of the stage.
+            duration (float): The duration in seconds.
+            error (str|None): The name of the exception that ended the stage, if any.
+            **span_labels: Labels of the span.
+        """
+        if not self.enabled and self.recorder is None:
+            return
+        all_labels = {**(_context_labels.get() or {}), **span_labels}
+        if self.recorder is not None:
+            self.recorder.record_stage(stage, duration, error, all_labels)
+            if not self.enabled:
+                return
+        key = _aggregation_key({"stage": stage, **all_labels})
+        with self._lock:
+            self._histograms[key].observe(duration)
+            if error is not None:
+                self._counters[("stage_errors", key)] += 1
+            if self._trace_file is not None:
+                record = {"time": time.time() - duration, "stage": stage, "duration": duration, **all_labels}
+                if error is not None:
+                    record["error"] = error
+                self._trace_file.write(json.dumps(record) + "\n")
+
+    def increment(self, name: str, amount: float = 1, **counter_labels) -> None:
+        """Increments a counter.
+
+        Args:
+            name (str): The name of the counter, without the `_total` suffix.
+            amount (float): The amount to add.
+            **counter_labels: Labels of the counter, e.g. `model`.
+        """
+        if not self.enabled:
+            return
+        key = _aggregation_key({**(_context_labels.get() or {}), **counter_labels})
+        with self._lock:
+            self._counters[(name, key)] += amount
+
+    def histogram(self, stage: str, **histogram_labels) -> tuple[list[int], float]:
+        """Returns the cumulative bucket counts and the sum of a stage's histogram.
+
+        Args:
+            stage (str): The name of the stage.
+            **histogram_labels: The aggregated labels of the histogram, e.g. `model`.
+
+        Returns:
+            tuple[list[int], float]: The cumulative count of every bucket (the last one is `+Inf`) and the sum of the durations.
+        """
+        key = _aggregation_key({"stage": stage, **histogram_labels})
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                return [0] * (len(self.buckets) + 1), 0.0
+            return _cumulative(histogram.counts), histogram.sum
+
+    def counter(self, name: str, **counter_labels) -> float:
+        """Returns the value of a counter."""
+        with self._lock:
+            return self._counters.get((name, _aggregation_key(counter_labels)), 0.0)
+
+    def render(self) -> str:
+        """Returns every histogram and counter in the OpenMetrics text format."""
+        with self._lock:
+            histograms = {key: (_cumulative(histogram.counts), histogram.sum) for key, histogram in self._histograms.items()}
+            counters = dict(self._counters)
+
+        lines = [f"# TYPE {METRIC_PREFIX}_stage_seconds histogram", f"# UNIT {METRIC_PREFIX}_stage_seconds seconds"]
+        for key, (counts, total) in sorted(histograms.items()):
+            for bound, count in zip([*self.buckets, "+Inf"], counts, strict=True):
+                lines.append(f"{METRIC_PREFIX}_stage_seconds_bucket{_format_labels(key, le=bound)} {count}")
+            lines.append(f"{METRIC_PREFIX}_stage_seconds_count{_format_labels(key)} {counts[-1]}")
+            lines.append(f"{METRIC_PREFIX}_stage_seconds_sum{_format_labels(key)} {total}")
+        for name in sorted({name for name, _ in counters}):
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} counter")
+            for (counter_name, key), value in sorted(counters.items()):
+                if counter_name == name:
+                    lines.append(f"{METRIC_PREFIX}_{name}_total{_format_labels(key)} {value:g}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> str:
+        """Serves the metrics on a local `/metrics` endpoint from a background thread.
+
+        Args:
+            host (str): The host to bind.
+            port (int): The port to bind, or 0 for any free port.
+
+        Returns:
+            str: The URL of the endpoint.
+        """
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="slido-quiz-bot-metrics", daemon=True).start()
+        return f"http://{host}:{self._server.server_address[1]}/metrics"
+
+    def close(self) -> None:
+        """Stops the endpoint and closes the trace file."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        with self._lock:
+            if self._trace_file is not None:
+                self._trace_file.close()
+                self._trace_file = None
+
+
+def _aggregation_key(all_labels):
+    """Returns the hashable, sorted aggregated labels of a metric."""
+    return tuple((name, str(all_labels[name])) for name in AGGREGATED_LABELS if all_labels.get(name) is not None)
+
+
+def _cumulative(counts):
+    """Returns the running totals of bucket counts."""
+    totals, running = [], 0
+    for count in counts:
+        running += count
+        totals.append(running)
+    return totals
+
+
+def _format_labels(key, **extra_labels):
+    """Formats labels as an OpenMetrics label set."""
+    pairs = [*key, *((name, str(value)) for name, value in extra_labels.items())]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value):
+    """Escapes a label value for the OpenMetrics text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _make_handler(metrics):
+    """Creates the request handler class of the `/metrics` endpoint."""
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        """Serves the metrics in the OpenMetrics text format."""
+
+        def do_GET(self):
+            """Serves `/metrics`."""
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            """Silences the default request logging."""
+
+    return MetricsHandler
+
+
+_metrics = Metrics(enabled=False)
+
+
+def get_metrics() -> Metrics:
+    """Returns the metrics registry used by the bot, which is disabled unless `set_metrics` was called."""
+    return _metrics
+
+
+def set_metrics(metrics: Metrics | None) -> None:
+    """Replaces the metrics registry used by the bot.
+
+    Args:
+        metrics (Metrics|None): The new registry, or None to disable metrics again.
+    """
+    global _metrics
+    _metrics = metrics if metrics is not None else Metrics(enabled=False)
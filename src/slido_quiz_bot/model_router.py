@@ -0,0 +1,165 @@
+"""This module routes answer requests to the fastest healthy model.
+
+The `ModelRouter` keeps a rolling window of latencies and outcomes for every model, ranks the models
+by their median latency, and takes a model out of rotation for a cool-down period (a circuit breaker)
+when it keeps failing, e.g. because it is rate limited.
+"""
+
+import statistics
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ModelStats:
+    """Rolling statistics of one model.
+
+    Attributes:
+        latencies (deque[float]): The latencies in seconds of the most recent successful requests.
+        outcomes (deque[bool]): Whether each of the most recent requests failed.
+        consecutive_failures (int): The number of failures since the last success.
+        open_until (float): The clock time until which the circuit breaker keeps the model out of rotation.
+    """
+
+    latencies: deque = field(default_factory=deque)
+    outcomes: deque = field(default_factory=deque)
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+
+
+def _percentile(values, percentile):
+    """Returns the given percentile (0-100) of a non-empty collection of values, interpolating between samples."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    return statistics.quantiles(ordered, n=100, method="inclusive")[percentile - 1]
+
+
+class ModelRouter:
+    """Tracks per-model latency and error rates and decides in which order models are tried.
+
+    Models with latency samples are ranked by their p50 latency; models without samples keep their
+    configured order after them. A model whose last `max_consecutive_failures` requests failed, or
+    whose error rate over the window reaches `max_error_rate`, is skipped for `cooldown` seconds.
+    """
+
+    def __init__(
+        self,
+        model_names: list[str],
+        window: int = 50,
+        max_consecutive_failures: int = 3,
+        max_error_rate: float = 0.5,
+        min_samples: int = 10,
+        cooldown: float = 30.0,
+        clock=time.monotonic,
+    ):
+        """Initializes the router.
+
+        Args:
+            model_names (list[str]): The names of the models, in their configured order of preference.
+            window (int): The number of recent requests kept per model.
+            max_consecutive_failures (int): The number of failures in a row that opens the circuit breaker.
+            max_error_rate (float): The error rate over the window that opens the circuit breaker.
+            min_samples (int): The number of requests in the window needed before the error rate is considered.
+            cooldown (float): The number of seconds a model stays out of rotation once its circuit breaker opens.
+            clock (Callable[[], float]): The monotonic clock used for the cool-down periods.
+        """
+        self.model_names = list(model_names)
+        self.max_consecutive_failures = max_consecutive_failures
+        self.max_error_rate = max_error_rate
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.clock = clock
+        self.stats = {name: ModelStats(latencies=deque(maxlen=window), outcomes=deque(maxlen=window)) for name in self.model_names}
+        self._lock = threading.Lock()
+
+    def record_success(self, model_name: str, latency: float) -> None:
+        """Records a successful request.
+
+        Args:
+            model_name (str): The name of the model that answered.
+            latency (float): The latency of the request in seconds.
+        """
+        with self._lock:
+            stats = self.stats[model_name]
+            stats.latencies.append(latency)
+            stats.outcomes.append(False)
+            stats.consecutive_failures = 0
+
+    def record_failure(self, model_name: str) -> None:
+        """Records a failed request, opening the model's circuit breaker if it keeps failing.
+
+        Args:
+            model_name (str): The name of the model that failed.
+        """
+        with self._lock:
+            stats = self.stats[model_name]
+            stats.outcomes.append(True)
+            stats.consecutive_failures += 1
+            error_rate = sum(stats.outcomes) / len(stats.outcomes)
+            if stats.consecutive_failures >= self.max_consecutive_failures or (
+                len(stats.outcomes) >= self.min_samples and error_rate >= self.max_error_rate
+            ):
+                stats.open_until = self.clock() + self.cooldown
+                stats.consecutive_failures = 0
+                stats.outcomes.clear()
+
+    def latency(self, model_name: str, percentile: int = 50) -> float | None:
+        """Returns a latency percentile of a model.
+
+        Args:
+            model_name (str): The name of the model.
+            percentile (int): The percentile to compute, e.g. 50 or 95.
+
+        Returns:
+            float|None: The latency in seconds, or None if the model has no latency samples yet.
+        """
+        with self._lock:
+            latencies = list(self.stats[model_name].latencies)
+        return _percentile(latencies, percentile) if latencies else None
+
+    def error_rate(self, model_name: str) -> float:
+        """Returns the fraction of failed requests of a model over the window."""
+        with self._lock:
+            outcomes = self.stats[model_name].outcomes
+            return sum(outcomes) / len(outcomes) if outcomes else 0.0
+
+    def is_available(self, model_name: str) -> bool:
+        """Returns whether the model's circuit breaker is closed."""
+        with self._lock:
+            return self.stats[model_name].open_until <= self.clock()
+
+    def ranked_models(self) -> list[str]:
+        """Returns the models in the order they should be tried.
+
+        Available models come first, fastest (by p50 latency) first, then models without samples in their
+        configured order. Models whose circuit breaker is open are only returned, soonest to close first,
+        when no model is available, so that a request is never refused outright.
+
+        Returns:
+            list[str]: The model names to try, in order.
+        """
+        positions = {name: position for position, name in enumerate(self.model_names)}
+        available = [name for name in self.model_names if self.is_available(name)]
+        if not available:
+            return sorted(self.model_names, key=lambda name: (self.stats[name].open_until, positions[name]))
+
+        def speed(name):
+            p50 = self.latency(name)
+            return (p50 is None, p50 or 0.0, positions[name])
+
+        return sorted(available, key=speed)
+
+    def summary(self) -> dict[str, dict]:
+        """Returns the current p50/p95 latency, error rate and availability of every model."""
+        return {
+            name: {
+                "p50": self.latency(name, 50),
+                "p95": self.latency(name, 95),
+                "error_rate": self.error_rate(name),
+                "available": self.is_available(name),
+            }
+            for name in self.model_names
+        }
@@ -0,0 +1,200 @@
+"""This module filters the network requests of the participant pages.
+
+The bot only needs the Slido application itself: images, fonts, media, analytics and other third-party
+trackers cost page load time and bandwidth for every participant without helping it answer. A
+`NetworkProfile` describes which resource types and hosts to block, and a `NetworkFilter` applies it as
+a Playwright route handler while counting what was blocked and how many bytes were still loaded.
+Blocked requests are aborted before any response, so their size is unknown: the bandwidth a profile
+saves is the difference between the bytes loaded with and without it.
+
+Every profile lets the real-time channels of the page through (event streams, websockets, XHR and
+fetch requests to non-tracker hosts), since questions are pushed over them.
+
+Profiles are either one of the built-in `NETWORK_PROFILES` or a JSON file with the fields of `NetworkProfile`.
+"""
+
+import fnmatch
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Third-party hosts used by analytics, tracking, support widgets and video embeds
+TRACKER_HOSTS = (
+    "*.google-analytics.com",
+    "*.googletagmanager.com",
+    "*.doubleclick.net",
+    "*.googlesyndication.com",
+    "*.facebook.net",
+    "*.hotjar.com",
+    "*.segment.io",
+    "*.segment.com",
+    "*.mixpanel.com",
+    "*.amplitude.com",
+    "*.fullstory.com",
+    "*.intercom.io",
+    "*.intercomcdn.com",
+    "*.sentry.io",
+    "*.optimizely.com",
+    "*.youtube.com",
+    "*.ytimg.com",
+    "*.vimeo.com",
+)
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """A description of the requests to block.
+
+    Attributes:
+        name (str): The name of the profile.
+        blocked_resource_types (frozenset[str]): The Playwright resource types to block (e.g. `image`, `font`).
+        blocked_hosts (tuple[str, ...]): Host patterns to block; `*.example.com` also matches `example.com`.
+        allowed_hosts (tuple[str, ...]): Host patterns that are never blocked, whatever the other rules say.
+    """
+
+    name: str
+    blocked_resource_types: frozenset = field(default_factory=frozenset)
+    blocked_hosts: tuple = ()
+    allowed_hosts: tuple = ()
+
+    @property
+    def is_enabled(self) -> bool:
+        """bool: Whether the profile blocks anything at all."""
+        return bool(self.blocked_resource_types or self.blocked_hosts)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Decides whether a request must be blocked.
+
+        Args:
+            url (str): The URL of the request.
+            resource_type (str): The Playwright resource type of the request.
+
+        Returns:
+            bool: True if the request must be blocked.
+        """
+        host = urlparse(url).hostname or ""
+        if _matches_any(host, self.allowed_hosts):
+            return False
+        return resource_type in self.blocked_resource_types or _matches_any(host, self.blocked_hosts)
+
+    @classmethod
+    def from_json(cls, path: str | Path) -> "NetworkProfile":
+        """Loads a profile from a JSON file.
+
+        Args:
+            path (str|Path): The path of a JSON object with the fields of `NetworkProfile`.
+
+        Returns:
+            NetworkProfile: The loaded profile.
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            name=data.get("name", Path(path).stem),
+            blocked_resource_types=frozenset(data.get("blocked_resource_types", ())),
+            blocked_hosts=tuple(data.get("blocked_hosts", ())),
+            allowed_hosts=tuple(data.get("allowed_hosts", ())),
+        )
+
+
+NETWORK_PROFILES = {
+    "off": NetworkProfile("off"),
+    "default": NetworkProfile(
+        "default",
+        blocked_resource_types=frozenset({"image", "media", "font", "beacon", "ping"}),
+        blocked_hosts=TRACKER_HOSTS,
+    ),
+    "strict": NetworkProfile(
+        "strict",
+        blocked_resource_types=frozenset({"image", "media", "font", "beacon", "ping", "stylesheet", "manifest", "texttrack"}),
+        blocked_hosts=TRACKER_HOSTS,
+        allowed_hosts=("*.sli.do", "*.slido.com"),
+    ),
+}
+
+
+def load_network_profile(name_or_path: str) -> NetworkProfile:
+    """Returns a built-in profile by name, or loads a profile from a JSON file.
+
+    Args:
+        name_or_path (str): The name of one of `NETWORK_PROFILES`, or the path of a JSON profile.
+
+    Returns:
+        NetworkProfile: The requested profile.
+
+    Raises:
+        ValueError: If the name is neither a built-in profile nor an existing file.
+    """
+    if name_or_path in NETWORK_PROFILES:
+        return NETWORK_PROFILES[name_or_path]
+    if Path(name_or_path).is_file():
+        return NetworkProfile.from_json(name_or_path)
+    raise ValueError(f"Unknown network profile '{name_or_path}'. Expected one of {', '.join(NETWORK_PROFILES)} or a JSON file.")
+
+
+def _matches_any(host: str, patterns) -> bool:
+    """Returns whether a host matches one of the patterns, where `*.example.com` also matches `example.com`."""
+    return any(fnmatch.fnmatch(host, pattern) or (pattern.startswith("*.") and host == pattern[2:]) for pattern in patterns)
+
+
+class NetworkFilter:
+    """Applies a network profile to pages or contexts and keeps request statistics.
+
+    Register `handle_route` with `route("**/*", ...)` and `record_response` with `on("response", ...)` on a
+    page or a browser context. Both work with the sync and the async Playwright APIs: with the async API,
+    the coroutine returned by `handle_route` is awaited by Playwright.
+
+    Attributes:
+        profile (NetworkProfile): The applied profile.
+        blocked_requests (Counter[str]): The number of blocked requests per resource type.
+        allowed_requests (int): The number of requests that were let through.
+        loaded_bytes (int): The number of bytes loaded by the allowed requests, according to the responses' `Content-Length`.
+            It is not the number of bytes saved, as the size of a blocked request is unknown.
+    """
+
+    def __init__(self, profile: NetworkProfile):
+        """Initializes the filter.
+
+        Args:
+            profile (NetworkProfile): The profile to apply.
+        """
+        self.profile = profile
+        self.blocked_requests = Counter()
+        self.allowed_requests = 0
+        self.loaded_bytes = 0
+
+    def handle_route(self, route, request):
+        """Blocks or continues an intercepted request according to the profile.
+
+        Args:
+            route: The Playwright route of the request.
+            request: The Playwright request.
+
+        Returns:
+            The result of `route.abort()` or `route.continue_()` (a coroutine with the async API).
+        """
+        if self.profile.should_block(request.url, request.resource_type):
+            self.blocked_requests[request.resource_type] += 1
+            return route.abort("blockedbyclient")
+        self.allowed_requests += 1
+        return route.continue_()
+
+    def record_response(self, response) -> None:
+        """Adds the size of a loaded response to the statistics.
+
+        Args:
+            response: The Playwright response.
+        """
+        content_length = response.headers.get("content-length")
+        if content_length and content_length.isdigit():
+            self.loaded_bytes += int(content_length)
+
+    def summary(self) -> str:
+        """Returns a one-line human readable summary of the statistics."""
+        blocked = sum(self.blocked_requests.values())
+        by_type = ", ".join(f"{resource_type}: {count}" for resource_type, count in self.blocked_requests.most_common())
+        return (
+            f"profile '{self.profile.name}': {blocked} requests blocked ({by_type or 'none'}), "
+            f"{self.allowed_requests} allowed, {self.loaded_bytes / 1024:.0f} KiB loaded by the allowed requests"
+        )
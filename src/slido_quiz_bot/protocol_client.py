@@ -0,0 +1,370 @@
+"""This module runs load-test participants without a browser, by speaking the participant protocol directly.
+
+A `ProtocolParticipant` joins with one HTTP request, receives the polls as server-sent events and
+votes with another HTTP request, all over `asyncio` streams from the standard library. Questions go
+through the same `QuizQuestion` model and the same `AnswerCoordinator`/`answer_quiz_question` pipeline
+as the Playwright engines, so a participant costs a socket and a coroutine instead of a browser context.
+
+The client speaks the JSON/event-stream protocol documented in `stand_in_server`:
+
+    POST /api/participants           {"name": ...}                                -> {"participant_id": ...}
+    GET  /api/stream?participant_id  text/event-stream of `state` events
+    POST /api/votes                  {"participant_id": ..., "poll_id": ..., "option_id": ...}
+
+The paths are collected in `ProtocolEndpoints`, so that the client can follow the protocol of another
+server by overriding them.
+
+The real Slido service does not speak this protocol, so the client is only used by the `load-test`
+subcommand and only connects to stand-in servers, on a loopback or private network address (see `check_stand_in_url`).
+"""
+
+import asyncio
+import functools
+import ipaddress
+import json
+from dataclasses import dataclass
+from urllib.parse import quote, urlparse
+
+from rich.console import Console
+
+from slido_quiz_bot import flight_recorder
+from slido_quiz_bot.answer_cache import AnswerCache
+from slido_quiz_bot.answer_quiz_question import answer_quiz_question, warm_up_default_answerer
+from slido_quiz_bot.metrics import get_metrics, labels
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.single_flight import AnswerCoordinator
+
+console = Console()
+
+# How long (in seconds) the event stream may stay silent, keep-alives included, before it is considered lost
+STREAM_IDLE_TIMEOUT = 60.0
+
+
+class ProtocolError(Exception):
+    """Raised when the server answers a protocol request with an error or an unexpected response."""
+
+
+@dataclass(frozen=True)
+class ProtocolEndpoints:
+    """The paths of the participant protocol.
+
+    Attributes:
+        join (str): The path where participants join, with a JSON `{"name": ...}` body.
+        stream (str): The path of the event stream, formatted with the `participant_id`.
+        vote (str): The path where votes are submitted, with a JSON `{"participant_id", "poll_id", "option_id"}` body.
+    """
+
+    join: str = "/api/participants"
+    stream: str = "/api/stream?participant_id={participant_id}"
+    vote: str = "/api/votes"
+
+
+async def _open(base_url, method, path, payload=None):
+    """Sends an HTTP/1.1 request and returns the status, the headers and the stream reader of the response."""
+    url = urlparse(base_url)
+    if url.scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported URL scheme '{url.scheme}'.")
+    port = url.port or (443 if url.scheme == "https" else 80)
+    reader, writer = await asyncio.open_connection(url.hostname, port, ssl=url.scheme == "https")
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    head = [f"{method} {path} HTTP/1.1", f"Host: {url.netloc}", "Connection: close", "Accept: application/json, text/event-stream"]
+    if payload is not None:
+        head += ["Content-Type: application/json", f"Content-Length: {len(body)}"]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+    status_line = await reader.readline()
+    try:
+        status = int(status_line.split()[1])
+    except (IndexError, ValueError) as e:
+        writer.close()
+        raise ProtocolError(f"Invalid HTTP status line: {status_line!r}") from e
+    headers = {}
+    while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return status, headers, reader, writer
+
+
+async def _read_body(headers, reader):
+    """Reads a response body delimited by its `Content-Length`, chunked, or by the end of the connection."""
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        chunks = []
+        while size := int((await reader.readline()).split(b";")[0], 16):
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        return b"".join(chunks)
+    if "content-length" in headers:
+        return await reader.readexactly(int(headers["content-length"]))
+    return await reader.read()
+
+
+async def request_json(base_url: str, method: str, path: str, payload: dict | None = None) -> tuple[int, dict]:
+    """Sends a JSON request and returns the decoded JSON response.
+
+    Args:
+        base_url (str): The scheme and host of the server, e.g. `http://127.0.0.1:8080`.
+        method (str): The HTTP method.
+        path (str): The path of the request, with its query string.
+        payload (dict|None): The JSON body, or None to send no body.
+
+    Returns:
+        tuple[int, dict]: The HTTP status and the decoded JSON body.
+
+    Raises:
+        ProtocolError: If the response is not valid JSON.
+    """
+    status, headers, reader, writer = await _open(base_url, method, path, payload)
+    try:
+        body = await _read_body(headers, reader)
+    finally:
+        writer.close()
+    try:
+        return status, json.loads(body or b"{}")
+    except json.JSONDecodeError as e:
+        raise ProtocolError(f"{method} {path} answered with invalid JSON (HTTP {status}).") from e
+
+
+async def read_events(reader, idle_timeout: float = STREAM_IDLE_TIMEOUT):
+    """Yields the server-sent events of a stream until it closes.
+
+    Args:
+        reader (asyncio.StreamReader): The reader positioned at the start of the event stream body.
+        idle_timeout (float): How long in seconds the stream may stay silent before `TimeoutError` is raised.
+
+    Yields:
+        tuple[str, str]: The type (`message` by default) and the data of every event.
+
+    Raises:
+        TimeoutError: If the stream stays silent for longer than `idle_timeout`.
+    """
+    event_type, data = "message", []
+    while True:
+        try:
+            line = await asyncio.wait_for(reader.readline(), idle_timeout)
+        except asyncio.TimeoutError as e:
+            # Before Python 3.11, `asyncio.TimeoutError` is not the builtin `TimeoutError`
+            raise TimeoutError(f"The event stream stayed silent for {idle_timeout:g} seconds.") from e
+        if not line:
+            return
+        line = line.decode("utf-8").rstrip("\r\n")
+        if not line:
+            if data:
+                yield event_type, "\n".join(data)
+            event_type, data = "message", []
+        elif line.startswith(":"):
+            continue
+        else:
+            field_name, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field_name == "event":
+                event_type = value
+            elif field_name == "data":
+                data.append(value)
+
+
+class ProtocolParticipant:
+    """One quiz participant driven over the participant protocol.
+
+    Attributes:
+        name (str): The name of the participant.
+        index (int): The index of the participant, passed on to the answer strategy.
+        participant_id (str|None): The identifier given by the server once joined.
+        answered (int): The number of votes accepted by the server.
+    """
+
+    def __init__(self, base_url: str, name: str, coordinator: AnswerCoordinator, index: int = 0, endpoints: ProtocolEndpoints | None = None):
+        """Initializes the participant.
+
+        Args:
+            base_url (str): The scheme and host of the server, e.g. `http://127.0.0.1:8080`.
+            name (str): The name of the participant.
+            coordinator (AnswerCoordinator): The coordinator shared by all participants.
+            index (int): The index of the participant, passed on to the answer strategy.
+            endpoints (ProtocolEndpoints|None): The paths of the protocol. Defaults to the stand-in protocol.
+        """
+        self.base_url = base_url
+        self.name = name
+        self.coordinator = coordinator
+        self.index = index
+        self.endpoints = endpoints or ProtocolEndpoints()
+        self.participant_id = None
+        self.answered = 0
+
+    async def join(self) -> str:
+        """Joins the quiz.
+
+        Returns:
+            str: The identifier given by the server.
+
+        Raises:
+            ValueError: If the participant name is empty.
+            ProtocolError: If the server refuses the participant.
+        """
+        if not self.name:
+            raise ValueError("Participant name cannot be empty.")
+        status, response = await request_json(self.base_url, "POST", self.endpoints.join, {"name": self.name})
+        if status != 200 or "participant_id" not in response:
+            raise ProtocolError(f"Joining as {self.name} failed with HTTP {status}: {response}")
+        self.participant_id = response["participant_id"]
+        return self.participant_id
+
+    async def vote(self, poll_id: str, option_id: str) -> bool:
+        """Submits a vote on a poll.
+
+        Args:
+            poll_id (str): The identifier of the poll.
+            option_id (str): The identifier of the chosen option.
+
+        Returns:
+            bool: Whether the server accepted the vote.
+        """
+        payload = {"participant_id": self.participant_id, "poll_id": poll_id, "option_id": option_id}
+        status, response = await request_json(self.base_url, "POST", self.endpoints.vote, payload)
+        return status == 200 and bool(response.get("accepted", True))
+
+    async def answer_poll(self, poll: dict) -> None:
+        """Answers one poll with the shared answer pipeline and votes for the chosen option.
+
+        Args:
+            poll (dict): The poll as pushed by the server, with its `poll_id`, `question` and `options`.
+
+        Raises:
+            ValueError: If the poll has no question text or no options.
+        """
+        metrics = get_metrics()
+        if not poll.get("question") or not poll.get("options"):
+            raise ValueError("The poll has no question text or no answer choices.")
+        answer_choices = [option["label"] for option in poll["options"]]
+        flight_recorder.record("snapshot", question=poll["question"], options=answer_choices, counter=poll.get("number"))
+        quiz_question = QuizQuestion(question=poll["question"], answer_choices=answer_choices, correct_answer_index=None)
+        with metrics.span("answer"):
+            correct_answer_index = await self.coordinator.answer_async(quiz_question, self.index)
+        with metrics.span("submit"):
+            accepted = await self.vote(poll["poll_id"], poll["options"][correct_answer_index]["id"])
+        if accepted:
+            self.answered += 1
+        else:
+            console.log(f"[bold magenta]{self.name}[/bold magenta] [bold red]The vote on '{poll['question']}' was rejected.")
+
+    async def run(self) -> int:
+        """Joins the quiz and answers every poll until the quiz ends.
+
+        Returns:
+            int: The number of votes accepted by the server.
+
+        Raises:
+            ConnectionAbortedError: If the event stream fails or ends before the quiz does.
+        """
+        if self.participant_id is None:
+            await self.join()
+        path = self.endpoints.stream.format(participant_id=quote(self.participant_id))
+        try:
+            status, _, reader, writer = await _open(self.base_url, "GET", path)
+        except OSError as e:
+            raise ConnectionAbortedError(f"Opening the event stream of {self.name} failed: {e}") from e
+        if status != 200:
+            writer.close()
+            raise ConnectionAbortedError(f"Opening the event stream of {self.name} failed with HTTP {status}.")
+
+        voted_poll_ids = set()
+        state = None
+        with labels(participant=self.name):
+            try:
+                async for event_type, data in read_events(reader, STREAM_IDLE_TIMEOUT):
+                    if event_type != "state":
+                        continue
+                    state = json.loads(data)
+                    poll = state.get("poll") if state.get("status") == "poll" else None
+                    if poll and poll["poll_id"] not in voted_poll_ids and poll["poll_id"] not in state.get("answered_poll_ids", ()):
+                        voted_poll_ids.add(poll["poll_id"])
+                        with labels(question=str(poll.get("number", ""))), get_metrics().span("question"):
+                            await self.answer_poll(poll)
+                    if state.get("status") == "finished":
+                        return self.answered
+            except (OSError, TimeoutError, asyncio.TimeoutError, ValueError) as e:
+                flight_recorder.dump("failure", error=repr(e), state=state)
+                raise ConnectionAbortedError(f"Error during quiz interaction for {self.name}: {e}") from e
+            finally:
+                writer.close()
+            flight_recorder.dump("failure", error="The event stream ended before the quiz did.", state=state)
+        raise ConnectionAbortedError(f"The event stream of {self.name} ended before the quiz did.")
+
+
+def base_url_from_quiz_url(quiz_url: str) -> str:
+    """Returns the scheme and host of a quiz URL, where the protocol endpoints are served.
+
+    Example:
+        >>> base_url_from_quiz_url("http://127.0.0.1:8080/event/stand-in")
+        'http://127.0.0.1:8080'
+    """
+    url = urlparse(quiz_url)
+    return f"{url.scheme}://{url.netloc}"
+
+
+def check_stand_in_url(quiz_url: str) -> None:
+    """Checks that a quiz URL points to a stand-in server, on localhost or a loopback or private network address.
+
+    Args:
+        quiz_url (str): The URL of the quiz.
+
+    Raises:
+        ValueError: If the URL points to any other host, such as the real Slido service.
+
+    Example:
+        >>> check_stand_in_url("http://127.0.0.1:8080/event/stand-in")
+    """
+    host = urlparse(quiz_url).hostname or ""
+    try:
+        is_local = host == "localhost" or ipaddress.ip_address(host).is_loopback or ipaddress.ip_address(host).is_private
+    except ValueError:
+        is_local = False
+    if not is_local:
+        raise ValueError(
+            f"The protocol backend only speaks the participant protocol of the local stand-in server (e.g. for load tests),"
+            f" not the one of {host or quiz_url!r}: use the browser engines to answer real quizzes."
+        )
+
+
+async def respond_to_slido_quiz_protocol(quiz_url, participant_names, cache_path=None, strategy="consensus", warm_up=True, endpoints=None):
+    """Answers a Slido quiz with several browserless participants.
+
+    Args:
+        quiz_url (str): The URL of the stand-in quiz; only its scheme and host are used.
+        participant_names (list[str]): The names of the participants to enter in the quiz.
+        cache_path (str|None): The path of a persistent answer cache, or None to always ask the model.
+        strategy (str): The name of the answer strategy deciding which choice each participant submits.
+        warm_up (bool): Whether to warm up the model clients in the background while the participants join.
+        endpoints (ProtocolEndpoints|None): The paths of the protocol. Defaults to the stand-in protocol.
+
+    Raises:
+        ValueError: If the URL is not the one of a stand-in server, no participant names are given or the strategy is unknown.
+        ConnectionAbortedError: If any of the participants failed to complete the quiz.
+    """
+    check_stand_in_url(quiz_url)
+    if not participant_names:
+        raise ValueError("At least one participant name is required.")
+
+    cache = AnswerCache(cache_path) if cache_path else None
+    coordinator = AnswerCoordinator(functools.partial(answer_quiz_question, cache=cache), strategy=strategy)
+    warm_up_task = asyncio.create_task(asyncio.to_thread(warm_up_default_answerer)) if warm_up else None
+    base_url = base_url_from_quiz_url(quiz_url)
+    participants = [ProtocolParticipant(base_url, name, coordinator, index, endpoints) for index, name in enumerate(participant_names)]
+    try:
+        with console.status(f"[bold blue]Answering with {len(participants)} browserless participants..."):
+            results = await asyncio.gather(*(participant.run() for participant in participants), return_exceptions=True)
+    finally:
+        if warm_up_task is not None:
+            await warm_up_task
+
+    console.log(f"[bold blue]Model calls:[/bold blue] {coordinator.model_calls}, shared with other participants: {coordinator.coalesced}.")
+    if cache is not None:
+        console.log(f"[bold blue]Answer cache:[/bold blue] {cache.hits} hits, {cache.misses} misses.")
+        cache.close()
+
+    failures = [result for result in results if isinstance(result, BaseException)]
+    for failure in failures:
+        console.log(f"[bold red]Error:[/bold red] {failure}")
+    if failures:
+        raise ConnectionAbortedError(f"{len(failures)} of {len(participant_names)} participants failed to complete the quiz.")
+    console.log("[bold blue]Quiz Completed[/bold blue] - All participants have answered and submitted every question.")
@@ -0,0 +1,212 @@
+"""This module provides the in-page script that detects new Slido quiz questions as they appear.
+
+The script installs a `MutationObserver` on the document and keeps track of the question that is
+currently open, identified by the question counter and the poll title. Instead of polling the page
+from Python, the bot evaluates `window.__slidoQuizBot.nextQuestion(previous, timeout)`, which returns
+a promise resolved by the observer the moment a question different from `previous` is ready to be
+answered (its title is rendered and the 'Send' button is visible). In the same way,
+`window.__slidoQuizBot.optionsChanged(expected, timeout)` resolves with a new snapshot as soon as the
+answer choices differ from `expected`, which lets speculative answers be restarted when the options settle.
+
+`window.__slidoQuizBot.snapshot()` reads the question, the answer choices and the question counter in a
+single round-trip, and tags every option's radio with a stable identifier (in the `OPTION_ID_ATTRIBUTE`
+attribute), so the chosen option is clicked by identifier rather than by a selector quoting its label.
+
+The script is meant to be registered with `add_init_script` before navigating, so the observer is in
+place from the first DOM mutation, and is safe to evaluate again on an already loaded page.
+"""
+
+from dataclasses import dataclass
+
+QUESTION_KEY_SEPARATOR = "␞"
+
+OPTION_ID_ATTRIBUTE = "data-slido-quiz-bot-option"
+
+QUESTION_WATCHER_SCRIPT = """
+(() => {
+  if (window.__slidoQuizBot) {
+    return;
+  }
+
+  const isVisible = (element) => !!element && element.getClientRects().length > 0;
+
+  const currentQuestion = () => {
+    const title = document.querySelector('[data-testid="poll-title"]');
+    if (!isVisible(title) || !title.textContent.trim()) {
+      return null;
+    }
+    const sendButton = Array.from(document.querySelectorAll("button")).find(
+      (button) => button.textContent.trim().toLowerCase() === "send" && isVisible(button)
+    );
+    if (!sendButton) {
+      return null;
+    }
+    const counter = document.querySelector("[data-testid='question-counter']");
+    return `${counter ? counter.textContent.trim() : ""}SEPARATOR${title.textContent.trim()}`;
+  };
+
+  const optionLabels = () => Array.from(document.querySelectorAll(".poll-question-options .MuiFormControlLabel-label"));
+
+  const currentOptions = () => optionLabels().map((label) => label.textContent);
+
+  // An option is identified by its radio (or, without one, its label), tagged once and for as long as the element lives.
+  let nextOptionId = 0;
+  const optionId = (label) => {
+    const root = label.closest(".MuiFormControlLabel-root") || label.parentElement;
+    const target = root.querySelector("input[type='radio']") || root;
+    if (!target.hasAttribute("OPTION_ID_ATTRIBUTE")) {
+      target.setAttribute("OPTION_ID_ATTRIBUTE", `option-${nextOptionId++}`);
+    }
+    return target.getAttribute("OPTION_ID_ATTRIBUTE");
+  };
+
+  const snapshot = () => {
+    const title = document.querySelector('[data-testid="poll-title"]');
+    const counter = document.querySelector("[data-testid='question-counter']");
+    const labels = optionLabels();
+    return {
+      question: title ? title.textContent.trim() : "",
+      options: labels.map((label) => label.textContent),
+      optionIds: labels.map(optionId),
+      counter: counter ? counter.textContent.trim() : "",
+    };
+  };
+
+  // Each waiter resolves with the first non-null value of its check, re-evaluated on every mutation.
+  const waiters = new Set();
+  const notify = () => {
+    for (const waiter of Array.from(waiters)) {
+      const value = waiter.check();
+      if (value !== null) {
+        waiters.delete(waiter);
+        clearTimeout(waiter.timer);
+        waiter.resolve(value);
+      }
+    }
+  };
+
+  const waitFor = (check, timeout) =>
+    new Promise((resolve) => {
+      const value = check();
+      if (value !== null) {
+        resolve(value);
+        return;
+      }
+      const waiter = { check, resolve };
+      waiter.timer = setTimeout(() => {
+        waiters.delete(waiter);
+        resolve(null);
+      }, timeout);
+      waiters.add(waiter);
+    });
+
+  new MutationObserver(notify).observe(document, {
+    subtree: true,
+    childList: true,
+    characterData: true,
+    attributes: true,
+    attributeFilter: ["class", "style", "hidden", "disabled"],
+  });
+
+  window.__slidoQuizBot = {
+    currentQuestion,
+    currentOptions,
+    snapshot,
+    nextQuestion(previous, timeout) {
+      return waitFor(() => {
+        const question = currentQuestion();
+        return question && question !== previous ? question : null;
+      }, timeout);
+    },
+    optionsChanged(expected, timeout) {
+      return waitFor(() => {
+        const options = currentOptions();
+        const changed = options.length > 0 && JSON.stringify(options) !== JSON.stringify(expected);
+        return changed ? snapshot() : null;
+      }, timeout);
+    },
+  };
+})();
+""".replace("SEPARATOR", QUESTION_KEY_SEPARATOR).replace("OPTION_ID_ATTRIBUTE", OPTION_ID_ATTRIBUTE)
+
+NEXT_QUESTION_EXPRESSION = "([previous, timeout]) => window.__slidoQuizBot.nextQuestion(previous, timeout)"
+
+OPTIONS_CHANGED_EXPRESSION = "([expected, timeout]) => window.__slidoQuizBot.optionsChanged(expected, timeout)"
+
+SNAPSHOT_EXPRESSION = "() => window.__slidoQuizBot.snapshot()"
+
+
+@dataclass(frozen=True)
+class QuestionSnapshot:
+    """The question on the page, read in a single round-trip.
+
+    Attributes:
+        question (str): The text of the poll title.
+        options (list[str]): The text of the answer choices, in page order.
+        option_ids (list[str]): The stable identifier of every answer choice, to click it with `option_selector`.
+        counter (str): The text of the question counter (e.g. "2/5"), or an empty string if there is none.
+    """
+
+    question: str
+    options: list[str]
+    option_ids: list[str]
+    counter: str
+
+    @classmethod
+    def from_dict(cls, snapshot: dict) -> "QuestionSnapshot":
+        """Builds a snapshot from the object returned by the in-page `snapshot()`.
+
+        Args:
+            snapshot (dict): The snapshot returned by `SNAPSHOT_EXPRESSION` or `OPTIONS_CHANGED_EXPRESSION`.
+
+        Returns:
+            QuestionSnapshot: The snapshot.
+
+        Raises:
+            ValueError: If the snapshot has no question text or no answer choices.
+        """
+        if not snapshot or not snapshot.get("question"):
+            raise ValueError("Question text could not be retrieved.")
+        if not snapshot.get("options"):
+            raise ValueError("No answer choices found for the quiz.")
+        return cls(snapshot["question"], list(snapshot["options"]), list(snapshot["optionIds"]), snapshot.get("counter", ""))
+
+    @property
+    def key(self) -> str:
+        """str: The key of the question, as returned by `nextQuestion` (question counter and poll title)."""
+        return f"{self.counter}{QUESTION_KEY_SEPARATOR}{self.question}"
+
+
+def option_selector(option_id: str) -> str:
+    """Returns the selector of the answer choice with a given identifier.
+
+    The identifiers are generated by the question watcher, so the selector never has to quote the
+    text of an answer choice, which may itself contain quotes.
+
+    Args:
+        option_id (str): The identifier of the answer choice, from `QuestionSnapshot.option_ids`.
+
+    Returns:
+        str: The CSS selector of the answer choice's radio.
+
+    Example:
+        >>> option_selector("option-3")
+        '[data-slido-quiz-bot-option="option-3"]'
+    """
+    return f'[{OPTION_ID_ATTRIBUTE}="{option_id}"]'
+
+
+def question_number(question_key: str) -> str:
+    """Returns the question number of a question key, as shown by the question counter.
+
+    Args:
+        question_key (str): A key returned by `nextQuestion`, made of the question counter and the poll title.
+
+    Returns:
+        str: The number of the question, or an empty string if the page shows no question counter.
+
+    Example:
+        >>> question_number("2/5␞What is the capital of France?")
+        '2'
+    """
+    return question_key.split(QUESTION_KEY_SEPARATOR, 1)[0].split("/", 1)[0].strip()
@@ -0,0 +1,315 @@
+"""This module schedules model requests within the API quota, across threads and processes.
+
+Many participants, or several bot processes on the same API key, quickly exceed the requests per
+minute allowed for each model, and every request sent over the quota only earns a 429 (and often
+pushes the next model in the fallback list over its quota too). The `QuotaScheduler` paces the
+requests instead:
+
+- every model has a token bucket refilled at its allowed rate. With a `state_dir`, the bucket lives
+  in a small JSON file locked with `fcntl.flock`, so every process using the same directory (e.g. the
+  workers of the daemon, or several CLI runs) shares it;
+- requests wait for a token in priority order: live questions first, then background work such as
+  batched cache warming, which also leaves a reserve of tokens to live questions in other processes;
+- a 429 blocks the model for an exponentially growing back-off in the shared state, so no process
+  retries into the limit, and the bucket then refills gradually instead of releasing a retry storm.
+"""
+
+import contextlib
+import enum
+import heapq
+import itertools
+import json
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows, where buckets are only shared within a process
+    fcntl = None
+
+# The longest a waiting request sleeps before checking the shared buckets again, in seconds
+POLL_INTERVAL = 0.25
+
+
+class Priority(enum.IntEnum):
+    """The priority of a model request; lower values are served first."""
+
+    LIVE = 0
+    BACKGROUND = 1
+
+
+class QuotaTimeoutError(TimeoutError):
+    """Raised when no request slot frees up for a model within the allowed wait."""
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Checks whether a model request failed because of the rate limit (HTTP 429 / RESOURCE_EXHAUSTED).
+
+    Args:
+        error (BaseException): The error raised by the model client.
+
+    Returns:
+        bool: True if the error is a rate limit error.
+    """
+    if getattr(error, "code", None) == 429 or type(error).__name__ in ("ResourceExhausted", "TooManyRequests"):
+        return True
+    return bool(re.search(r"\b429\b|resource.?exhausted|rate.?limit", str(error), re.IGNORECASE))
+
+
+class SharedTokenBucket:
+    """A token bucket whose state can be shared by several processes through a locked file.
+
+    Attributes:
+        rate (float): The number of tokens added per second.
+        capacity (float): The maximum number of tokens, i.e. the largest burst of requests.
+        path (Path|None): The file holding the shared state, or None for a bucket private to this process.
+    """
+
+    def __init__(self, rate: float, capacity: float, path: str | Path | None = None, clock=time.time):
+        """Initializes the bucket, full.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (float): The maximum number of tokens, i.e. the largest burst of requests.
+            path (str|Path|None): The file holding the shared state, or None for a bucket private to this process.
+            clock (Callable[[], float]): The wall clock, shared by all processes, used to refill the bucket.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.path = Path(path) if path else None
+        self.clock = clock
+        self._state = self._full_state()
+        self._lock = threading.Lock()
+
+    def _full_state(self) -> dict:
+        """Returns the state of a full, unblocked bucket."""
+        return {"tokens": self.capacity, "updated": self.clock(), "blocked_until": 0.0}
+
+    @contextlib.contextmanager
+    def _locked_state(self):
+        """Yields the refilled state of the bucket, locked against other threads and processes, and saves it afterwards."""
+        with self._lock:
+            if self.path is None or fcntl is None:
+                state = self._state
+                self._refill(state)
+                yield state
+                return
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            with os.fdopen(fd, "r+", encoding="utf-8") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                content = file.read()
+                state = json.loads(content) if content.strip() else self._full_state()
+                self._refill(state)
+                yield state
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(state))
+
+    def _refill(self, state: dict) -> None:
+        """Adds the tokens earned since the last update."""
+        now = self.clock()
+        state["tokens"] = min(self.capacity, state["tokens"] + max(now - state["updated"], 0.0) * self.rate)
+        state["updated"] = now
+
+    def try_acquire(self, cost: float = 1.0, reserve: float = 0.0) -> float:
+        """Takes tokens if enough are available beyond a reserve.
+
+        Args:
+            cost (float): The number of tokens to take.
+            reserve (float): The number of tokens that must remain in the bucket afterwards.
+
+        Returns:
+            float: 0 if the tokens were taken, otherwise the estimated number of seconds until they are available.
+        """
+        with self._locked_state() as state:
+            blocked_for = state["blocked_until"] - state["updated"]
+            if blocked_for > 0:
+                return blocked_for
+            if state["tokens"] - cost >= reserve:
+                state["tokens"] -= cost
+                return 0.0
+            return (cost + reserve - state["tokens"]) / self.rate
+
+    def wait_time(self, cost: float = 1.0) -> float:
+        """Returns the estimated number of seconds until `cost` tokens are available, without taking them."""
+        with self._locked_state() as state:
+            return max(state["blocked_until"] - state["updated"], (cost - state["tokens"]) / self.rate, 0.0)
+
+    def block(self, seconds: float) -> None:
+        """Empties the bucket and takes it out of use for a number of seconds (for every process sharing it)."""
+        with self._locked_state() as state:
+            state["blocked_until"] = max(state["blocked_until"], state["updated"] + seconds)
+            state["tokens"] = 0.0
+
+
+class QuotaScheduler:
+    """Paces the requests to every model within its quota, in priority order, backing off on 429s.
+
+    Attributes:
+        requests_per_minute (dict[str, float]): The requests per minute allowed for each model with its own limit.
+        default_requests_per_minute (float|None): The requests per minute allowed for other models, or None for no limit.
+        state_dir (Path|None): The directory of the shared bucket files, or None for buckets private to this process.
+        max_wait (float|None): The maximum number of seconds a request waits for a slot, or None to wait forever.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | dict[str, float],
+        state_dir: str | Path | None = None,
+        burst: float | None = None,
+        background_reserve: float = 0.25,
+        max_wait: float | None = 30.0,
+        backoff_base: float = 2.0,
+        backoff_max: float = 60.0,
+        clock=time.time,
+    ):
+        """Initializes the scheduler.
+
+        Args:
+            requests_per_minute (float|dict[str, float]): The requests per minute allowed for every model, or for each model
+                by name (with an optional "*" entry for the others).
+            state_dir (str|Path|None): A directory of bucket files shared with other processes, or None for private buckets.
+            burst (float|None): The largest burst of requests to a model. Defaults to a tenth of its per-minute limit (at least 1).
+            background_reserve (float): The fraction of a bucket's capacity that background requests leave to live ones.
+            max_wait (float|None): The maximum number of seconds a request waits for a slot, or None to wait forever.
+            backoff_base (float): The back-off after a first 429, in seconds, doubled after every further 429 in a row.
+            backoff_max (float): The longest back-off, in seconds.
+            clock (Callable[[], float]): The wall clock shared by the processes.
+
+        Raises:
+            ValueError: If a limit is not positive.
+        """
+        limits = dict(requests_per_minute) if isinstance(requests_per_minute, dict) else {"*": requests_per_minute}
+        if any(limit <= 0 for limit in limits.values()):
+            raise ValueError("The requests per minute must be positive.")
+
+        self.default_requests_per_minute = limits.pop("*", None)
+        self.requests_per_minute = limits
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.burst = burst
+        self.background_reserve = background_reserve
+        self.max_wait = max_wait
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self._reset_runtime_state()
+        if self.state_dir is not None:
+            self.state_dir.mkdir(parents=True, exist_ok=True)
+
+    def _reset_runtime_state(self) -> None:
+        """Creates the buckets, waiters and back-off counters of this process."""
+        self._buckets: dict[str, SharedTokenBucket | None] = {}
+        self._waiters: dict[str, list] = defaultdict(list)
+        self._sequence = itertools.count()
+        self._consecutive_rate_limits: dict[str, int] = defaultdict(int)
+        self._condition = threading.Condition()
+
+    def __getstate__(self) -> dict:
+        """Returns the configuration of the scheduler, so that it can be sent to spawned processes.
+
+        The processes then share the buckets through `state_dir`, if any; their waiters are their own.
+        """
+        state = self.__dict__.copy()
+        for name in ("_buckets", "_waiters", "_sequence", "_consecutive_rate_limits", "_condition"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restores a scheduler sent to another process."""
+        self.__dict__.update(state)
+        self._reset_runtime_state()
+
+    def _bucket(self, model_name: str) -> SharedTokenBucket | None:
+        """Returns the bucket of a model, or None if the model has no limit (the condition must be held)."""
+        if model_name not in self._buckets:
+            limit = self.requests_per_minute.get(model_name, self.default_requests_per_minute)
+            bucket = None
+            if limit is not None:
+                path = self.state_dir / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)}.json" if self.state_dir else None
+                bucket = SharedTokenBucket(limit / 60, self.burst or max(1.0, limit / 10), path, self.clock)
+            self._buckets[model_name] = bucket
+        return self._buckets[model_name]
+
+    def acquire(self, model_name: str, priority: Priority = Priority.LIVE, cost: float = 1.0) -> float:
+        """Waits for the turn of a request to a model, in priority order, and takes its slot.
+
+        Args:
+            model_name (str): The name of the model about to be requested.
+            priority (Priority): The priority of the request.
+            cost (float): The number of requests the slot counts for.
+
+        Returns:
+            float: The number of seconds waited.
+
+        Raises:
+            QuotaTimeoutError: If no slot freed up within `max_wait` seconds.
+        """
+        start = time.monotonic()
+        with self._condition:
+            bucket = self._bucket(model_name)
+            if bucket is None:
+                return 0.0
+            # Background requests leave a reserve to live ones, as far as the bucket's capacity allows
+            reserve = min(self.background_reserve * bucket.capacity, max(bucket.capacity - cost, 0.0)) if priority != Priority.LIVE else 0.0
+            ticket = (priority, next(self._sequence))
+            waiters = self._waiters[model_name]
+            heapq.heappush(waiters, ticket)
+            try:
+                while True:
+                    wait = bucket.try_acquire(cost, reserve) if waiters[0] == ticket else POLL_INTERVAL
+                    if wait == 0:
+                        return time.monotonic() - start
+                    remaining = None if self.max_wait is None else self.max_wait - (time.monotonic() - start)
+                    if remaining is not None and remaining <= 0:
+                        raise QuotaTimeoutError(f"No request slot for model {model_name} within {self.max_wait} s.")
+                    self._condition.wait(min(wait, POLL_INTERVAL, remaining if remaining is not None else POLL_INTERVAL))
+            finally:
+                waiters.remove(ticket)
+                heapq.heapify(waiters)
+                self._condition.notify_all()
+
+    def wait_time(self, model_name: str) -> float:
+        """Returns the estimated number of seconds before a request to a model can be sent."""
+        with self._condition:
+            bucket = self._bucket(model_name)
+        return bucket.wait_time() if bucket is not None else 0.0
+
+    def rank(self, model_names: list[str]) -> list[str]:
+        """Orders models by how soon a request to them can be sent, keeping the given order among equals.
+
+        Args:
+            model_names (list[str]): The models in their order of preference.
+
+        Returns:
+            list[str]: The same models, those that can be requested right away first.
+        """
+        wait_times = {model_name: self.wait_time(model_name) for model_name in model_names}
+        return sorted(model_names, key=wait_times.__getitem__)
+
+    def record_rate_limited(self, model_name: str, retry_after: float | None = None) -> float:
+        """Backs off a model that answered with a 429, for every process sharing its bucket.
+
+        Args:
+            model_name (str): The name of the rate limited model.
+            retry_after (float|None): The delay requested by the server, if known.
+
+        Returns:
+            float: The back-off in seconds.
+        """
+        with self._condition:
+            self._consecutive_rate_limits[model_name] += 1
+            backoff = retry_after or min(self.backoff_max, self.backoff_base * 2 ** (self._consecutive_rate_limits[model_name] - 1))
+            bucket = self._bucket(model_name)
+        if bucket is None:
+            return 0.0
+        bucket.block(backoff)
+        return backoff
+
+    def record_success(self, model_name: str) -> None:
+        """Resets the back-off of a model after a successful request."""
+        with self._condition:
+            self._consecutive_rate_limits[model_name] = 0
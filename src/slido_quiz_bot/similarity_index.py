@@ -0,0 +1,196 @@
+"""This module answers reworded versions of previously answered questions from a local lexical index.
+
+The `AnswerCache` only recognizes a question asked again with the exact same wording. The
+`SimilarityIndex` keeps every answered question in an inverted index of its words and answers a new
+question from the most similar past one, when the TF-IDF cosine similarity of their texts reaches a
+threshold. A bag of words cannot tell "Which planet is the largest?" from "Which planet is NOT the
+largest?" or "Which planet is the smallest?", so a past question is only a candidate when:
+
+- it was asked with the same set of choices, in any order;
+- it uses the same `CONTRAST_TERMS` (negations, superlatives and comparatives) as the new question.
+
+The index is persisted as an append-only JSONL log, one answered question per line, which is replayed
+when the index is opened. Adding a question updates the index in place, so it is available to the very
+next lookup; the word statistics (IDF) are computed at lookup time from the current postings.
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from slido_quiz_bot.answer_cache import cache_key, find_choice, normalize_text
+from slido_quiz_bot.quizz_question import QuizQuestion
+
+_WORD_RE = re.compile(r"\w+")
+
+# Words that flip or change the meaning of an otherwise identical question: two questions only match if
+# they use the same ones. Contractions such as "isn't" are split by `tokenize` into "isn" and "t".
+CONTRAST_TERMS = frozenset({
+    *("not", "no", "never", "none", "neither", "nor", "except", "without", "cannot", "false", "incorrect", "untrue", "wrong"),
+    *("isn", "aren", "wasn", "weren", "doesn", "don", "didn", "hasn", "haven", "hadn", "couldn", "shouldn", "wouldn", "t"),
+    *("most", "least", "fewest", "more", "less", "fewer", "best", "worst", "better", "worse", "first", "last"),
+    *("largest", "smallest", "biggest", "larger", "smaller", "bigger", "highest", "lowest", "higher", "lower", "maximum", "minimum"),
+    *("longest", "shortest", "longer", "shorter", "tallest", "oldest", "youngest", "newest", "older", "younger", "newer"),
+    *("earliest", "latest", "earlier", "later", "before", "after", "fastest", "slowest", "faster", "slower"),
+    *("hottest", "coldest", "warmest", "heaviest", "lightest", "heavier", "lighter", "deepest", "shallowest"),
+    *("closest", "nearest", "farthest", "furthest", "above", "below", "inner", "outer"),
+})
+
+
+def tokenize(text: str) -> list[str]:
+    """Splits a piece of quiz text into normalized words.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list[str]: The normalized words of the text.
+
+    Example:
+        >>> tokenize("What's the Capital of FRANCE?")
+        ['what', 's', 'the', 'capital', 'of', 'france']
+    """
+    return _WORD_RE.findall(normalize_text(text))
+
+
+def choice_set(quiz_question: QuizQuestion) -> list[str]:
+    """Returns the normalized choices of a quiz question, sorted so that their order does not matter."""
+    return sorted(normalize_text(choice) for choice in quiz_question.answer_choices)
+
+
+class SimilarityIndex:
+    """An incrementally updated TF-IDF index of answered quiz questions.
+
+    Attributes:
+        path (Path|None): The path of the JSONL log, or None for an in-memory index.
+        threshold (float): The minimum cosine similarity (between 0 and 1) for a past question to answer a new one.
+        hits (int): The number of lookups answered from the index.
+        misses (int): The number of lookups that found no similar enough question.
+    """
+
+    def __init__(self, path: str | Path | None = None, threshold: float = 0.85):
+        """Opens the index, replaying its log if the file exists.
+
+        Args:
+            path (str|Path|None): The path of the JSONL log, or None for an in-memory index.
+            threshold (float): The minimum cosine similarity (between 0 and 1) for a past question to answer a new one.
+
+        Raises:
+            ValueError: If the threshold is not between 0 and 1.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("The similarity threshold must be in (0, 1].")
+
+        self.path = Path(path) if path else None
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, tuple[Counter, str, tuple[str, ...] | None]] = {}
+        self._postings: dict[str, dict[str, int]] = defaultdict(dict)
+        self._lock = threading.Lock()
+        if self.path is not None and self.path.exists():
+            with self.path.open(encoding="utf-8") as log:
+                for line in log:
+                    if line.strip():
+                        record = json.loads(line)
+                        choices = record.get("choices")
+                        self._index(record["key"], record["question"], record["answer"], tuple(choices) if choices is not None else None)
+
+    def _index(self, key: str, question: str, answer_text: str, choices: tuple[str, ...] | None) -> None:
+        """Adds or replaces an entry in the postings (the lock must be held, or the index not yet shared).
+
+        Entries replayed from logs written before the choices were recorded have no choices, and never match.
+        """
+        if key in self._entries:
+            for term in self._entries[key][0]:
+                del self._postings[term][key]
+        term_counts = Counter(tokenize(question))
+        self._entries[key] = (term_counts, answer_text, choices)
+        for term, count in term_counts.items():
+            self._postings[term][key] = count
+
+    def add(self, quiz_question: QuizQuestion, answer_index: int) -> None:
+        """Adds an answered question to the index and to its log.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question that was answered.
+            answer_index (int): The index of the chosen answer in the question's choices.
+
+        Raises:
+            IndexError: If `answer_index` is out of range for the question's choices.
+        """
+        answer_text = quiz_question.answer_choices[answer_index]
+        key = cache_key(quiz_question)
+        choices = choice_set(quiz_question)
+        with self._lock:
+            if key in self._entries and self._entries[key][1:] == (answer_text, tuple(choices)):
+                return
+            self._index(key, quiz_question.question, answer_text, tuple(choices))
+            if self.path is not None:
+                with self.path.open("a", encoding="utf-8") as log:
+                    record = {"key": key, "question": quiz_question.question, "answer": answer_text, "choices": choices}
+                    log.write(json.dumps(record) + "\n")
+
+    def _idf(self, term: str) -> float:
+        """Returns the smoothed inverse document frequency of a term, highest for unseen terms (the lock must be held)."""
+        return math.log((1 + len(self._entries)) / (1 + len(self._postings.get(term, ())))) + 1
+
+    def similar(self, quiz_question: QuizQuestion) -> list[tuple[float, str]]:
+        """Returns the past answers of the comparable questions sharing words with a quiz question, most similar first.
+
+        A past question is comparable if it has the same choice set and the same contrast terms as the quiz question.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question to look up.
+
+        Returns:
+            list[tuple[float, str]]: The cosine similarity and the answer text of every comparable past question sharing a word.
+        """
+        query_counts = Counter(tokenize(quiz_question.question))
+        query_contrast = CONTRAST_TERMS.intersection(query_counts)
+        query_choices = tuple(choice_set(quiz_question))
+        with self._lock:
+            idf = {term: self._idf(term) for term in query_counts}
+            dot_products = defaultdict(float)
+            for term, query_count in query_counts.items():
+                for key, count in self._postings.get(term, {}).items():
+                    dot_products[key] += query_count * count * idf[term] ** 2
+            query_norm = math.sqrt(sum((count * idf[term]) ** 2 for term, count in query_counts.items()))
+            results = []
+            for key, dot_product in dot_products.items():
+                term_counts, answer_text, choices = self._entries[key]
+                if choices != query_choices or CONTRAST_TERMS.intersection(term_counts) != query_contrast:
+                    continue
+                norm = math.sqrt(sum((count * self._idf(term)) ** 2 for term, count in term_counts.items()))
+                if dot_product and norm and query_norm:
+                    results.append((min(dot_product / (norm * query_norm), 1.0), answer_text))
+        return sorted(results, key=lambda result: result[0], reverse=True)
+
+    def lookup(self, quiz_question: QuizQuestion) -> int | None:
+        """Answers a quiz question from the most similar past question whose answer is among its choices.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question to answer.
+
+        Returns:
+            int|None: The index of the answer within the question's current choices, or None if no past question is similar enough.
+        """
+        for similarity, answer_text in self.similar(quiz_question):
+            if similarity < self.threshold:
+                break
+            answer_index = find_choice(quiz_question, answer_text)
+            if answer_index is not None:
+                with self._lock:
+                    self.hits += 1
+                return answer_index
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def __len__(self) -> int:
+        """Returns the number of questions in the index."""
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,148 @@
+"""This module coalesces identical quiz questions asked by concurrent participants into one model call.
+
+When several participants of the same event see the same poll, only the first one (the leader)
+asks the model; the others wait for the leader's result. The shared answer is passed around as
+text, so each participant resolves it against its own (possibly shuffled) answer choices before
+an answer strategy decides which choice that participant actually submits.
+"""
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, InvalidStateError
+
+from slido_quiz_bot.answer_cache import cache_key, find_choice
+from slido_quiz_bot.answer_quiz_question import answer_quiz_question
+from slido_quiz_bot.quizz_question import QuizQuestion
+
+AnswerStrategy = Callable[[int, QuizQuestion, int], int]
+
+
+def consensus_strategy(answer_index: int, quiz_question: QuizQuestion, participant_index: int) -> int:
+    """Every participant submits the model's answer."""
+    return answer_index
+
+
+def spread_strategy(answer_index: int, quiz_question: QuizQuestion, participant_index: int) -> int:
+    """The first participant submits the model's answer and the others cycle through the remaining choices.
+
+    This hedges against a wrong model answer by making sure every choice is picked by someone.
+    """
+    return (answer_index + participant_index) % len(quiz_question.answer_choices)
+
+
+ANSWER_STRATEGIES: dict[str, AnswerStrategy] = {
+    "consensus": consensus_strategy,
+    "spread": spread_strategy,
+}
+
+
+class AnswerCoordinator:
+    """Deduplicates in-flight model calls for identical quiz questions.
+
+    Questions are considered identical when they share the same normalized text and choice set
+    (see `cache_key`). The coordinator is thread-safe and can be used from worker threads as well
+    as from coroutines through `answer_async`.
+
+    Attributes:
+        model_calls (int): The number of times the answer function was actually called.
+        coalesced (int): The number of requests that were served by another participant's call.
+    """
+
+    def __init__(self, answer_fn: Callable[[QuizQuestion], int] = answer_quiz_question, strategy: str | AnswerStrategy = "consensus"):
+        """Initializes the coordinator.
+
+        Args:
+            answer_fn (Callable[[QuizQuestion], int]): The function asking the model for the index of the best answer.
+            strategy (str|AnswerStrategy): The name of one of `ANSWER_STRATEGIES`, or a custom strategy callable.
+
+        Raises:
+            ValueError: If the strategy name is unknown.
+        """
+        if isinstance(strategy, str):
+            if strategy not in ANSWER_STRATEGIES:
+                raise ValueError(f"Unknown answer strategy '{strategy}'. Expected one of: {', '.join(ANSWER_STRATEGIES)}.")
+            strategy = ANSWER_STRATEGIES[strategy]
+
+        self.answer_fn = answer_fn
+        self.strategy = strategy
+        self.model_calls = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._in_flight: dict[str, Future] = {}
+
+    def _join(self, quiz_question: QuizQuestion) -> tuple[Future, bool]:
+        """Returns the shared future of a question and whether the caller is the leader that must resolve it."""
+        key = cache_key(quiz_question)
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._in_flight[key] = future
+            self.model_calls += 1
+            return future, True
+
+    def _lead(self, quiz_question: QuizQuestion, future: Future) -> None:
+        """Calls the answer function and publishes its result (as answer text) to every waiting participant.
+
+        A future that was already resolved or cancelled is left as it is.
+        """
+        try:
+            answer_index = self.answer_fn(quiz_question)
+            result, error = quiz_question.answer_choices[answer_index], None
+        except BaseException as e:
+            result, error = None, e
+        try:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+        except InvalidStateError:
+            pass
+        finally:
+            with self._lock:
+                self._in_flight.pop(cache_key(quiz_question), None)
+
+    def _resolve(self, quiz_question: QuizQuestion, answer_text: str, participant_index: int) -> int:
+        """Maps the shared answer text onto the participant's choices and applies the answer strategy."""
+        answer_index = find_choice(quiz_question, answer_text)
+        if answer_index is None:
+            raise ValueError(f"The shared answer '{answer_text}' is not one of the question's choices.")
+        return self.strategy(answer_index, quiz_question, participant_index)
+
+    def answer(self, quiz_question: QuizQuestion, participant_index: int = 0) -> int:
+        """Answers a quiz question, sharing the model call with concurrent identical requests.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question as seen by the participant.
+            participant_index (int): The index of the participant, passed on to the answer strategy.
+
+        Returns:
+            int: The index of the choice this participant should submit.
+        """
+        future, is_leader = self._join(quiz_question)
+        if is_leader:
+            self._lead(quiz_question, future)
+        return self._resolve(quiz_question, future.result(), participant_index)
+
+    async def answer_async(self, quiz_question: QuizQuestion, participant_index: int = 0) -> int:
+        """Answers a quiz question from a coroutine without holding a worker thread while waiting.
+
+        Only the leader runs the (blocking) answer function in a worker thread; the other participants
+        simply await the shared result. The shared result is shielded, so cancelling one participant's
+        task (e.g. on a speculative restart) leaves the call and the other participants unaffected.
+
+        Args:
+            quiz_question (QuizQuestion): The quiz question as seen by the participant.
+            participant_index (int): The index of the participant, passed on to the answer strategy.
+
+        Returns:
+            int: The index of the choice this participant should submit.
+        """
+        future, is_leader = self._join(quiz_question)
+        if is_leader:
+            await asyncio.to_thread(self._lead, quiz_question, future)
+        answer_text = await asyncio.shield(asyncio.wrap_future(future))
+        return self._resolve(quiz_question, answer_text, participant_index)
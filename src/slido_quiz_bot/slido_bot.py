@@ -4,16 +4,69 @@ It uses Playwright to simulate user actions in a browser, such as filling in the
 waiting for quiz questions, selecting the correct answers, and submitting the responses.
 """
 
+import contextvars
 import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 from rich.console import Console
 
-from slido_quiz_bot.answer_quiz_question import answer_quiz_question
+from slido_quiz_bot import flight_recorder
+from slido_quiz_bot.answer_cache import AnswerCache
+from slido_quiz_bot.answer_quiz_question import answer_quiz_question, warm_up_default_answerer
+from slido_quiz_bot.memory import BYTES_PER_MB, MemorySampler, js_heap_usage_sync, launch_args
+from slido_quiz_bot.metrics import get_metrics, labels
+from slido_quiz_bot.network_filter import NetworkFilter, load_network_profile
+from slido_quiz_bot.question_watcher import (
+    NEXT_QUESTION_EXPRESSION,
+    OPTIONS_CHANGED_EXPRESSION,
+    QUESTION_WATCHER_SCRIPT,
+    SNAPSHOT_EXPRESSION,
+    QuestionSnapshot,
+    option_selector,
+    question_number,
+)
 from slido_quiz_bot.quizz_question import QuizQuestion
 
 console = Console()
 
+SEND_BUTTON_SELECTOR = 'button.poll__btn-submit.btn-primary.doubleScalePulse[type="button"]'
+
+PARTICIPANT_NAME_SELECTOR = 'input[name="participantName"]'
+
+# The 'Join' button of the name form: the only primary button shown at that point, since the hidden 'Send' button is one too
+# and Playwright's strict mode counts hidden elements
+JOIN_BUTTON_SELECTOR = ".btn-primary:visible"
+
+# Elements of Slido's markup only shown once a participant has joined the event: the question counter, or the poll title
+JOINED_PAGE_SELECTORS = ("[data-testid='question-counter']", "[data-testid='poll-title']")
+
+# Whichever of the name form and the joined event page is shown first
+REJOIN_CHECK_SELECTOR = ", ".join(f"{selector}:visible" for selector in (PARTICIPANT_NAME_SELECTOR, *JOINED_PAGE_SELECTORS))
+
+# How long (in ms) a participant restored from a saved storage state waits for the name form or the joined event page
+# before assuming it has rejoined
+REJOIN_CHECK_TIMEOUT = 3_000
+
+# How many times a speculative answer is restarted because the answer choices changed
+MAX_SPECULATIVE_RESTARTS = 3
+
+# How long (in ms) the page stays open after the last answer, so that its submission reaches the server before the browser closes
+LAST_ANSWER_GRACE_PERIOD = 1_000
+
+# How long (in ms) each in-page wait for changed answer choices lasts while the model is answering
+OPTIONS_CHECK_INTERVAL = 25
+
+# Playwright errors raised when the page navigates or reloads during an evaluation, discarding its document
+NAVIGATION_ERROR_MESSAGES = ("Execution context was destroyed", "Cannot find context with specified id")
+
+# Model calls run in the background while the page keeps being driven from the main thread
+_model_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slido-quiz-bot-model")
+
 
 def enter_participant_name(page, participant_name):
     """Enters the participant's name into the Slido quiz form and submits it.
@@ -31,7 +84,7 @@ def enter_participant_name(page, participant_name):
 
     try:
         # Wait for the participant name input field to be visible
-        name_input_locator = page.locator('input[name="participantName"]')
+        name_input_locator = page.locator(PARTICIPANT_NAME_SELECTOR)
         name_input_locator.wait_for(state="visible")
 
         # Enter the participant name into the input field
@@ -41,7 +94,7 @@ def enter_participant_name(page, participant_name):
         name_input_locator.click()
 
         # Click the submit button
-        submit_button = page.locator(".btn-primary")
+        submit_button = page.locator(JOIN_BUTTON_SELECTOR)
         submit_button.click()
         console.log(f"[bold blue]Successfully entered participant name: [bold green]{participant_name}[/bold green].")
 
@@ -51,81 +104,185 @@ def enter_participant_name(page, participant_name):
         raise Exception(f"An error occurred while entering the participant name: {str(e)}") from e
 
 
-def wait_for_question(page, timeout=120_000):
-    """Waits for the 'Send' button on the page to become visible and active.
+def storage_state_path(state_dir, participant_name):
+    """Returns the path where the storage state (cookies and local storage) of a participant is saved.
+
+    Args:
+        state_dir (str|Path): The directory of the saved storage states.
+        participant_name (str): The name of the participant.
+
+    Returns:
+        Path: The path of the participant's storage state file.
+
+    Example:
+        >>> storage_state_path("states", "Alan Turing 2").as_posix()
+        'states/Alan_Turing_2.json'
+    """
+    return Path(state_dir) / f"{re.sub(r'[^A-Za-z0-9_-]+', '_', participant_name).strip('_') or 'participant'}.json"
 
-    This indicates that the page is ready to receive user input for the question.
+
+def needs_participant_name(page, timeout=REJOIN_CHECK_TIMEOUT):
+    """Checks whether the page asks for the participant's name, i.e. whether the participant still has to join.
+
+    The check returns as soon as either the name form or the event page of a joined participant is shown,
+    so a participant that has rejoined does not wait for the whole timeout.
 
     Args:
         page: The Playwright page object representing the browser page.
-        timeout (int): Maximum time in milliseconds to wait for the 'Send' button to appear. Default is 120,000 ms.
+        timeout (int): How long in milliseconds to wait for the name form or the joined event page.
 
     Returns:
-        bool: True if the 'Send' button becomes visible within the timeout period, False otherwise.
+        bool: True if the name form is shown, False if the participant has already joined.
+    """
+    try:
+        page.locator(REJOIN_CHECK_SELECTOR).first.wait_for(state="visible", timeout=timeout)
+    except PlaywrightTimeoutError:
+        return False
+    return page.locator(PARTICIPANT_NAME_SELECTOR).is_visible()
+
+
+def install_question_watcher(page):
+    """Installs the in-page question watcher on the page.
+
+    The watcher is registered as an init script, so it survives reloads and is in place before
+    the first DOM mutation, and it is also evaluated right away in case the page is already loaded.
+
+    Args:
+        page: The Playwright page object representing the browser page.
+    """
+    page.add_init_script(QUESTION_WATCHER_SCRIPT)
+    page.evaluate(QUESTION_WATCHER_SCRIPT)
+
+
+def wait_for_question(page, timeout=120_000, previous_question=None):
+    """Waits until a new question is ready to be answered.
+
+    The wait happens inside the page: the question watcher's `MutationObserver` resolves it as soon as
+    a poll title together with a visible 'Send' button appears, without polling or fixed sleeps. If the
+    page navigates or reloads meanwhile, the wait goes on for the rest of the timeout on the new document,
+    where the init script has installed the watcher again.
+
+    Args:
+        page: The Playwright page object representing the browser page.
+        timeout (int): Maximum time in milliseconds to wait for a new question. Default is 120,000 ms.
+        previous_question (str|None): The key of the last answered question, which is not reported again.
+
+    Returns:
+        str: The key identifying the new question (question counter and poll title).
 
     Raises:
-        TimeoutError: If the 'Send' button does not appear within the specified timeout.
+        TimeoutError: If no new question appears within the specified timeout.
         Exception: If any other unexpected error occurs.
     """
-    send_button_locator = page.locator('button:text("Send")')
-    try:
-        send_button_locator.wait_for(state="visible", timeout=timeout)
-        return True
-    except page.TimeoutError as exc:
+    deadline = time.monotonic() + timeout / 1000
+    while True:
+        remaining = max(0, round((deadline - time.monotonic()) * 1000))
+        try:
+            question = page.evaluate(NEXT_QUESTION_EXPRESSION, [previous_question, remaining])
+            break
+        except Exception as e:
+            if is_navigation_error(e) and remaining > 0:
+                continue
+            # Handle unexpected errors
+            raise Exception(f"An unexpected error occurred while waiting for a question: {str(e)}") from e
+
+    if question is None:
         # Raise a specific exception for timeout
-        raise TimeoutError(f"'Send' button did not become visible within {timeout} ms.") from exc
-    except Exception as e:
-        # Handle unexpected errors
-        raise Exception(f"An unexpected error occurred while waiting for the 'Send' button: {str(e)}") from e
+        raise TimeoutError(f"No new question with a 'Send' button appeared within {timeout} ms.")
+    return question
 
 
-def answer_question(page):
-    """Extracts the quiz question, determines the correct answer, and submits it.
+def is_navigation_error(error):
+    """Checks if an error of a page evaluation was caused by the page navigating or reloading.
+
+    Args:
+        error (Exception): The error raised by the evaluation.
+
+    Returns:
+        bool: True if the evaluation was interrupted by a new document, and can be run again on it.
+    """
+    return any(message in str(error) for message in NAVIGATION_ERROR_MESSAGES)
 
-    This function waits for the quiz question to load, retrieves the question and answer choices,
-    computes the correct answer (using placeholder logic), selects it, and submits the response.
+
+def read_question_snapshot(page):
+    """Reads the question, its answer choices and their identifiers, and the question counter in one round-trip.
 
     Args:
-        page: The Playwright page object representing the browser page.
+        page: The Playwright page object representing the browser page, with the question watcher installed.
+
+    Returns:
+        QuestionSnapshot: The question on the page.
 
     Raises:
-        ValueError: If no answer choices are found or if the question/answer cannot be processed.
+        ValueError: If the question text or the answer choices cannot be found.
     """
-    try:
-        # Wait for the quiz question to load
-        question_locator = page.locator('[data-testid="poll-title"]')
-        question_locator.wait_for(state="visible")
-        question_text = question_locator.text_content().strip()
+    snapshot = QuestionSnapshot.from_dict(page.evaluate(SNAPSHOT_EXPRESSION))
+    flight_recorder.record_snapshot(snapshot)
+    return snapshot
 
-        if not question_text:
-            raise ValueError("Question text could not be retrieved.")
 
-        console.log(f"[bold yellow]Question:[/bold yellow] {question_text}")
-
-        # Extract all possible answer choices
-        answer_locator = page.locator(".poll-question-options .MuiFormControlLabel-label")
-        answer_choices = answer_locator.all_text_contents()
+def answer_question(page, cache=None):
+    """Extracts the quiz question, determines the correct answer, and submits it.
 
-        if not answer_choices:
-            raise ValueError("No answer choices found for the quiz.")
+    The model is asked speculatively: as soon as the question and its answer choices are readable,
+    the model call starts in a background thread while the page is prepared for submission (the
+    'Send' button is located). If the answer choices change before the answer is known, the
+    in-flight request is cancelled (or its result discarded) and restarted with the new choices.
 
-        # Compute the correct answer
-        quiz_question = QuizQuestion(
-            question=question_text,
-            answer_choices=answer_choices,
-            correct_answer_index=None,
-        )
-        correct_answer_index = answer_quiz_question(quiz_question)
-        correct_answer = quiz_question.answer_choices[correct_answer_index]
-        console.log(f"[bold green]Answer:[/bold green] {correct_answer}")
+    Args:
+        page: The Playwright page object representing the browser page.
+        cache (AnswerCache|None): An optional answer cache shared across questions and runs.
 
-        # Select the correct answer
-        correct_answer_locator = page.locator(f"input[type='radio'][aria-label='{correct_answer}']")
-        correct_answer_locator.click()
+    Returns:
+        QuestionSnapshot: The snapshot of the answered question, with its question counter.
 
-        # Submit the answer
-        send_button = page.locator('button.poll__btn-submit.btn-primary.doubleScalePulse[type="button"]')
-        send_button.click()
+    Raises:
+        ValueError: If no answer choices are found or if the question/answer cannot be processed.
+    """
+    metrics = get_metrics()
+    try:
+        with metrics.span("extract"):
+            # Read the question, its answer choices and the question counter at once
+            snapshot = read_question_snapshot(page)
+            question_text = snapshot.question
+            console.log(f"[bold yellow]Question:[/bold yellow] {question_text}")
+
+        with metrics.span("answer"):
+            # Start computing the correct answer while the page is prepared for submission
+            quiz_question = QuizQuestion(
+                question=question_text,
+                answer_choices=snapshot.options,
+                correct_answer_index=None,
+            )
+            answer_future = _model_executor.submit(contextvars.copy_context().run, answer_quiz_question, quiz_question, cache)
+            send_button = page.locator(SEND_BUTTON_SELECTOR)
+            send_button.wait_for(state="visible")
+
+            # Restart the model call if the answer choices change before the answer is known
+            for _ in range(MAX_SPECULATIVE_RESTARTS):
+                changed_snapshot = wait_for_answer_or_changed_options(page, answer_future, quiz_question.answer_choices)
+                if changed_snapshot is None:
+                    break
+                console.log("[bold yellow]Answer choices changed, asking again...")
+                metrics.increment("speculative_restarts")
+                answer_future.cancel()
+                snapshot = changed_snapshot
+                if snapshot.question != quiz_question.question:
+                    console.log(f"[bold yellow]Question:[/bold yellow] {snapshot.question}")
+                quiz_question = QuizQuestion(question=snapshot.question, answer_choices=snapshot.options, correct_answer_index=None)
+                answer_future = _model_executor.submit(contextvars.copy_context().run, answer_quiz_question, quiz_question, cache)
+            correct_answer_index = answer_future.result()
+            correct_answer = quiz_question.answer_choices[correct_answer_index]
+            console.log(f"[bold green]Answer:[/bold green] {correct_answer}")
+
+        with metrics.span("submit"):
+            # Select the correct answer by its identifier, which needs no quoting unlike its label
+            correct_answer_locator = page.locator(option_selector(snapshot.option_ids[correct_answer_index]))
+            correct_answer_locator.click()
+
+            # Submit the answer
+            send_button.click()
+        return snapshot
 
     except ValueError as ve:
         console.log(f"[bold red]Error:[/bold red] {ve}")
@@ -135,6 +292,29 @@ def answer_question(page):
         raise
 
 
+def wait_for_answer_or_changed_options(page, answer_future, answer_choices):
+    """Waits until the model answer is ready or the answer choices on the page change, whichever comes first.
+
+    The sync Playwright API cannot wait on the page and on the model thread at the same time, so the
+    in-page wait is split into short slices of `OPTIONS_CHECK_INTERVAL` ms between checks of the future.
+
+    Args:
+        page: The Playwright page object representing the browser page.
+        answer_future (concurrent.futures.Future): The in-flight model call.
+        answer_choices (list[str]): The answer choices the model call was made with.
+
+    Returns:
+        QuestionSnapshot|None: The snapshot of the question with its new answer choices if they changed, or None once the answer is ready.
+    """
+    while not answer_future.done():
+        changed_snapshot = page.evaluate(OPTIONS_CHANGED_EXPRESSION, [answer_choices, OPTIONS_CHECK_INTERVAL])
+        if changed_snapshot is not None:
+            snapshot = QuestionSnapshot.from_dict(changed_snapshot)
+            flight_recorder.record_snapshot(snapshot)
+            return snapshot
+    return None
+
+
 def is_last_question(page):
     """Checks if the current question is the last question based on the question counter.
 
@@ -147,45 +327,222 @@ def is_last_question(page):
     Raises:
         ValueError: If the question counter cannot be parsed or is invalid.
     """
-    try:
-        # Get the question counter text
-        question_counter_text = page.locator("[data-testid='question-counter']").text_content().strip()
+    # Get the question counter text
+    question_counter_text = page.locator("[data-testid='question-counter']").text_content().strip()
+
+    # Check if the current question is the last one
+    return is_last_question_counter(question_counter_text)
+
+
+def is_last_question_counter(question_counter_text):
+    """Checks if a question counter (e.g., "3/3") shows the last question.
+
+    Args:
+        question_counter_text (str): The text content of the question counter.
+
+    Returns:
+        bool: True if the counter shows the last question, False otherwise.
+
+    Raises:
+        ValueError: If the question counter cannot be parsed or is invalid.
+    """
+    questions_answered, total_questions = parse_question_counter(question_counter_text)
+    return questions_answered == total_questions
 
-        # Parse the ratio of answered questions (e.g., "1/1")
-        questions_answered, total_questions = map(int, question_counter_text.split("/"))
 
-        # Check if the current question is the last one
-        return questions_answered == total_questions
+def parse_question_counter(question_counter_text):
+    """Parses the text of the question counter (e.g., "1/3").
 
+    Args:
+        question_counter_text (str): The text content of the question counter.
+
+    Returns:
+        tuple[int, int]: The number of the current question and the total number of questions.
+
+    Raises:
+        ValueError: If the question counter cannot be parsed or is invalid.
+    """
+    try:
+        questions_answered, total_questions = map(int, question_counter_text.split("/"))
     except ValueError as exc:
         raise ValueError(f"Invalid question counter format: '{question_counter_text}'. Expected 'answered/total'.") from exc
+    return questions_answered, total_questions
+
+
+def page_html(page):
+    """Returns the HTML of a page for a flight record, or None if it cannot be read (e.g. the page crashed)."""
+    try:
+        return page.content()
+    except Exception:
+        return None
 
 
-def respond_to_slido_quiz(quiz_url, participant_name):
+def install_network_filter(target, network_filter):
+    """Routes the requests of a page or browser context through a network filter.
+
+    Nothing is routed when the filter's profile blocks nothing, so that the "off" profile costs nothing.
+
+    Args:
+        target: The Playwright page or browser context.
+        network_filter (NetworkFilter): The filter deciding which requests to block.
+    """
+    if network_filter.profile.is_enabled:
+        target.route("**/*", network_filter.handle_route)
+    target.on("response", network_filter.record_response)
+
+
+def open_participant_page(browser, quiz_url, participant_name, network_filter, storage_state=None):
+    """Opens the event in a new context, filling in the name form unless the storage state rejoins the participant.
+
+    Args:
+        browser: The Playwright browser.
+        quiz_url (str): The URL of the Slido quiz.
+        participant_name (str): The name of the participant.
+        network_filter (NetworkFilter): The filter applied to the participant's requests.
+        storage_state (str|Path|dict|None): The storage state to restore, as a file or as returned by `storage_state()`.
+
+    Returns:
+        tuple: The new context, its page showing the event, and whether the storage state rejoined the participant.
+    """
+    context = browser.new_context(storage_state=storage_state)
+    try:
+        install_network_filter(context, network_filter)
+        page = context.new_page()
+        install_question_watcher(page)
+        page.goto(quiz_url)
+        rejoined = storage_state is not None and not needs_participant_name(page)
+        if not rejoined:
+            enter_participant_name(page, participant_name)
+    except BaseException:
+        context.close()
+        raise
+    return context, page, rejoined
+
+
+def respond_to_slido_quiz(
+    quiz_url,
+    participant_name,
+    cache_path=None,
+    warm_up=True,
+    network_profile="default",
+    state_dir=None,
+    launch_profile="default",
+    memory_budget_mb=None,
+):
     """Function to automatically respond to a Slido quiz.
 
     Args:
         quiz_url (str): The URL of the Slido quiz.
         participant_name (str): The name of the participant to enter in the quiz.
+        cache_path (str|None): The path of a persistent answer cache, or None to always ask the model.
+        warm_up (bool): Whether to warm up the model clients in the background while the browser starts.
+        network_profile (str): The name of a built-in network profile, or the path of a JSON profile.
+        state_dir (str|None): A directory where the participant's storage state is saved, so that a restarted bot
+            rejoins without filling in the name form again. Disabled by default.
+        launch_profile (str): The name of the `memory.LAUNCH_PROFILES` entry whose Chromium switches the browser is launched with.
+        memory_budget_mb (float|None): The JavaScript heap, in MB, past which the participant's context is replaced between
+            questions by a fresh one restoring its storage state, or None to keep the same context throughout.
+
+    Returns:
+        MemoryReport|None: The peak memory of the browser, or None if it cannot be measured on this system.
     """
-    with sync_playwright() as p:
+    cache = AnswerCache(cache_path) if cache_path else None
+    network_filter = NetworkFilter(load_network_profile(network_profile))
+    browser_args = launch_args(launch_profile)
+    state_path = storage_state_path(state_dir, participant_name) if state_dir else None
+    has_saved_state = state_path is not None and state_path.is_file()
+    recycles = 0
+    if warm_up:
+        _model_executor.submit(warm_up_default_answerer)
+    with sync_playwright() as p, MemorySampler() as memory_sampler:
         # Enter quiz url
         is_docker_env = bool(os.getenv("HOSTNAME"))
-        browser = p.chromium.launch(headless=is_docker_env)
-        page = browser.new_page()
-        page.goto(quiz_url)
-
-        enter_participant_name(page, participant_name)
-
-        with console.status("[bold blue]Waiting for a Question..."):
+        browser = p.chromium.launch(headless=is_docker_env, args=browser_args)
+        context, page, rejoined = open_participant_page(browser, quiz_url, participant_name, network_filter, state_path if has_saved_state else None)
+        if rejoined:
+            console.log(f"[bold blue]Rejoined from the saved state of: [bold green]{participant_name}[/bold green].")
+        if state_path is not None:
+            page.locator(PARTICIPANT_NAME_SELECTOR).wait_for(state="hidden")
+            state_path.parent.mkdir(parents=True, exist_ok=True)
+            context.storage_state(path=state_path)
+
+        metrics = get_metrics()
+        with console.status("[bold blue]Waiting for a Question..."), labels(participant=participant_name):
             is_last_question_answered = False
+            question = None
             while not is_last_question_answered:
                 try:
-                    wait_for_question(page, timeout=120_000)
-                    answer_question(page)
-                    is_last_question_answered = is_last_question(page)
-                    page.wait_for_timeout(1000)
+                    with metrics.span("detect"):
+                        question = wait_for_question(page, timeout=120_000, previous_question=question)
+                    with labels(question=question_number(question)), metrics.span("question"):
+                        snapshot = answer_question(page, cache=cache)
+                        # The question may have changed while it was answered: do not detect the answered one again
+                        question = snapshot.key
+                        with metrics.span("check_last"):
+                            is_last_question_answered = is_last_question_counter(snapshot.counter)
+                    if memory_budget_mb is not None and not is_last_question_answered and exceeds_memory_budget(context, page, memory_budget_mb):
+                        metrics.increment("context_recycles")
+                        with metrics.span("recycle"):
+                            context, page = recycle_context(browser, context, quiz_url, participant_name, network_filter, state_path)
+                        recycles += 1
                 except Exception as e:
+                    if flight_recorder.get_recorder() is not None:
+                        path = flight_recorder.dump("failure", error=repr(e), page_html=page_html(page))
+                        console.log(f"[bold red]Flight record:[/bold red] {path}")
                     raise ConnectionAbortedError(f"Error during quiz interaction: {e}") from e
+            page.wait_for_timeout(LAST_ANSWER_GRACE_PERIOD)
         browser.close()
-        console.log("[bold blue]Quiz Completed[/bold blue] - All questions have been answered and submitted successfully.")
+    console.log(f"[bold blue]Network:[/bold blue] {network_filter.summary()}.")
+    if cache is not None:
+        console.log(f"[bold blue]Answer cache:[/bold blue] {cache.hits} hits, {cache.misses} misses.")
+        cache.close()
+    memory_report = memory_sampler.report(1, recycles)
+    if memory_report is not None:
+        console.log(f"[bold blue]Memory:[/bold blue] {memory_report.summary()}.")
+    console.log("[bold blue]Quiz Completed[/bold blue] - All questions have been answered and submitted successfully.")
+    return memory_report
+
+
+def exceeds_memory_budget(context, page, memory_budget_mb):
+    """Checks whether the JavaScript heap of the participant's page exceeds its memory budget.
+
+    Args:
+        context: The participant's Playwright browser context.
+        page: The participant's page.
+        memory_budget_mb (float): The memory budget of the page's JavaScript heap, in MB.
+
+    Returns:
+        bool: True if the context should be recycled.
+    """
+    heap = js_heap_usage_sync(context, page)
+    flight_recorder.record("memory", js_heap=heap)
+    if heap <= memory_budget_mb * BYTES_PER_MB:
+        return False
+    console.log(f"[bold yellow]JavaScript heap at {heap / BYTES_PER_MB:.0f} MB exceeds {memory_budget_mb:g} MB, recycling the context...")
+    return True
+
+
+def recycle_context(browser, context, quiz_url, participant_name, network_filter, state_path=None):
+    """Replaces a participant's context with a fresh one restoring its storage state, freeing the memory of the old page.
+
+    The new context is ready before the old one is closed, so the participant's session is never left without a page.
+
+    Args:
+        browser: The Playwright browser.
+        context: The participant's current context, closed once replaced.
+        quiz_url (str): The URL of the Slido quiz.
+        participant_name (str): The name of the participant.
+        network_filter (NetworkFilter): The filter applied to the participant's requests.
+        state_path (Path|None): The file where the participant's storage state is saved, if any.
+
+    Returns:
+        tuple: The new context and its page showing the event.
+    """
+    storage_state = context.storage_state()
+    new_context, page, rejoined = open_participant_page(browser, quiz_url, participant_name, network_filter, storage_state)
+    if not rejoined:
+        console.log("[bold red]Lost the session while recycling the context, joined again by name.")
+    context.close()
+    if state_path is not None:
+        new_context.storage_state(path=state_path)
+    return new_context, page
@@ -0,0 +1,467 @@
+"""This module provides a local stand-in for a Slido event, for offline end-to-end and load tests.
+
+The server serves a participant page that reproduces the DOM contract the bot relies on (the
+`participantName` input, the `.btn-primary` join button, the `poll-title`, the options with their
+`MuiFormControlLabel-label` and radio `aria-label`s, the `poll__btn-submit` button and the
+`question-counter`) and pushes a scripted sequence of questions to every participant. As on Slido,
+the 'Send' button is a `.btn-primary` too, hidden until a question opens.
+
+The page talks to the server through a small JSON/event-stream protocol, which browserless clients
+can use directly:
+
+    POST /api/participants           {"name": ...}                                -> {"participant_id": ...}
+    GET  /api/stream?participant_id  text/event-stream of `state` events (see `SlidoStandInServer.state`)
+    POST /api/votes                  {"participant_id": ..., "poll_id": ..., "option_id": ...}
+    GET  /api/results                the time-to-answer of every vote
+
+Questions are pushed with server-sent events rather than websockets, which keeps the server within
+the standard library while still pushing every change as it happens.
+"""
+
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from slido_quiz_bot.quizz_question import QuizQuestion
+
+PARTICIPANT_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <title>Slido stand-in</title>
+  <style>
+    body { font-family: sans-serif; max-width: 40rem; margin: 2rem auto; }
+    .MuiFormControlLabel-root { display: block; margin: 0.5rem 0; }
+  </style>
+</head>
+<body>
+  <form id="join">
+    <input name="participantName" placeholder="Your name" autocomplete="off">
+    <button type="submit" class="btn btn-primary">Join</button>
+  </form>
+  <main id="event" hidden>
+    <span data-testid="question-counter"></span>
+    <p id="status">Waiting for a question...</p>
+    <section id="poll" hidden>
+      <h2 data-testid="poll-title"></h2>
+      <div class="poll-question-options"></div>
+      <button type="button" class="poll__btn-submit btn-primary doubleScalePulse">Send</button>
+    </section>
+  </main>
+  <script>
+    const $ = (selector) => document.querySelector(selector);
+    const post = (path, body) =>
+      fetch(path, { method: "POST", headers: { "Content-Type": "application/json" }, body: JSON.stringify(body) }).then((r) => r.json());
+    let participantId = localStorage.getItem("participantId");
+    let renderedPoll = null;
+
+    const render = (state) => {
+      // As on Slido, the question counter is shown as soon as the participant has joined
+      $("[data-testid='question-counter']").textContent = `${state.poll ? state.poll.number : 0}/${state.total}`;
+      const poll = state.status === "poll" ? state.poll : null;
+      const answered = poll && state.answered_poll_ids.includes(poll.poll_id);
+      $("#status").textContent = state.status === "finished" ? "The quiz has ended." : answered ? "Thank you!" : "Waiting for a question...";
+      if (!poll) {
+        $("#poll").hidden = true;
+        renderedPoll = null;
+        return;
+      }
+      if (renderedPoll !== poll.poll_id) {
+        renderedPoll = poll.poll_id;
+        $("[data-testid='poll-title']").textContent = poll.question;
+        const options = $(".poll-question-options");
+        options.replaceChildren(
+          ...poll.options.map((option) => {
+            const label = document.createElement("label");
+            label.className = "MuiFormControlLabel-root";
+            const radio = document.createElement("input");
+            radio.type = "radio";
+            radio.name = "option";
+            radio.value = option.id;
+            radio.setAttribute("aria-label", option.label);
+            const text = document.createElement("span");
+            text.className = "MuiFormControlLabel-label";
+            text.textContent = option.label;
+            label.append(radio, text);
+            return label;
+          })
+        );
+      }
+      $("#poll").hidden = false;
+      $(".poll__btn-submit").hidden = !!answered;
+    };
+
+    const connect = () => {
+      $("#join").hidden = true;
+      $("#event").hidden = false;
+      const stream = new EventSource(`/api/stream?participant_id=${encodeURIComponent(participantId)}`);
+      stream.addEventListener("state", (event) => render(JSON.parse(event.data)));
+    };
+
+    $("#join").addEventListener("submit", async (event) => {
+      event.preventDefault();
+      const { participant_id } = await post("/api/participants", { name: $("input[name='participantName']").value });
+      participantId = participant_id;
+      localStorage.setItem("participantId", participantId);
+      connect();
+    });
+
+    $(".poll__btn-submit").addEventListener("click", async () => {
+      const selected = $(".poll-question-options input[type='radio']:checked");
+      if (selected) {
+        await post("/api/votes", { participant_id: participantId, poll_id: renderedPoll, option_id: selected.value });
+      }
+    });
+
+    if (participantId) {
+      connect();
+    }
+  </script>
+</body>
+</html>
+"""
+
+
+@dataclass
+class Poll:
+    """A question of the scripted quiz while it is being asked.
+
+    Attributes:
+        poll_id (str): The identifier of the poll.
+        quiz_question (QuizQuestion): The question being asked.
+        number (int): The 1-based position of the question in the quiz.
+        total (int): The number of questions in the quiz.
+        opened_at (float): The monotonic time at which the poll was pushed to the participants.
+        votes (dict[str, tuple[str, float]]): The chosen option id and the time-to-answer of every participant who voted.
+    """
+
+    poll_id: str
+    quiz_question: QuizQuestion
+    number: int
+    total: int
+    opened_at: float
+    votes: dict = field(default_factory=dict)
+
+    def option_id(self, index: int) -> str:
+        """Returns the stable identifier of the option at the given index."""
+        return f"{self.poll_id}-{index}"
+
+    def to_dict(self) -> dict:
+        """Returns the poll as pushed to the participants."""
+        return {
+            "poll_id": self.poll_id,
+            "question": self.quiz_question.question,
+            "options": [{"id": self.option_id(i), "label": label} for i, label in enumerate(self.quiz_question.answer_choices)],
+            "number": self.number,
+            "total": self.total,
+        }
+
+
+class SlidoStandInServer:
+    """A local HTTP server playing a scripted Slido quiz.
+
+    The quiz starts once `expected_participants` have joined (or when `start_quiz` is called). Each
+    question stays open until every participant has voted or `question_duration` seconds have passed,
+    and the next one is pushed `question_gap` seconds later.
+    """
+
+    def __init__(
+        self,
+        quiz_questions: list[QuizQuestion],
+        expected_participants: int = 1,
+        question_duration: float = 30.0,
+        question_gap: float = 0.5,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initializes the server (call `start` to begin serving).
+
+        Args:
+            quiz_questions (list[QuizQuestion]): The questions of the quiz, in order.
+            expected_participants (int): The number of participants to wait for before starting the quiz.
+            question_duration (float): The maximum number of seconds a question stays open.
+            question_gap (float): The number of seconds between the end of a question and the next one.
+            host (str): The interface to listen on.
+            port (int): The port to listen on, or 0 to pick a free one.
+        """
+        self.quiz_questions = list(quiz_questions)
+        self.expected_participants = expected_participants
+        self.question_duration = question_duration
+        self.question_gap = question_gap
+        self.participants: dict[str, str] = {}
+        self.polls: list[Poll] = []
+        self.status = "waiting"
+        self.version = 0
+        self.participant_versions: dict[str, int] = {}
+        self.condition = threading.Condition()
+        self.stopped = False
+        self._started = False
+        self._httpd = _StandInHTTPServer((host, port), _make_handler(self))
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def url(self) -> str:
+        """str: The URL of the participant page."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/event/stand-in"
+
+    @property
+    def base_url(self) -> str:
+        """str: The base URL of the protocol endpoints."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "SlidoStandInServer":
+        """Starts serving requests and playing the quiz script in background threads.
+
+        Returns:
+            SlidoStandInServer: The server itself, for chaining.
+        """
+        for target in (self._httpd.serve_forever, self._play):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self) -> None:
+        """Stops the quiz script, closes every event stream and shuts the server down."""
+        with self.condition:
+            self.stopped = True
+            self.condition.notify_all()
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        """Starts the server when used as a context manager."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Stops the server when leaving the context."""
+        self.stop()
+
+    def start_quiz(self) -> None:
+        """Starts the quiz without waiting for the expected number of participants."""
+        with self.condition:
+            self._started = True
+            self.condition.notify_all()
+
+    def wait_until_finished(self, timeout: float | None = None) -> bool:
+        """Blocks until the last question has been closed.
+
+        Args:
+            timeout (float|None): The maximum number of seconds to wait.
+
+        Returns:
+            bool: True if the quiz finished within the timeout.
+        """
+        with self.condition:
+            return self.condition.wait_for(lambda: self.status == "finished", timeout=timeout)
+
+    def join(self, name: str) -> str:
+        """Registers a participant.
+
+        Args:
+            name (str): The participant's name.
+
+        Returns:
+            str: The identifier of the new participant.
+        """
+        participant_id = uuid.uuid4().hex
+        with self.condition:
+            self.participants[participant_id] = name
+            self.participant_versions[participant_id] = 0
+            self._changed(participant_id)
+        return participant_id
+
+    def vote(self, participant_id: str, poll_id: str, option_id: str) -> bool:
+        """Records a participant's vote on the open poll.
+
+        Args:
+            participant_id (str): The identifier of the voting participant.
+            poll_id (str): The identifier of the poll being answered.
+            option_id (str): The identifier of the chosen option.
+
+        Returns:
+            bool: True if the vote was accepted, False if the poll is closed, unknown or already answered.
+        """
+        now = time.monotonic()
+        with self.condition:
+            poll = self.polls[-1] if self.polls and self.status == "poll" else None
+            valid_options = {poll.option_id(i) for i in range(len(poll.quiz_question.answer_choices))} if poll else set()
+            if poll is None or poll.poll_id != poll_id or participant_id not in self.participants or participant_id in poll.votes:
+                return False
+            if option_id not in valid_options:
+                return False
+            poll.votes[participant_id] = (option_id, now - poll.opened_at)
+            self._changed(participant_id)
+            return True
+
+    def state(self, participant_id: str | None = None) -> dict:
+        """Returns the state pushed to a participant.
+
+        Args:
+            participant_id (str|None): The participant the state is for.
+
+        Returns:
+            dict: The quiz status (`waiting`, `poll` or `finished`), the number of questions, the latest poll and the polls
+                the participant answered.
+        """
+        with self.condition:
+            return {
+                "status": self.status,
+                "total": len(self.quiz_questions),
+                "poll": self.polls[-1].to_dict() if self.polls else None,
+                "answered_poll_ids": [poll.poll_id for poll in self.polls if participant_id in poll.votes],
+            }
+
+    def results(self) -> dict:
+        """Returns the votes of every poll with their time-to-answer.
+
+        Returns:
+            dict: The participants and, for every poll, its question, correct option and votes.
+        """
+        with self.condition:
+            return {
+                "participants": dict(self.participants),
+                "polls": [
+                    {
+                        "poll_id": poll.poll_id,
+                        "question": poll.quiz_question.question,
+                        "correct_option_id": (
+                            poll.option_id(poll.quiz_question.correct_answer_index) if poll.quiz_question.correct_answer_index is not None else None
+                        ),
+                        "votes": [
+                            {"participant_id": participant_id, "option_id": option_id, "time_to_answer": time_to_answer}
+                            for participant_id, (option_id, time_to_answer) in poll.votes.items()
+                        ],
+                    }
+                    for poll in self.polls
+                ],
+            }
+
+    def _changed(self, participant_id: str | None = None) -> None:
+        """Bumps a state version and wakes up the event streams and the quiz script (the condition must be held).
+
+        Args:
+            participant_id (str|None): The only participant whose state changed (e.g. after a vote), so that the
+                other streams do not push an unchanged state, or None if the state of every participant changed.
+        """
+        if participant_id is None:
+            self.version += 1
+        else:
+            self.participant_versions[participant_id] += 1
+        self.condition.notify_all()
+
+    def _state_version(self, participant_id: str | None) -> tuple[int, int]:
+        """Returns the version of the state pushed to a participant (the condition must be held)."""
+        return self.version, self.participant_versions.get(participant_id, 0)
+
+    def _play(self) -> None:
+        """Plays the quiz script: waits for the participants, then opens and closes every question in turn."""
+        with self.condition:
+            self.condition.wait_for(lambda: self.stopped or self._started or len(self.participants) >= self.expected_participants)
+        for number, quiz_question in enumerate(self.quiz_questions, start=1):
+            with self.condition:
+                if self.stopped:
+                    return
+                poll = Poll(uuid.uuid4().hex[:12], quiz_question, number, len(self.quiz_questions), time.monotonic())
+                self.polls.append(poll)
+                self.status = "poll"
+                self._changed()
+                self.condition.wait_for(
+                    lambda poll=poll: self.stopped or (self.participants and len(poll.votes) >= len(self.participants)),
+                    timeout=self.question_duration,
+                )
+                self.status = "waiting" if number < len(self.quiz_questions) else "finished"
+                self._changed()
+            time.sleep(self.question_gap)
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    """A threading HTTP server whose listen backlog absorbs hundreds of participants connecting at once."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def _make_handler(server: SlidoStandInServer):
+    """Creates the request handler class bound to a stand-in server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Serves the participant page and the JSON/event-stream protocol."""
+
+        def log_message(self, format, *args):
+            """Silences the default per-request logging."""
+
+        def _send_json(self, payload, status=HTTPStatus.OK):
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _read_json(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            try:
+                return json.loads(self.rfile.read(length) or b"{}")
+            except json.JSONDecodeError:
+                return {}
+
+        def do_GET(self):
+            """Serves the participant page, the event stream and the results."""
+            url = urlparse(self.path)
+            if url.path.startswith("/event/"):
+                body = PARTICIPANT_PAGE.encode("utf-8")
+                self.send_response(HTTPStatus.OK)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            elif url.path == "/api/stream":
+                self._stream(parse_qs(url.query).get("participant_id", [None])[0])
+            elif url.path == "/api/results":
+                self._send_json(server.results())
+            else:
+                self._send_json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+
+        def do_POST(self):
+            """Handles joins and votes."""
+            payload = self._read_json()
+            if self.path == "/api/participants":
+                self._send_json({"participant_id": server.join(str(payload.get("name", "")))})
+            elif self.path == "/api/votes":
+                accepted = server.vote(str(payload.get("participant_id")), str(payload.get("poll_id")), str(payload.get("option_id")))
+                self._send_json({"accepted": accepted}, HTTPStatus.OK if accepted else HTTPStatus.CONFLICT)
+            else:
+                self._send_json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+
+        def _stream(self, participant_id):
+            """Pushes the participant's state every time it changes, with periodic keep-alive comments."""
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            version = None
+            try:
+                while True:
+                    with server.condition:
+                        server.condition.wait_for(
+                            lambda version=version: server.stopped or server._state_version(participant_id) != version, timeout=15
+                        )
+                        if server.stopped:
+                            return
+                        changed = server._state_version(participant_id) != version
+                        version = server._state_version(participant_id)
+                    message = f"event: state\ndata: {json.dumps(server.state(participant_id))}\n\n" if changed else ": keep-alive\n\n"
+                    self.wfile.write(message.encode("utf-8"))
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+    return Handler
@@ -0,0 +1,165 @@
+"""This module measures the cold start of the bot, to guard it against regressions.
+
+Two numbers are measured, each in a fresh interpreter:
+
+- the import time of the CLI entry point, from `python -X importtime`, along with the heavy modules
+  (Playwright and `google.generativeai`) it loads before the arguments are even parsed;
+- the wall-clock time from launching the CLI to being ready for the first question, i.e. joined to a
+  quiz played by the local stand-in server.
+
+Usage:
+    slido-quiz-bot startup [--max_import_time SECONDS] [--max_time_to_ready SECONDS]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+
+from rich.console import Console
+from rich.table import Table
+
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.stand_in_server import SlidoStandInServer
+
+console = Console()
+
+# Modules that must not be imported before the arguments are parsed
+HEAVY_MODULES = ("playwright", "google.generativeai")
+
+# The quiz played while measuring the time to ready; it never starts, since the probe is stopped once joined
+PROBE_QUIZ = [QuizQuestion(question="Is the bot ready?", answer_choices=["Yes", "No"], correct_answer_index=0)]
+
+
+@dataclass(frozen=True)
+class ImportTimeReport:
+    """The import time of a module in a fresh interpreter.
+
+    Attributes:
+        module (str): The imported module.
+        total (float): The cumulative import time of the module in seconds.
+        slowest (list[tuple[str, float]]): The modules taking the most time by themselves, with their time in seconds.
+        heavy_modules (list[str]): The `HEAVY_MODULES` loaded by the import.
+    """
+
+    module: str
+    total: float
+    slowest: list[tuple[str, float]]
+    heavy_modules: list[str]
+
+
+def parse_import_times(output: str) -> dict[str, tuple[float, float]]:
+    """Parses the report printed by `python -X importtime`.
+
+    Args:
+        output (str): The standard error of the interpreter.
+
+    Returns:
+        dict[str, tuple[float, float]]: The time taken by each module by itself and cumulatively, in seconds.
+
+    Example:
+        >>> parse_import_times("import time:       216 |      22255 |     certifi.core")
+        {'certifi.core': (0.000216, 0.022255)}
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, module = line.removeprefix("import time:").split("|")
+        if self_time.strip().isdigit():
+            times[module.strip()] = (int(self_time) / 1e6, int(cumulative) / 1e6)
+    return times
+
+
+def measure_import_time(module: str = "slido_quiz_bot.__main__", slowest: int = 10) -> ImportTimeReport:
+    """Imports a module in a fresh interpreter with `-X importtime`.
+
+    Args:
+        module (str): The module to import.
+        slowest (int): The number of slowest modules to report.
+
+    Returns:
+        ImportTimeReport: The import time of the module.
+
+    Raises:
+        subprocess.CalledProcessError: If the module cannot be imported.
+    """
+    code = f"import json, sys, {module}; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+    times = parse_import_times(result.stderr)
+    loaded = set(json.loads(result.stdout))
+    return ImportTimeReport(
+        module=module,
+        total=times[module][1],
+        slowest=sorted(((name, self_time) for name, (self_time, _) in times.items()), key=lambda item: item[1], reverse=True)[:slowest],
+        heavy_modules=[name for name in HEAVY_MODULES if name in loaded],
+    )
+
+
+def measure_time_to_ready(timeout: float = 60.0, cli_args: tuple[str, ...] = ()) -> float:
+    """Launches the CLI against a local stand-in quiz and measures how long it takes to join it.
+
+    Args:
+        timeout (float): The maximum number of seconds to wait for the CLI to join.
+        cli_args (tuple[str, ...]): Extra command line arguments of the CLI.
+
+    Returns:
+        float: The number of seconds from launching the CLI to its participant joining the quiz.
+
+    Raises:
+        TimeoutError: If the CLI did not join within the timeout.
+    """
+    with SlidoStandInServer(PROBE_QUIZ, expected_participants=2) as server:
+        start = time.perf_counter()
+        command = [sys.executable, "-m", "slido_quiz_bot", "-u", server.url, "-n", "Startup Probe", *cli_args]
+        process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            with server.condition:
+                joined = server.condition.wait_for(lambda: server.participants or process.poll() is not None, timeout=timeout)
+                joined = joined and bool(server.participants)
+            elapsed = time.perf_counter() - start
+        finally:
+            process.kill()
+            process.wait()
+    if not joined:
+        raise TimeoutError(f"The CLI did not join the quiz within {timeout} seconds (exit code {process.returncode}).")
+    return elapsed
+
+
+def startup_main(argv: list[str] | None = None) -> None:
+    """Command line entry point of the `startup` subcommand; exits with an error if a budget is exceeded.
+
+    Args:
+        argv (list[str]|None): The command line arguments after `startup`. Defaults to `sys.argv`.
+    """
+    parser = argparse.ArgumentParser(prog="slido-quiz-bot startup", description="Measure the cold start of the bot.")
+    parser.add_argument("--max_import_time", type=float, default=None, help="Fail if importing the CLI takes longer, in seconds.")
+    parser.add_argument("--max_time_to_ready", type=float, default=None, help="Fail if joining the quiz takes longer, in seconds.")
+    parser.add_argument("--skip_ready", action="store_true", help="Only measure the import time.")
+    args = parser.parse_args(argv)
+
+    import_report = measure_import_time()
+    time_to_ready = None if args.skip_ready else measure_time_to_ready()
+
+    table = Table(title="Startup report")
+    table.add_column("Metric")
+    table.add_column("Value", justify="right")
+    table.add_row("CLI import time", f"{import_report.total * 1000:.1f} ms")
+    table.add_row("Heavy modules at import", ", ".join(import_report.heavy_modules) or "none")
+    if time_to_ready is not None:
+        table.add_row("Time to ready", f"{time_to_ready:.2f} s")
+    for module, self_time in import_report.slowest[:5]:
+        table.add_row(f"  {module}", f"{self_time * 1000:.1f} ms")
+    console.print(table)
+
+    failures = []
+    if import_report.heavy_modules:
+        failures.append(f"the CLI imports {', '.join(import_report.heavy_modules)} before parsing its arguments")
+    if args.max_import_time is not None and import_report.total > args.max_import_time:
+        failures.append(f"the CLI import time {import_report.total:.3f} s exceeds {args.max_import_time} s")
+    if args.max_time_to_ready is not None and time_to_ready is not None and time_to_ready > args.max_time_to_ready:
+        failures.append(f"the time to ready {time_to_ready:.2f} s exceeds {args.max_time_to_ready} s")
+    if failures:
+        parser.exit(1, f"Startup regression: {'; '.join(failures)}.\n")
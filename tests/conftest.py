@@ -4,11 +4,35 @@ This module contains common test fixtures and configuration for the Slido Quiz B
 Fixtures defined here are shared across test modules, providing reusable setup for tests.
 """
 
+from pathlib import Path
+
 import pytest
+from playwright.sync_api import sync_playwright
 
+from slido_quiz_bot.answer_quiz_question import set_default_answerer
 from slido_quiz_bot.quizz_question import QuizQuestion
 
 
+@pytest.fixture(autouse=True)
+def reset_default_answerer():
+    """Fixture to give every test a fresh default answerer, so patched model classes are picked up."""
+    set_default_answerer(None)
+    yield
+    set_default_answerer(None)
+
+
+@pytest.fixture(scope="session")
+def chromium():
+    """Fixture to skip the tests driving a real browser when the Playwright Chromium build is not installed."""
+    try:
+        with sync_playwright() as p:
+            installed = Path(p.chromium.executable_path).is_file()
+    except Exception:
+        installed = False
+    if not installed:
+        pytest.skip("the Playwright Chromium build is not installed")
+
+
 @pytest.fixture
 def dummy_quiz_questions():
     """Fixture to create a list of QuizQuestion instances for testing."""
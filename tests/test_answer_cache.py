@@ -0,0 +1,112 @@
+"""Tests for the `AnswerCache` class.
+
+This module contains unit tests to verify that answers are cached by question content,
+survive shuffled answer choices, and are evicted according to the size and TTL limits.
+"""
+
+import sqlite3
+from unittest.mock import MagicMock, patch
+
+from slido_quiz_bot.answer_cache import AnswerCache, cache_key
+from slido_quiz_bot.answer_quiz_question import answer_quiz_question
+from slido_quiz_bot.quizz_question import QuizQuestion
+
+
+def test_cache_key_ignores_formatting_and_order():
+    """Test that cosmetic differences and shuffled choices map onto the same key."""
+    original = QuizQuestion("What is the capital of France?", ["Berlin", "Madrid", "Paris", "Rome"], None)
+    reworded = QuizQuestion("  what is the CAPITAL of   France? ", ["Rome", "paris", "Berlin", "Madrid"], None)
+    other = QuizQuestion("What is the capital of France?", ["Berlin", "Madrid", "Lyon", "Rome"], None)
+
+    assert cache_key(original) == cache_key(reworded)
+    assert cache_key(original) != cache_key(other)
+
+
+def test_cache_hit_with_shuffled_choices(dummy_quiz_questions):
+    """Test that a cached answer resolves to the right index after the choices are shuffled."""
+    cache = AnswerCache()
+    quiz_question = dummy_quiz_questions[0]
+    cache.put(quiz_question, quiz_question.correct_answer_index)
+
+    shuffled = QuizQuestion(quiz_question.question, list(reversed(quiz_question.answer_choices)), None)
+
+    assert cache.get(shuffled) == shuffled.answer_choices.index("Paris")
+    assert cache.get(dummy_quiz_questions[1]) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.hit_rate == 0.5
+
+
+def test_cache_persists_across_instances(tmp_path, dummy_quiz_questions):
+    """Test that answers are stored on disk and reloaded by a new cache instance."""
+    path = str(tmp_path / "answers.sqlite3")
+    quiz_question = dummy_quiz_questions[1]
+
+    cache = AnswerCache(path)
+    cache.put(quiz_question, quiz_question.correct_answer_index)
+    cache.close()
+
+    assert AnswerCache(path).get(quiz_question) == quiz_question.correct_answer_index
+
+
+def test_cache_evicts_least_recently_used(dummy_quiz_questions):
+    """Test that the cache keeps at most `max_entries` answers, dropping the least recently used."""
+    cache = AnswerCache(max_entries=2)
+    first, second, third = dummy_quiz_questions[:3]
+
+    with patch("slido_quiz_bot.answer_cache.time.time", side_effect=[1.0, 2.0, 3.0, 4.0]):
+        cache.put(first, first.correct_answer_index)
+        cache.put(second, second.correct_answer_index)
+        cache.get(first)
+        cache.put(third, third.correct_answer_index)
+
+    assert len(cache) == 2
+    assert cache.get(second) is None
+    assert cache.get(first) == first.correct_answer_index
+
+
+def test_cache_hits_do_not_write(tmp_path, dummy_quiz_questions):
+    """Test that lookups do not write to the database, and that the last use times are written on close."""
+    path = str(tmp_path / "answers.sqlite3")
+    quiz_question = dummy_quiz_questions[0]
+    cache = AnswerCache(path)
+    with patch("slido_quiz_bot.answer_cache.time.time", side_effect=[1.0, 2.0]):
+        cache.put(quiz_question, quiz_question.correct_answer_index)
+        changes = cache._connection.total_changes
+
+        assert cache.get(quiz_question) == quiz_question.correct_answer_index
+    assert cache._connection.total_changes == changes
+    assert not cache._connection.in_transaction
+
+    cache.close()
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT last_used_at FROM answers").fetchall() == [(2.0,)]
+
+
+def test_cache_expires_entries_after_ttl(dummy_quiz_questions):
+    """Test that entries older than the TTL are treated as misses and purged."""
+    cache = AnswerCache(ttl=10)
+    first, second = dummy_quiz_questions[:2]
+
+    with patch("slido_quiz_bot.answer_cache.time.time", side_effect=[0.0, 5.0, 11.0, 20.0]):
+        cache.put(first, first.correct_answer_index)
+        cache.put(second, second.correct_answer_index)
+        assert cache.get(first) is None
+        assert cache.purge_expired() == 2
+
+    assert len(cache) == 0
+
+
+@patch("slido_quiz_bot.answer_quiz_question.genai.GenerativeModel")
+def test_answer_quiz_question_uses_cache(mock_model_class, dummy_quiz_questions):
+    """Test that a repeated question is answered from the cache without calling the model."""
+    quiz_question = dummy_quiz_questions[2]
+    mock_model = MagicMock()
+    mock_model.generate_content.return_value.text = str(quiz_question.correct_answer_index)
+    mock_model_class.return_value = mock_model
+    cache = AnswerCache()
+
+    assert answer_quiz_question(quiz_question, cache=cache) == quiz_question.correct_answer_index
+    assert answer_quiz_question(quiz_question, cache=cache) == quiz_question.correct_answer_index
+
+    mock_model.generate_content.assert_called_once()
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -4,11 +4,21 @@ This module contains unit tests to verify the behavior of the `answer_quiz_quest
 function, which utilizes a generative AI model to answer multiple-choice quiz questions.
 """
 
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from slido_quiz_bot.answer_quiz_question import answer_quiz_question, format_prompt
+from slido_quiz_bot.answer_quiz_question import (
+    Answerer,
+    answer_quiz_question,
+    answer_quiz_questions,
+    format_batch_prompt,
+    format_prompt,
+    parse_batch_answers,
+    split_into_batches,
+)
 from slido_quiz_bot.quizz_question import QuizQuestion
 
 
@@ -70,3 +80,90 @@ def test_answer_quiz_question_model_error(dummy_quiz_questions):
 
         with pytest.raises(RuntimeError, match="All models failed to generate a valid answer."):
             answer_quiz_question(quiz_question)
+
+
+def test_split_into_batches(dummy_quiz_questions):
+    """Test that batches respect the size limit and the token budget while preserving order."""
+    batches = split_into_batches(dummy_quiz_questions, max_batch_size=4)
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert [quiz for batch in batches for quiz in batch] == dummy_quiz_questions
+
+    assert all(len(batch) == 1 for batch in split_into_batches(dummy_quiz_questions, max_prompt_tokens=1))
+    assert split_into_batches(dummy_quiz_questions) == [dummy_quiz_questions]
+
+
+def test_parse_batch_answers(dummy_quiz_questions):
+    """Test that only well-formed, in-range answers are kept from a batch response."""
+    response_text = json.dumps([
+        {"question_id": 0, "answer_index": 2},
+        {"question_id": 1, "answer_index": 9},
+        {"question_id": 7, "answer_index": 0},
+        {"question_id": 2},
+    ])
+    assert parse_batch_answers(response_text, dummy_quiz_questions[:3]) == {0: 2}
+    assert parse_batch_answers("not json", dummy_quiz_questions[:3]) == {}
+
+
+@patch("slido_quiz_bot.answer_quiz_question.genai.GenerativeModel")
+def test_answer_quiz_questions_batches_and_falls_back(mock_model_class, dummy_quiz_questions):
+    """Test that a batch is answered with one request and unparsed items fall back to single-question calls."""
+    quiz_questions = dummy_quiz_questions[:3]
+    batch_response = MagicMock(
+        text=json.dumps([{"question_id": i, "answer_index": q.correct_answer_index} for i, q in enumerate(quiz_questions[:2])])
+    )
+    single_response = MagicMock(text=str(quiz_questions[2].correct_answer_index))
+    mock_model = MagicMock()
+    mock_model.generate_content.side_effect = [batch_response, single_response]
+    mock_model_class.return_value = mock_model
+
+    answers = answer_quiz_questions(quiz_questions)
+
+    assert answers == [quiz.correct_answer_index for quiz in quiz_questions]
+    assert mock_model.generate_content.call_count == 2
+    assert mock_model.generate_content.call_args_list[0][0][0] == format_batch_prompt(quiz_questions)
+    assert mock_model.generate_content.call_args_list[1][0][0] == format_prompt(quiz_questions[2])
+
+
+@patch("slido_quiz_bot.answer_quiz_question.genai.GenerativeModel")
+def test_answerer_reuses_model_clients(mock_model_class, dummy_quiz_questions):
+    """Test that model clients are created once and reused across questions, including through the wrapper."""
+    mock_model_class.return_value.generate_content.return_value.text = "1"
+
+    answerer = Answerer(["model-a"])
+    for quiz_question in dummy_quiz_questions[:3]:
+        assert answerer.answer(quiz_question) == 1
+    for quiz_question in dummy_quiz_questions[:3]:
+        assert answer_quiz_question(quiz_question) == 1
+
+    assert mock_model_class.call_count == 1 + 2  # One for `answerer`, one per default model of the wrapper
+    generation_configs = {id(call.kwargs["generation_config"]) for call in mock_model_class.return_value.generate_content.call_args_list}
+    assert len(generation_configs) == 2
+
+
+@patch("slido_quiz_bot.answer_quiz_question.genai.GenerativeModel")
+def test_answerer_warm_up_ignores_failures(mock_model_class):
+    """Test that the warm-up touches every model and does not raise when a model is unavailable."""
+    mock_model_class.return_value.count_tokens.side_effect = [RuntimeError("Unavailable"), None]
+
+    Answerer(["model-a", "model-b"]).warm_up()
+
+    assert mock_model_class.return_value.count_tokens.call_count == 2
+
+
+@patch("slido_quiz_bot.answer_quiz_question.genai.GenerativeModel")
+def test_answerer_hedges_slow_model(mock_model_class, dummy_quiz_questions):
+    """Test that a slow model is hedged with the next one and the first valid answer wins."""
+    release_slow_model = threading.Event()
+    slow_model, fast_model = MagicMock(), MagicMock()
+    slow_model.generate_content.side_effect = lambda *args, **kwargs: release_slow_model.wait(timeout=5) and MagicMock(text="0")
+    fast_model.generate_content.return_value.text = "1"
+    mock_model_class.side_effect = [slow_model, fast_model]
+
+    answerer = Answerer(["slow", "fast"], hedge_after=0.01)
+    try:
+        assert answerer.answer(dummy_quiz_questions[1]) == 1
+    finally:
+        release_slow_model.set()
+
+    fast_model.generate_content.assert_called_once()
+    assert answerer.router.latency("fast") is not None
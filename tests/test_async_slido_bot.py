@@ -0,0 +1,178 @@
+"""Tests for the helpers of the `async_slido_bot` module.
+
+This module contains unit tests for the pieces of the concurrent participant engine
+that do not require a running browser.
+"""
+
+import asyncio
+from unittest.mock import DEFAULT, AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from slido_quiz_bot.async_slido_bot import ParticipantPool, answer_question, wait_for_question
+from slido_quiz_bot.question_watcher import SNAPSHOT_EXPRESSION
+from slido_quiz_bot.slido_bot import OPTIONS_CHECK_INTERVAL, REJOIN_CHECK_SELECTOR, parse_question_counter
+
+
+def test_parse_question_counter():
+    """Test the parsing of the question counter text."""
+    assert parse_question_counter("2/5") == (2, 5)
+
+    with pytest.raises(ValueError, match="Invalid question counter format"):
+        parse_question_counter("2 of 5")
+
+
+def mock_browser(name_form_shown, on_rejoin_check=None):
+    """Creates a mocked Playwright async browser whose pages show the name form or not.
+
+    The optional `on_rejoin_check` callback is called while a page waits for the name form or the joined event page.
+    """
+    browser = MagicMock()
+    context = MagicMock(storage_state=AsyncMock(), close=AsyncMock())
+    page = MagicMock()
+    browser.new_context = AsyncMock(return_value=context)
+    context.new_page = AsyncMock(return_value=page)
+    page.add_init_script = AsyncMock()
+    page.evaluate = AsyncMock()
+    page.goto = AsyncMock()
+    name_input = MagicMock()
+    name_input.fill = AsyncMock()
+    name_input.click = AsyncMock()
+
+    async def wait_for(state, timeout=None):
+        if state == "visible" and not name_form_shown:
+            raise PlaywrightTimeoutError("no name form")
+
+    name_input.wait_for = AsyncMock(side_effect=wait_for)
+    name_input.is_visible = AsyncMock(return_value=name_form_shown)
+    page.locator.return_value = name_input
+
+    async def wait_for_name_form_or_event(state, timeout=None):
+        if on_rejoin_check is not None:
+            on_rejoin_check()
+
+    rejoin_check = MagicMock()
+    rejoin_check.first.wait_for = AsyncMock(side_effect=wait_for_name_form_or_event)
+    page.locator.side_effect = lambda selector: rejoin_check if selector == REJOIN_CHECK_SELECTOR else DEFAULT
+    return browser, context
+
+
+def test_participant_pool_joins_and_saves_state(tmp_path):
+    """Test that a new participant fills in the name form and has its storage state saved."""
+    browser, context = mock_browser(name_form_shown=True)
+
+    async def run():
+        async with ParticipantPool(browser, "https://app.sli.do/event/abc", state_dir=tmp_path) as pool:
+            participant = await pool.join("Ada Lovelace")
+        return participant
+
+    participant = asyncio.run(run())
+
+    assert not participant.rejoined
+    browser.new_context.assert_awaited_once_with(storage_state=None)
+    participant.page.locator.return_value.fill.assert_awaited_once_with("Ada Lovelace")
+    context.storage_state.assert_awaited_with(path=tmp_path / "Ada_Lovelace.json")
+    context.close.assert_awaited_once()
+
+
+def test_participant_pool_rejoins_from_saved_state(tmp_path):
+    """Test that a participant with a saved storage state skips the name form when the page does not show it."""
+    (tmp_path / "Ada_Lovelace.json").write_text("{}")
+    browser, _ = mock_browser(name_form_shown=False)
+    pool = ParticipantPool(browser, "https://app.sli.do/event/abc", state_dir=tmp_path)
+
+    results = asyncio.run(pool.fill(["Ada Lovelace"]))
+
+    assert results == pool.participants
+    assert results[0].rejoined
+    browser.new_context.assert_awaited_once_with(storage_state=tmp_path / "Ada_Lovelace.json")
+    results[0].page.locator.return_value.fill.assert_not_awaited()
+
+
+def test_participant_pool_checks_rejoin_without_a_join_slot(tmp_path):
+    """Test that a participant checking whether it has rejoined does not hold one of the slots limiting page loads."""
+    for participant_name in ("Ada", "Grace"):
+        (tmp_path / f"{participant_name}.json").write_text("{}")
+    slot_held = []
+    browser, _ = mock_browser(name_form_shown=False, on_rejoin_check=lambda: slot_held.append(pool._join_semaphore.locked()))
+    pool = ParticipantPool(browser, "https://app.sli.do/event/abc", state_dir=tmp_path, join_concurrency=1)
+
+    results = asyncio.run(pool.fill(["Ada", "Grace"]))
+
+    assert [participant.rejoined for participant in results] == [True, True]
+    assert slot_held == [False, False]
+
+
+def test_participant_pool_recycles_context_over_memory_budget(tmp_path):
+    """Test that a participant whose JavaScript heap exceeds the budget moves to a new context restoring its session."""
+    (tmp_path / "Ada_Lovelace.json").write_text("{}")
+    browser, context = mock_browser(name_form_shown=False)
+    session_state = {"cookies": [{"name": "session", "value": "ada"}], "origins": []}
+    context.storage_state = AsyncMock(return_value=session_state)
+    cdp_session = MagicMock(detach=AsyncMock())
+    cdp_session.send = AsyncMock(side_effect=[{"usedSize": 40 * 1024**2}, {"usedSize": 300 * 1024**2}])
+    context.new_cdp_session = AsyncMock(return_value=cdp_session)
+
+    async def run():
+        pool = ParticipantPool(browser, "https://app.sli.do/event/abc", state_dir=tmp_path, memory_budget_mb=256)
+        participant = await pool.join("Ada Lovelace")
+        return participant, await pool.check_memory(participant), await pool.check_memory(participant)
+
+    participant, first_check, second_check = asyncio.run(run())
+
+    assert (first_check, second_check) == (False, True)
+    assert participant.recycles == 1
+    browser.new_context.assert_awaited_with(storage_state=session_state)
+    participant.page.locator.return_value.fill.assert_not_awaited()
+    context.close.assert_awaited_once()
+    cdp_session.send.assert_awaited_with("Runtime.getHeapUsage")
+
+
+def test_answer_question_restart_uses_the_changed_question():
+    """Test that a restarted model call is asked the question of the changed snapshot, whose key is returned."""
+    first = {"question": "Loading...", "options": ["Berlin", "Madrid"], "optionIds": ["option-0", "option-1"], "counter": "1/3"}
+    changed = {"question": "What is the capital of France?", "options": ["Paris", "Rome"], "optionIds": ["option-2", "option-3"], "counter": "1/3"}
+    page = MagicMock()
+    page.locator.return_value = MagicMock(wait_for=AsyncMock(), click=AsyncMock())
+
+    async def evaluate(expression, args=None):
+        if expression == SNAPSHOT_EXPRESSION:
+            return first
+        evaluated_timeouts.append(args[1])
+        if args[0] == first["options"]:
+            return changed
+        await asyncio.sleep(args[1] / 1000)
+
+    page.evaluate = evaluate
+    evaluated_timeouts = []
+    asked_questions = []
+
+    async def answer_async(quiz_question, participant_index=0):
+        asked_questions.append(quiz_question.question)
+        await asyncio.sleep(5 if len(asked_questions) == 1 else 0.1)
+        return 0
+
+    answered = asyncio.run(answer_question(page, "Ada", MagicMock(answer_async=answer_async)))
+
+    assert asked_questions == ["Loading...", "What is the capital of France?"]
+    assert answered.key == "1/3␞What is the capital of France?"
+    # The changed options are watched in short in-page waits, none of which outlives the answer
+    assert len(evaluated_timeouts) > 2
+    assert set(evaluated_timeouts) == {OPTIONS_CHECK_INTERVAL}
+
+
+def test_wait_for_question_survives_a_reload():
+    """Test that a wait interrupted by a reload of the page goes on on the new document, but other errors are raised."""
+    page = MagicMock()
+    reloaded = PlaywrightError("Execution context was destroyed, most likely because of a navigation")
+    page.evaluate = AsyncMock(side_effect=[reloaded, "2/3␞Which planet is known as the Red Planet?"])
+
+    assert asyncio.run(wait_for_question(page, timeout=500)) == "2/3␞Which planet is known as the Red Planet?"
+    assert page.evaluate.await_count == 2
+
+    page.evaluate = AsyncMock(side_effect=PlaywrightError("Target page, context or browser has been closed"))
+    with pytest.raises(PlaywrightError, match="closed"):
+        asyncio.run(wait_for_question(page, timeout=500))
+    assert page.evaluate.await_count == 1
@@ -0,0 +1,58 @@
+"""Tests for the `benchmark` module.
+
+This module contains unit tests for loading quiz datasets, the deterministic stub model,
+and the benchmark report computed over a dataset.
+"""
+
+import json
+
+import pytest
+
+from slido_quiz_bot.answer_cache import AnswerCache
+from slido_quiz_bot.answer_quiz_question import Answerer
+from slido_quiz_bot.benchmark import load_dataset, run_benchmark, stub_model_factory
+
+
+def test_load_dataset_jsonl_and_csv(tmp_path, dummy_quiz_questions):
+    """Test that JSONL and CSV datasets are loaded into the same quiz questions."""
+    jsonl_path = tmp_path / "quiz.jsonl"
+    jsonl_path.write_text("\n".join(json.dumps(quiz.__dict__) for quiz in dummy_quiz_questions) + "\n", encoding="utf-8")
+
+    csv_path = tmp_path / "quiz.csv"
+    csv_lines = ["question,answer_choices,correct_answer_index"]
+    csv_lines += [f'"{quiz.question}",{"|".join(quiz.answer_choices)},{quiz.correct_answer_index}' for quiz in dummy_quiz_questions]
+    csv_path.write_text("\n".join(csv_lines) + "\n", encoding="utf-8")
+
+    assert load_dataset(jsonl_path) == dummy_quiz_questions
+    assert load_dataset(csv_path) == dummy_quiz_questions
+
+
+def test_load_dataset_rejects_unknown_format(tmp_path):
+    """Test that unsupported dataset formats are rejected."""
+    with pytest.raises(ValueError, match="Unsupported dataset format"):
+        load_dataset(tmp_path / "quiz.txt")
+
+
+def test_stub_model_is_deterministic(dummy_quiz_questions):
+    """Test that the stub model always gives the same answers and respects its accuracy."""
+    perfect = Answerer(model_factory=stub_model_factory(dummy_quiz_questions, accuracy=1.0))
+    clueless = Answerer(model_factory=stub_model_factory(dummy_quiz_questions, accuracy=0.0))
+
+    assert [perfect.answer(quiz) for quiz in dummy_quiz_questions] == [quiz.correct_answer_index for quiz in dummy_quiz_questions]
+    wrong_answers = [clueless.answer(quiz) for quiz in dummy_quiz_questions]
+    assert all(answer != quiz.correct_answer_index for answer, quiz in zip(wrong_answers, dummy_quiz_questions, strict=True))
+    assert wrong_answers == [clueless.answer(quiz) for quiz in dummy_quiz_questions]
+
+
+def test_run_benchmark_reports_accuracy_and_cache_hits(dummy_quiz_questions):
+    """Test the accuracy, latency and cache hit rate reported by a benchmark run."""
+    answerer = Answerer(model_factory=stub_model_factory(dummy_quiz_questions, accuracy=1.0))
+
+    report = run_benchmark(dummy_quiz_questions * 2, answerer, concurrency=1, cache=AnswerCache())
+
+    assert report.questions == 20
+    assert report.accuracy == 1.0
+    assert report.errors == 0
+    assert report.cache_hit_rate == 0.5
+    assert 0 <= report.p50 <= report.p95 <= report.p99
+    assert report.throughput > 0
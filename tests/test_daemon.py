@@ -0,0 +1,127 @@
+"""Tests for the `daemon` module.
+
+This module contains tests of the worker pool answering jobs against the local stand-in server
+with browserless participants and the stub model, of the job API, and of the restart of crashed
+workers. The workers are spawned processes, so the answerer factory and job runner must be picklable.
+"""
+
+import functools
+import json
+import os
+import signal
+import time
+import urllib.request
+
+import pytest
+
+from slido_quiz_bot.answer_quiz_question import Answerer
+from slido_quiz_bot.benchmark import stub_model_factory
+from slido_quiz_bot.daemon import BotDaemon
+from slido_quiz_bot.load_test import summarize_results
+from slido_quiz_bot.protocol_client import respond_to_slido_quiz_protocol
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.stand_in_server import SlidoStandInServer
+
+QUIZ = [
+    QuizQuestion(question="What is the capital of France?", answer_choices=["Berlin", "Paris", "Rome"], correct_answer_index=1),
+    QuizQuestion(question="How many legs does a spider have?", answer_choices=["6", "8", "10"], correct_answer_index=1),
+]
+
+
+async def run_protocol_job(job, browser, settings):
+    """Answers the quiz of a job with the protocol participants of the stand-in server, so the workers need no browser."""
+    await respond_to_slido_quiz_protocol(job["quiz_url"], job["participant_names"], strategy=job["strategy"], warm_up=False)
+
+
+@pytest.fixture
+def daemon():
+    """Starts a daemon of two browserless workers answering with the stub model."""
+    answerer_factory = functools.partial(Answerer, model_factory=stub_model_factory(QUIZ, accuracy=1.0))
+    with BotDaemon(workers=2, launch_browser=False, answerer_factory=answerer_factory, job_runner=run_protocol_job) as daemon:
+        yield daemon
+
+
+def _request(url, payload=None):
+    """Sends a JSON request to the job API and returns the status and the decoded response."""
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(url, data=data, method="POST" if data else "GET")
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_jobs_are_answered_through_the_api(daemon):
+    """Test that jobs submitted over the API are spread across the workers and succeed."""
+    url = daemon.serve(port=0)
+    with SlidoStandInServer(QUIZ, expected_participants=4, question_duration=10, question_gap=0.05) as server:
+        names = [[f"Job {job} Participant {i}" for i in range(2)] for job in range(2)]
+        payloads = [{"quiz_url": server.url, "participant_names": job_names} for job_names in names]
+        submitted = [_request(f"{url}/jobs", payload) for payload in payloads]
+        jobs = [daemon.wait(job["job_id"], timeout=30) for status, job in submitted]
+        report = summarize_results(server.results(), 4, len(QUIZ), wall_time=0.0)
+
+    assert [status for status, job in submitted] == [202, 202]
+    assert [job.status for job in jobs] == ["succeeded", "succeeded"]
+    assert {job.worker for job in jobs} == {0, 1}
+    assert report.votes == report.expected_votes == 8
+    assert report.accuracy == 1.0
+    assert _request(f"{url}/jobs/{jobs[0].job_id}")[1]["status"] == "succeeded"
+    assert _request(f"{url}/jobs/unknown")[0] == 404
+
+
+def test_invalid_jobs_are_rejected(daemon):
+    """Test that the API rejects malformed jobs with a 400, without queueing them."""
+    url = daemon.serve(port=0)
+    quiz_url = "https://app.sli.do/event/abc"
+    payloads = [
+        [],
+        {"participant_names": ["Ada"]},
+        {"quiz_url": [quiz_url], "participant_names": ["Ada"]},
+        {"quiz_url": quiz_url},
+        {"quiz_url": quiz_url, "participant_names": []},
+        {"quiz_url": quiz_url, "participant_names": "Ada"},
+        {"quiz_url": quiz_url, "participant_names": {"Ada": 1}},
+        {"quiz_url": quiz_url, "participant_names": ["Ada", 7]},
+        {"quiz_url": quiz_url, "participant_names": ["Ada", " "]},
+        {"quiz_url": quiz_url, "participant_names": ["Ada"], "strategy": "telepathy"},
+    ]
+
+    responses = [_request(f"{url}/jobs", payload) for payload in payloads]
+
+    assert [status for status, response in responses] == [400] * len(payloads)
+    assert all("error" in response for status, response in responses)
+    assert daemon.jobs() == []
+
+
+def test_failed_job_reports_its_error(daemon):
+    """Test that a job whose participants cannot complete the quiz fails with the error."""
+    job = daemon.submit("http://127.0.0.1:9/event/unreachable", ["Ada"])
+
+    job = daemon.wait(job.job_id, timeout=30)
+
+    assert job.status == "failed"
+    assert "ConnectionAbortedError" in job.error
+
+
+def test_crashed_worker_is_restarted(daemon):
+    """Test that a killed worker fails its running job and is replaced by a new process."""
+    with SlidoStandInServer(QUIZ, expected_participants=2) as server:
+        job = daemon.submit(server.url, ["Ada"])
+        deadline = time.monotonic() + 30
+        while daemon.job(job.job_id).status != "running" and time.monotonic() < deadline:
+            time.sleep(0.05)
+        worker = daemon.worker_status()[daemon.job(job.job_id).worker]
+        os.kill(worker["pid"], signal.SIGKILL)
+
+        job = daemon.wait(job.job_id, timeout=30)
+
+    assert job.status == "failed"
+    assert "crashed" in job.error
+    while daemon.worker_status()[job.worker]["restarts"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    restarted = daemon.worker_status()[job.worker]
+    assert restarted["restarts"] == 1
+    assert restarted["pid"] != worker["pid"]
+    assert restarted["alive"]
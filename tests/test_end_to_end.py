@@ -0,0 +1,90 @@
+"""End-to-end tests of the browser engines.
+
+This module runs the sync engine (`respond_to_slido_quiz`) and the async engine (`respond_to_slido_quiz_async`)
+in headless Chromium against the local stand-in server, answering with the deterministic stub model, and
+checks the votes recorded by the server, as well as a wait for a question across a reload of the page.
+The tests are skipped when the Playwright Chromium build is not installed.
+"""
+
+import asyncio
+
+import pytest
+from playwright.async_api import async_playwright
+
+from slido_quiz_bot import async_slido_bot
+from slido_quiz_bot.answer_quiz_question import Answerer, set_default_answerer
+from slido_quiz_bot.async_slido_bot import respond_to_slido_quiz_async
+from slido_quiz_bot.benchmark import stub_model_factory
+from slido_quiz_bot.load_test import summarize_results
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.slido_bot import respond_to_slido_quiz
+from slido_quiz_bot.stand_in_server import SlidoStandInServer
+
+QUIZ = [
+    QuizQuestion(question="What is the capital of France?", answer_choices=["Berlin", "Paris", "Rome"], correct_answer_index=1),
+    QuizQuestion(question="How many legs does a spider have?", answer_choices=["6", "8", "10"], correct_answer_index=1),
+    QuizQuestion(question="Which planet is closest to the sun?", answer_choices=["Mercury", "Venus"], correct_answer_index=0),
+]
+
+
+@pytest.fixture(autouse=True)
+def stub_answerer(monkeypatch):
+    """Answers every question correctly with the stub model, in a headless browser."""
+    # The engines run the browser headless inside Docker, which they detect from the HOSTNAME variable
+    monkeypatch.setenv("HOSTNAME", "slido-quiz-bot-tests")
+    set_default_answerer(Answerer(model_factory=stub_model_factory(QUIZ, accuracy=1.0, latency=0.01)))
+
+
+def assert_every_vote_is_correct(results, participant_names):
+    """Checks that every participant voted once for the correct option of every poll."""
+    assert sorted(results["participants"].values()) == sorted(participant_names)
+    assert [poll["question"] for poll in results["polls"]] == [quiz_question.question for quiz_question in QUIZ]
+    for poll in results["polls"]:
+        assert sorted(vote["participant_id"] for vote in poll["votes"]) == sorted(results["participants"])
+        assert {vote["option_id"] for vote in poll["votes"]} == {poll["correct_option_id"]}
+    report = summarize_results(results, len(participant_names), len(QUIZ), wall_time=0.0)
+    assert report.votes == report.expected_votes
+    assert report.accuracy == 1.0
+
+
+def test_sync_engine_answers_the_stand_in_quiz(chromium):
+    """Test that the single participant engine answers every question of the stand-in quiz correctly."""
+    with SlidoStandInServer(QUIZ, expected_participants=1, question_duration=20, question_gap=0.1) as server:
+        respond_to_slido_quiz(server.url, "Ada Lovelace", warm_up=False)
+        results = server.results()
+
+    assert_every_vote_is_correct(results, ["Ada Lovelace"])
+
+
+def test_async_engine_answers_the_stand_in_quiz(chromium):
+    """Test that several participants sharing one browser answer every question of the stand-in quiz correctly."""
+    participant_names = ["Ada Lovelace", "Grace Hopper", "Alan Turing"]
+    with SlidoStandInServer(QUIZ, expected_participants=len(participant_names), question_duration=20, question_gap=0.1) as server:
+        asyncio.run(respond_to_slido_quiz_async(server.url, participant_names, warm_up=False, headless=True))
+        results = server.results()
+
+    assert_every_vote_is_correct(results, participant_names)
+
+
+def test_wait_for_question_survives_a_reload(chromium):
+    """Test that a participant waiting for a question keeps waiting on the reloaded page and gets the first question."""
+
+    async def wait_across_reload(server):
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            page = await browser.new_page()
+            await async_slido_bot.install_question_watcher(page)
+            await page.goto(server.url)
+            await async_slido_bot.enter_participant_name(page, "Ada Lovelace")
+            waiting = asyncio.create_task(async_slido_bot.wait_for_question(page, timeout=20_000))
+            await asyncio.sleep(0.5)
+            await page.reload()
+            server.start_quiz()
+            question = await waiting
+            await browser.close()
+            return question
+
+    with SlidoStandInServer(QUIZ, expected_participants=2, question_duration=5, question_gap=0.1) as server:
+        question = asyncio.run(wait_across_reload(server))
+
+    assert question == f"1/{len(QUIZ)}␞{QUIZ[0].question}"
@@ -0,0 +1,143 @@
+"""Tests for the `flight_recorder` module.
+
+This module contains unit tests for the bounded per-participant buffers, the slow-question and
+failure dumps and the overhead budget, and checks that the answerer and the browserless participants
+feed the recorder.
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from slido_quiz_bot import flight_recorder
+from slido_quiz_bot.answer_quiz_question import Answerer
+from slido_quiz_bot.flight_recorder import FlightRecorder
+from slido_quiz_bot.metrics import Metrics, labels, set_metrics
+from slido_quiz_bot.protocol_client import ProtocolParticipant
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.single_flight import AnswerCoordinator
+from slido_quiz_bot.stand_in_server import SlidoStandInServer
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    """Installs a disabled metrics registry with a flight recorder, with no overhead limit, for the duration of a test."""
+    recorder = FlightRecorder(tmp_path / "records", capacity=4, slow_question_threshold=0.5, overhead_budget=1.0)
+    set_metrics(Metrics(enabled=False, recorder=recorder))
+    yield recorder
+    set_metrics(None)
+
+
+def read_record(path):
+    """Returns the content of a flight record."""
+    return json.loads(path.read_text())
+
+
+def test_buffers_are_bounded_per_participant(recorder):
+    """Test that every participant keeps only its latest events, and a dump holds its own events only."""
+    with labels(participant="Ada"):
+        for number in range(10):
+            flight_recorder.record("snapshot", counter=f"{number}/10")
+    with labels(participant="Grace"):
+        flight_recorder.record("snapshot", counter="1/10")
+
+    with labels(participant="Ada"):
+        record = read_record(flight_recorder.dump("failure", error="boom"))
+
+    assert record["participant"] == "Ada"
+    assert record["error"] == "boom"
+    assert [event["counter"] for event in record["events"]] == ["6/10", "7/10", "8/10", "9/10"]
+    assert recorder.events == 11
+
+
+def test_spans_are_recorded_while_metrics_are_disabled(recorder):
+    """Test that spans reach the recorder without filling the disabled histograms."""
+    metrics = Metrics(enabled=False, recorder=recorder)
+
+    with labels(participant="Ada", question="1"), metrics.span("submit"):
+        pass
+
+    assert metrics.histogram("submit")[0][-1] == 0
+    with labels(participant="Ada"):
+        (event,) = read_record(recorder.dump("failure"))["events"]
+    assert (event["kind"], event["stage"], event["question"]) == ("stage", "submit", "1")
+
+
+def test_slow_question_is_dumped(recorder):
+    """Test that a question slower than the threshold is dumped, and a fast one is not."""
+    metrics = Metrics(enabled=False, recorder=recorder)
+
+    with labels(participant="Ada Lovelace"):
+        metrics.observe("question", 0.1)
+        metrics.observe("question", 0.6)
+
+    (path,) = recorder.dumps
+    assert "Ada_Lovelace-slow_question" in path.name
+    assert read_record(path)["duration"] == 0.6
+
+
+def test_overhead_budget_drops_events(tmp_path):
+    """Test that events are dropped once the recorder exceeds its overhead budget."""
+    recorder = FlightRecorder(tmp_path, overhead_budget=0.0)
+
+    recorder.record("snapshot")
+    recorder.record("snapshot")
+
+    assert (recorder.events, recorder.dropped) == (1, 1)
+    assert "1 dropped" in recorder.summary()
+
+
+def test_concurrent_events_are_all_counted(tmp_path):
+    """Test that events recorded from many threads at once are each either recorded or counted as dropped."""
+    recorder = FlightRecorder(tmp_path, overhead_budget=0.0)
+
+    def record_many():
+        for _ in range(1_000):
+            recorder.record("snapshot")
+
+    threads = [threading.Thread(target=record_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert (recorder.events, recorder.dropped) == (1, 7_999)
+
+
+def test_answerer_records_model_requests(recorder):
+    """Test that the answerer records the prompt and response of every model request, failed ones included."""
+    failing, answering = MagicMock(), MagicMock()
+    failing.generate_content.side_effect = ConnectionError("unavailable")
+    answering.generate_content.return_value.text = "1"
+    answerer = Answerer(model_names=["failing", "answering"], model_factory={"failing": failing, "answering": answering}.get)
+
+    answerer.answer(QuizQuestion(question="2 + 2?", answer_choices=["3", "4"], correct_answer_index=None))
+
+    events = [event for event in read_record(recorder.dump("failure"))["events"] if event["kind"] == "model"]
+    assert [(event["model"], event["response"], "error" in event) for event in events] == [("failing", None, True), ("answering", "1", False)]
+    assert "2 + 2?" in events[1]["prompt"]
+
+
+def test_failed_participant_is_dumped(recorder):
+    """Test that a browserless participant failing on a poll writes its recent events to a flight record."""
+
+    def failing_answer(quiz_question):
+        raise ValueError("The model answered nonsense.")
+
+    quiz = [QuizQuestion(question="What is the capital of France?", answer_choices=["Berlin", "Paris"], correct_answer_index=1)]
+    with SlidoStandInServer(quiz, question_duration=10, question_gap=0.05) as server:
+        participant = ProtocolParticipant(server.base_url, "Ada", AnswerCoordinator(failing_answer))
+
+        with pytest.raises(ConnectionAbortedError):
+            asyncio.run(participant.run())
+
+    (path,) = recorder.dumps
+    record = read_record(path)
+    assert (record["reason"], record["participant"]) == ("failure", "Ada")
+    assert "nonsense" in record["error"]
+    snapshot = next(event for event in record["events"] if event["kind"] == "snapshot")
+    assert snapshot["options"] == ["Berlin", "Paris"]
+    assert any(event["kind"] == "stage" and event["stage"] == "question" and event["error"] == "ValueError" for event in record["events"])
@@ -0,0 +1,14 @@
+"""Tests for the `__main__` module.
+
+This module contains unit tests for the command line helpers, which must not need the browser engines.
+"""
+
+from slido_quiz_bot.__main__ import participant_names_from_args
+
+
+def test_participant_names_from_args():
+    """Test that participant names are used as given or numbered to reach the requested count."""
+    assert participant_names_from_args(["Alan Turing"]) == ["Alan Turing"]
+    assert participant_names_from_args(["Ada", "Grace"]) == ["Ada", "Grace"]
+    assert participant_names_from_args(["Ada", "Grace"], 1) == ["Ada"]
+    assert participant_names_from_args(["Ada", "Grace"], 4) == ["Ada", "Grace", "Ada 3", "Ada 4"]
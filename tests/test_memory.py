@@ -0,0 +1,78 @@
+"""Tests for the `memory` module.
+
+This module contains unit tests for the launch profiles, the process memory read from `/proc`, the
+memory sampler and the participants-per-GB report.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from slido_quiz_bot.memory import (
+    BYTES_PER_GB,
+    BYTES_PER_MB,
+    MemoryReport,
+    MemorySampler,
+    browser_memory,
+    child_processes,
+    launch_args,
+    process_memory,
+)
+
+requires_proc = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="process memory is read from Linux's /proc")
+
+
+@pytest.fixture
+def child_process():
+    """Starts a child process holding about 50 MB of memory for the duration of a test."""
+    code = "import sys, time; data = bytearray(50 * 1024 * 1024); data[::4096] = b'x' * len(data[::4096]); print(flush=True); time.sleep(60)"
+    process = subprocess.Popen([sys.executable, "-c", code], stdout=subprocess.PIPE)
+    process.stdout.readline()
+    yield process
+    process.kill()
+    process.wait()
+
+
+def test_launch_args():
+    """Test that the launch profiles add switches on top of each other, and unknown profiles are rejected."""
+    assert launch_args("default") == []
+    assert "--disable-gpu" in launch_args("low_memory")
+    assert set(launch_args("low_memory")) - {"--js-flags=--optimize-for-size"} < set(launch_args("minimal"))
+    assert "--process-per-site" in launch_args("minimal")
+
+    with pytest.raises(ValueError, match="Unknown launch profile"):
+        launch_args("tiny")
+
+
+@requires_proc
+def test_browser_memory_sums_child_processes(child_process):
+    """Test that the memory of the child processes includes a child holding 50 MB."""
+    assert child_process.pid in child_processes(os.getpid())
+    assert process_memory(child_process.pid) > 40 * BYTES_PER_MB
+    assert browser_memory() >= process_memory(child_process.pid)
+
+
+@requires_proc
+def test_sampler_reports_participants_per_gb(child_process):
+    """Test that the sampler keeps the peak memory of the child processes and reports it per participant."""
+    with MemorySampler(interval=0.01) as sampler:
+        pass
+
+    report = sampler.report(participants=10, recycles=2)
+
+    assert sampler.samples >= 1
+    assert report.peak_bytes > 40 * BYTES_PER_MB
+    assert report.recycles == 2
+    assert report.participants_per_gb == pytest.approx(10 * BYTES_PER_GB / report.peak_bytes)
+
+
+def test_memory_report():
+    """Test the per-participant figures of a memory report."""
+    report = MemoryReport(participants=20, peak_bytes=BYTES_PER_GB // 2, recycles=3)
+
+    assert report.per_participant_mb == pytest.approx(25.6)
+    assert report.participants_per_gb == pytest.approx(40)
+    assert "40.0 participants per GB" in report.summary()
+    assert MemoryReport(participants=1, peak_bytes=0).participants_per_gb == 0.0
@@ -0,0 +1,103 @@
+"""Tests for the `metrics` module.
+
+This module contains unit tests for the span histograms, the counters, the JSONL trace and the
+OpenMetrics endpoint, and checks that the answerer reports its model requests.
+"""
+
+import json
+import urllib.request
+from unittest.mock import MagicMock
+
+import pytest
+
+from slido_quiz_bot.answer_quiz_question import Answerer
+from slido_quiz_bot.metrics import Metrics, get_metrics, labels, set_metrics
+from slido_quiz_bot.quizz_question import QuizQuestion
+
+
+@pytest.fixture
+def metrics(tmp_path):
+    """Installs an enabled metrics registry with a trace file for the duration of a test."""
+    metrics = Metrics(trace_path=tmp_path / "trace.jsonl", buckets=(0.1, 1.0))
+    set_metrics(metrics)
+    yield metrics
+    set_metrics(None)
+    metrics.close()
+
+
+def read_trace(metrics):
+    """Returns the records of a registry's trace file."""
+    return [json.loads(line) for line in metrics.trace_path.read_text().splitlines()]
+
+
+def test_disabled_metrics_record_nothing():
+    """Test that the default registry is disabled and its spans are a shared no-op."""
+    metrics = get_metrics()
+
+    with metrics.span("detect") as span:
+        span.set(model="gemini-1.5-flash")
+    metrics.increment("cache_hits")
+
+    assert not metrics.enabled
+    assert metrics.span("detect") is metrics.span("submit")
+    assert metrics.counter("cache_hits") == 0
+    assert metrics.histogram("detect")[0][-1] == 0
+
+
+def test_span_records_histogram_and_trace(metrics):
+    """Test that spans fill the stage histogram and are traced with every label, including the context labels."""
+    metrics.observe("detect", 0.05)
+    with labels(participant="Ada", question="2"), pytest.raises(RuntimeError), metrics.span("submit", model="m"):
+        raise RuntimeError("click failed")
+
+    assert metrics.histogram("detect") == ([1, 1, 1], 0.05)
+    assert metrics.histogram("submit", model="m")[0][-1] == 1
+    assert metrics.counter("stage_errors", stage="submit", model="m") == 1
+    record = read_trace(metrics)[1]
+    assert {key: record[key] for key in ("stage", "model", "participant", "question", "error")} == {
+        "stage": "submit",
+        "model": "m",
+        "participant": "Ada",
+        "question": "2",
+        "error": "RuntimeError",
+    }
+
+
+def test_render_openmetrics(metrics):
+    """Test the OpenMetrics exposition of histograms and counters."""
+    metrics.observe("model_request", 0.5, model="gemini-1.5-flash")
+    metrics.increment("model_fallbacks", model="gemini-1.5-flash")
+
+    text = metrics.render()
+
+    assert 'slido_quiz_bot_stage_seconds_bucket{stage="model_request",model="gemini-1.5-flash",le="0.1"} 0' in text
+    assert 'slido_quiz_bot_stage_seconds_bucket{stage="model_request",model="gemini-1.5-flash",le="+Inf"} 1' in text
+    assert 'slido_quiz_bot_model_fallbacks_total{model="gemini-1.5-flash"} 1' in text
+    assert text.endswith("# EOF\n")
+
+
+def test_metrics_endpoint(metrics):
+    """Test that the local endpoint serves the rendered metrics."""
+    metrics.observe("detect", 0.2)
+    url = metrics.serve(port=0)
+
+    with urllib.request.urlopen(url) as response:
+        body = response.read().decode()
+
+    assert response.headers["Content-Type"].startswith("application/openmetrics-text")
+    assert 'slido_quiz_bot_stage_seconds_count{stage="detect"} 1' in body
+
+
+def test_answerer_reports_model_requests(metrics):
+    """Test that the answerer times its model requests and counts fallbacks per model."""
+    failing, answering = MagicMock(), MagicMock()
+    failing.generate_content.side_effect = ConnectionError("unavailable")
+    answering.generate_content.return_value.text = "1"
+    answerer = Answerer(model_names=["failing", "answering"], model_factory={"failing": failing, "answering": answering}.get)
+
+    answerer.answer(QuizQuestion(question="2 + 2?", answer_choices=["3", "4"], correct_answer_index=None))
+
+    assert metrics.histogram("model_request", model="answering")[0][-1] == 1
+    assert metrics.counter("stage_errors", stage="model_request", model="failing") == 1
+    assert metrics.counter("model_fallbacks", model="failing") == 1
+    assert metrics.histogram("answer_quiz_question")[0][-1] == 1
@@ -0,0 +1,74 @@
+"""Tests for the `ModelRouter` class.
+
+This module contains unit tests to verify that models are ranked by their observed latency
+and taken out of rotation by the circuit breaker when they keep failing.
+"""
+
+from slido_quiz_bot.model_router import ModelRouter
+
+
+class FakeClock:
+    """A manually advanced clock for the circuit breaker cool-down."""
+
+    def __init__(self):
+        """Starts the clock at zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Returns the current time."""
+        return self.now
+
+
+def test_models_without_samples_keep_configured_order():
+    """Test that the configured order is used until latencies are known."""
+    router = ModelRouter(["flash", "pro"])
+    assert router.ranked_models() == ["flash", "pro"]
+
+
+def test_models_are_ranked_by_median_latency():
+    """Test that the fastest model is tried first and the latency percentiles are reported."""
+    router = ModelRouter(["flash", "pro"])
+    for latency in (0.9, 1.0, 1.1):
+        router.record_success("flash", latency)
+    for latency in (0.3, 0.4, 2.0):
+        router.record_success("pro", latency)
+
+    assert router.ranked_models() == ["pro", "flash"]
+    assert router.latency("flash") == 1.0
+    assert router.latency("pro", 95) > router.latency("pro", 50)
+
+
+def test_circuit_breaker_opens_and_closes():
+    """Test that consecutive failures take a model out of rotation for the cool-down period."""
+    clock = FakeClock()
+    router = ModelRouter(["flash", "pro"], max_consecutive_failures=2, cooldown=30.0, clock=clock)
+
+    router.record_failure("flash")
+    assert router.ranked_models() == ["flash", "pro"]
+    router.record_failure("flash")
+    assert router.ranked_models() == ["pro"]
+    assert not router.is_available("flash")
+
+    clock.now = 31.0
+    assert router.ranked_models() == ["flash", "pro"]
+
+
+def test_error_rate_opens_circuit_breaker():
+    """Test that a high error rate over the window opens the circuit breaker."""
+    router = ModelRouter(["flash"], max_consecutive_failures=100, max_error_rate=0.5, min_samples=4, clock=FakeClock())
+    for _ in range(2):
+        router.record_success("flash", 0.5)
+        router.record_failure("flash")
+
+    assert not router.is_available("flash")
+
+
+def test_all_models_open_still_returns_a_model():
+    """Test that the model closest to recovery is still tried when every circuit breaker is open."""
+    clock = FakeClock()
+    router = ModelRouter(["flash", "pro"], max_consecutive_failures=1, cooldown=30.0, clock=clock)
+    router.record_failure("pro")
+    clock.now = 5.0
+    router.record_failure("flash")
+
+    assert router.ranked_models() == ["pro", "flash"]
@@ -0,0 +1,96 @@
+"""Tests for the `network_filter` module.
+
+This module contains unit tests for the network profiles and the route handler, using mocked
+Playwright routes, requests and responses.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from slido_quiz_bot.network_filter import NETWORK_PROFILES, NetworkFilter, NetworkProfile, load_network_profile
+from slido_quiz_bot.slido_bot import install_network_filter
+
+
+def mock_request(url, resource_type):
+    """Creates a mocked Playwright request."""
+    request = MagicMock()
+    request.url = url
+    request.resource_type = resource_type
+    return request
+
+
+@pytest.mark.parametrize(
+    "url, resource_type, blocked",
+    [
+        ("https://app.sli.do/event/abc", "document", False),
+        ("https://app.sli.do/static/main.js", "script", False),
+        ("https://app.sli.do/static/logo.png", "image", True),
+        ("https://fonts.gstatic.com/roboto.woff2", "font", True),
+        ("https://www.google-analytics.com/analytics.js", "script", True),
+        ("https://google-analytics.com/collect", "xhr", True),
+        ("https://app.sli.do/static/main.css", "stylesheet", False),
+    ],
+)
+def test_default_profile(url, resource_type, blocked):
+    """Test that the default profile blocks media and trackers but keeps the Slido application."""
+    assert NETWORK_PROFILES["default"].should_block(url, resource_type) is blocked
+
+
+def test_allowed_hosts_take_precedence():
+    """Test that allowed hosts are never blocked, even for blocked resource types."""
+    profile = NETWORK_PROFILES["strict"]
+
+    assert not profile.should_block("https://app.sli.do/static/main.css", "stylesheet")
+    assert profile.should_block("https://cdn.example.com/main.css", "stylesheet")
+
+
+@pytest.mark.parametrize("profile_name", NETWORK_PROFILES)
+@pytest.mark.parametrize("resource_type", ["eventsource", "websocket", "xhr", "fetch"])
+def test_profiles_keep_the_real_time_channels(profile_name, resource_type):
+    """Test that no profile blocks the channels the questions are pushed over, on Slido or any other quiz host."""
+    for url in ("https://app.sli.do/api/stream", "http://127.0.0.1:8080/api/stream"):
+        assert not NETWORK_PROFILES[profile_name].should_block(url, resource_type)
+
+
+def test_load_network_profile(tmp_path):
+    """Test that profiles are loaded by name or from a JSON file."""
+    path = tmp_path / "video_only.json"
+    path.write_text(json.dumps({"blocked_resource_types": ["media"], "blocked_hosts": ["*.vimeo.com"]}))
+
+    profile = load_network_profile(str(path))
+
+    assert load_network_profile("off") is NETWORK_PROFILES["off"]
+    assert profile == NetworkProfile("video_only", frozenset({"media"}), ("*.vimeo.com",))
+    with pytest.raises(ValueError):
+        load_network_profile("does-not-exist")
+
+
+def test_handle_route_counts_requests():
+    """Test that blocked requests are aborted and counted per resource type, and the others continued."""
+    network_filter = NetworkFilter(NETWORK_PROFILES["default"])
+    image_route, script_route = MagicMock(), MagicMock()
+
+    network_filter.handle_route(image_route, mock_request("https://app.sli.do/logo.png", "image"))
+    network_filter.handle_route(script_route, mock_request("https://app.sli.do/main.js", "script"))
+    network_filter.record_response(MagicMock(headers={"content-length": "2048"}))
+    network_filter.record_response(MagicMock(headers={}))
+
+    image_route.abort.assert_called_once_with("blockedbyclient")
+    script_route.continue_.assert_called_once_with()
+    assert network_filter.blocked_requests == {"image": 1}
+    assert network_filter.allowed_requests == 1
+    assert network_filter.loaded_bytes == 2048
+    assert "1 requests blocked (image: 1)" in network_filter.summary()
+    assert "2 KiB loaded by the allowed requests" in network_filter.summary()
+
+
+def test_install_network_filter_skips_routing_when_off():
+    """Test that the off profile only records responses, without intercepting any request."""
+    page = MagicMock()
+
+    install_network_filter(page, NetworkFilter(NETWORK_PROFILES["off"]))
+
+    page.route.assert_not_called()
+    page.on.assert_called_once()
@@ -0,0 +1,118 @@
+"""Tests for the `protocol_client` module.
+
+This module contains end-to-end tests of the browserless participants against the local stand-in
+server, answering with the deterministic stub model, and unit tests of the event stream parser.
+"""
+
+import asyncio
+
+import pytest
+
+from slido_quiz_bot import protocol_client
+from slido_quiz_bot.answer_quiz_question import Answerer, set_default_answerer
+from slido_quiz_bot.benchmark import stub_model_factory
+from slido_quiz_bot.load_test import summarize_results
+from slido_quiz_bot.protocol_client import (
+    ProtocolEndpoints,
+    ProtocolError,
+    ProtocolParticipant,
+    check_stand_in_url,
+    read_events,
+    respond_to_slido_quiz_protocol,
+)
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.single_flight import AnswerCoordinator
+from slido_quiz_bot.stand_in_server import SlidoStandInServer
+
+QUIZ = [
+    QuizQuestion(question="What is the capital of France?", answer_choices=["Berlin", "Paris", "Rome"], correct_answer_index=1),
+    QuizQuestion(question="How many legs does a spider have?", answer_choices=["6", "8", "10"], correct_answer_index=1),
+    QuizQuestion(question="Which planet is closest to the sun?", answer_choices=["Mercury", "Venus"], correct_answer_index=0),
+]
+
+
+def test_read_events():
+    """Test that events are split on blank lines, keep their type and multi-line data, and skip comments."""
+
+    async def collect():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b': keep-alive\n\nevent: state\ndata: {"a":\ndata: 1}\n\ndata: plain\r\n\r\n')
+        reader.feed_eof()
+        return [event async for event in read_events(reader)]
+
+    assert asyncio.run(collect()) == [("state", '{"a":\n1}'), ("message", "plain")]
+
+
+def test_participants_answer_every_poll():
+    """Test that browserless participants join, answer every poll correctly and stop when the quiz ends."""
+    set_default_answerer(Answerer(model_factory=stub_model_factory(QUIZ, accuracy=1.0)))
+
+    with SlidoStandInServer(QUIZ, expected_participants=20, question_duration=10, question_gap=0.05) as server:
+        asyncio.run(respond_to_slido_quiz_protocol(server.url, [f"Participant {i}" for i in range(20)], warm_up=False))
+        report = summarize_results(server.results(), 20, len(QUIZ), wall_time=0.0)
+
+    assert report.votes == report.expected_votes == 60
+    assert report.accuracy == 1.0
+
+
+def test_idle_stream_raises_builtin_timeout_error():
+    """Test that a silent event stream raises the builtin `TimeoutError`, also before Python 3.11."""
+
+    async def collect():
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"event: state\ndata: {}\n\n")
+        return [event async for event in read_events(reader, idle_timeout=0.05)]
+
+    with pytest.raises(TimeoutError, match="silent") as excinfo:
+        asyncio.run(collect())
+    assert type(excinfo.value) is TimeoutError
+
+
+def test_idle_stream_aborts_the_participant(monkeypatch):
+    """Test that a participant whose event stream goes silent is reported as aborted, not crashed."""
+    monkeypatch.setattr(protocol_client, "STREAM_IDLE_TIMEOUT", 0.05)
+
+    async def silent_stream(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n\r\n")
+        await writer.drain()
+        await asyncio.sleep(1)
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(silent_stream, "127.0.0.1", 0)
+        async with server:
+            base_url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            participant = ProtocolParticipant(base_url, "Ada", AnswerCoordinator(lambda quiz_question: 0))
+            participant.participant_id = "ada"
+            await participant.run()
+
+    with pytest.raises(ConnectionAbortedError, match="silent"):
+        asyncio.run(run())
+
+
+def test_join_refused_raises_protocol_error():
+    """Test that a join answered with an error is reported as a protocol error."""
+    with SlidoStandInServer(QUIZ) as server:
+        endpoints = ProtocolEndpoints(join="/api/unknown")
+        participant = ProtocolParticipant(server.base_url, "Ada", AnswerCoordinator(lambda quiz_question: 0), endpoints=endpoints)
+
+        with pytest.raises(ProtocolError):
+            asyncio.run(participant.join())
+
+
+@pytest.mark.parametrize(
+    "quiz_url", ["http://127.0.0.1:8080/event/stand-in", "http://localhost:8080/event/x", "http://10.0.0.7/event/x", "http://[::1]:80/"]
+)
+def test_stand_in_urls_are_accepted(quiz_url):
+    """Test that URLs on localhost, loopback and private addresses are accepted."""
+    check_stand_in_url(quiz_url)
+
+
+@pytest.mark.parametrize("quiz_url", ["https://app.sli.do/event/abc", "https://8.8.8.8/event/abc", "not a url"])
+def test_real_quiz_urls_are_refused(quiz_url):
+    """Test that the protocol backend refuses the real Slido service and other public hosts before connecting."""
+    with pytest.raises(ValueError, match="use the browser engines"):
+        check_stand_in_url(quiz_url)
+    with pytest.raises(ValueError, match="use the browser engines"):
+        asyncio.run(respond_to_slido_quiz_protocol(quiz_url, ["Ada"], warm_up=False))
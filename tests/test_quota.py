@@ -0,0 +1,142 @@
+"""Tests for the `quota` module.
+
+This module contains unit tests for the shared token buckets, the priority order and back-off of
+the quota scheduler, and its integration in the answerer, using a fake clock and mocked models.
+"""
+
+import multiprocessing
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from slido_quiz_bot.answer_quiz_question import Answerer
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.quota import Priority, QuotaScheduler, QuotaTimeoutError, SharedTokenBucket, is_rate_limit_error
+
+
+class FakeClock:
+    """A wall clock advanced by hand."""
+
+    def __init__(self):
+        """Starts the clock at an arbitrary time."""
+        self.now = 1_000.0
+
+    def __call__(self):
+        """Returns the current time."""
+        return self.now
+
+
+class ResourceExhausted(Exception):
+    """Mimics the error raised by the Gemini client on a 429."""
+
+
+def _acquire_tokens(path, attempts):
+    """Tries to take tokens from a shared bucket in another process, returning how many were taken."""
+    bucket = SharedTokenBucket(rate=1e-6, capacity=5, path=path)
+    return sum(1 for _ in range(attempts) if bucket.try_acquire() == 0)
+
+
+def test_bucket_paces_requests():
+    """Test that a bucket allows a burst of its capacity, then one request per refilled token."""
+    clock = FakeClock()
+    bucket = SharedTokenBucket(rate=1.0, capacity=2, clock=clock)
+
+    assert [bucket.try_acquire(), bucket.try_acquire()] == [0, 0]
+    assert bucket.try_acquire() == pytest.approx(1.0)
+    clock.now += 1.0
+    assert bucket.try_acquire() == 0
+
+
+def test_bucket_is_shared_across_processes(tmp_path):
+    """Test that processes sharing a bucket file never take more tokens than its capacity in total."""
+    path = tmp_path / "model.json"
+    with ProcessPoolExecutor(4, mp_context=multiprocessing.get_context("fork")) as executor:
+        taken = list(executor.map(_acquire_tokens, [path] * 4, [5] * 4))
+
+    assert sum(taken) == 5
+
+
+def test_background_requests_leave_a_reserve_to_live_ones():
+    """Test that background requests stop short of the reserve, which live requests can still use."""
+    scheduler = QuotaScheduler(60, burst=4, background_reserve=0.25, max_wait=0.05, clock=FakeClock())
+
+    for _ in range(3):
+        scheduler.acquire("model", Priority.BACKGROUND)
+    with pytest.raises(QuotaTimeoutError):
+        scheduler.acquire("model", Priority.BACKGROUND)
+    scheduler.acquire("model", Priority.LIVE)
+
+
+def test_live_requests_are_served_first():
+    """Test that a live request waiting behind a background one gets the next token."""
+    clock = FakeClock()
+    scheduler = QuotaScheduler(60, burst=1, max_wait=None, clock=clock)
+    scheduler.acquire("model")
+    served = []
+
+    def acquire(priority):
+        scheduler.acquire("model", priority)
+        served.append(priority)
+
+    background = threading.Thread(target=acquire, args=(Priority.BACKGROUND,))
+    background.start()
+    time.sleep(0.05)
+    live = threading.Thread(target=acquire, args=(Priority.LIVE,))
+    live.start()
+    time.sleep(0.05)
+    clock.now += 1.0
+    live.join(timeout=5)
+    clock.now += 1.0
+    background.join(timeout=5)
+
+    assert served == [Priority.LIVE, Priority.BACKGROUND]
+
+
+def test_rate_limited_model_backs_off_exponentially():
+    """Test that consecutive 429s double the back-off shared through the bucket, and a success resets it."""
+    clock = FakeClock()
+    scheduler = QuotaScheduler({"slow": 60, "fast": 60}, backoff_base=2.0, clock=clock)
+
+    assert [scheduler.record_rate_limited("slow"), scheduler.record_rate_limited("slow")] == [2.0, 4.0]
+    assert scheduler.rank(["slow", "fast"]) == ["fast", "slow"]
+    scheduler.record_success("slow")
+    assert scheduler.record_rate_limited("slow") == 2.0
+
+
+def test_scheduler_is_picklable(tmp_path):
+    """Test that a scheduler sent to another process keeps sharing its buckets through its directory."""
+    clock = FakeClock()
+    scheduler = QuotaScheduler(60, state_dir=tmp_path, burst=1, max_wait=0, clock=clock)
+    copy = pickle.loads(pickle.dumps(scheduler))
+
+    scheduler.acquire("model")
+    with pytest.raises(QuotaTimeoutError):
+        copy.acquire("model")
+
+
+def test_is_rate_limit_error():
+    """Test that 429s are recognized by their type, code or message."""
+    assert is_rate_limit_error(ResourceExhausted("quota"))
+    assert is_rate_limit_error(RuntimeError("429 Too Many Requests"))
+    assert not is_rate_limit_error(RuntimeError("500 Internal error"))
+
+
+def test_answerer_backs_off_rate_limited_models():
+    """Test that a model answering with a 429 is backed off, and the next questions go to the other model first."""
+    limited_model = MagicMock()
+    limited_model.generate_content.side_effect = ResourceExhausted("429 quota exceeded")
+    other_model = MagicMock()
+    other_model.generate_content.return_value.text = "1"
+    models = {"limited": limited_model, "other": other_model}
+    answerer = Answerer(model_names=["limited", "other"], model_factory=models.__getitem__, quota=QuotaScheduler(600))
+    quiz_question = QuizQuestion(question="Which one?", answer_choices=["A", "B"], correct_answer_index=None)
+    second_question = QuizQuestion(question="Which other one?", answer_choices=["A", "B"], correct_answer_index=None)
+
+    assert answerer.answer(quiz_question) == 1
+    assert answerer.answer(second_question) == 1
+    assert limited_model.generate_content.call_count == 1
+    assert other_model.generate_content.call_count == 2
@@ -0,0 +1,131 @@
+"""Tests for the `similarity_index` module.
+
+This module contains unit tests for the lookup of reworded questions, the matching of choices by
+text, the rejection of questions with an opposite meaning, the JSONL log, and the integration of the
+index in the answerer.
+"""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from slido_quiz_bot.answer_cache import AnswerCache
+from slido_quiz_bot.answer_quiz_question import Answerer
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.similarity_index import SimilarityIndex, tokenize
+
+PLANETS = ["Mercury", "Earth", "Jupiter", "Mars"]
+
+
+@pytest.fixture
+def quiz_question():
+    """Creates a quiz question answered with 'Paris'."""
+    return QuizQuestion(question="Which city is the capital of France?", answer_choices=["Berlin", "Paris", "Madrid"], correct_answer_index=None)
+
+
+@pytest.fixture
+def planet_index():
+    """Creates an index holding a question about the largest planet, answered with 'Jupiter'."""
+    index = SimilarityIndex()
+    question = "Which planet in our solar system is the largest planet by mass and by diameter?"
+    index.add(QuizQuestion(question=question, answer_choices=PLANETS, correct_answer_index=None), 2)
+    return index
+
+
+def test_tokenize():
+    """Test that text is split into normalized words."""
+    assert tokenize("  Which CITY is the capital of France? ") == ["which", "city", "is", "the", "capital", "of", "france"]
+
+
+def test_lookup_reworded_question_with_shuffled_choices(quiz_question):
+    """Test that a reworded question is answered by choice text, whatever the position of the choice."""
+    index = SimilarityIndex()
+    index.add(quiz_question, 1)
+    choices = ["Madrid", "Berlin", "Paris"]
+    reworded = QuizQuestion(question="Which city is the capital city of France?", answer_choices=choices, correct_answer_index=None)
+
+    assert index.lookup(reworded) == 2
+    assert index.hits == 1
+
+
+def test_lookup_rejects_different_questions(quiz_question):
+    """Test that questions that are not similar enough, or were asked with other choices, fall through."""
+    index = SimilarityIndex()
+    index.add(quiz_question, 1)
+    choices = quiz_question.answer_choices
+    other_country = QuizQuestion(question="Which city is the capital of Italy?", answer_choices=choices, correct_answer_index=None)
+    missing_answer = QuizQuestion(question=quiz_question.question, answer_choices=["Lyon", "Nice"], correct_answer_index=None)
+    other_choices = QuizQuestion(question=quiz_question.question, answer_choices=["Rome", "Paris"], correct_answer_index=None)
+
+    assert index.lookup(other_country) is None
+    assert index.lookup(missing_answer) is None
+    assert index.lookup(other_choices) is None
+    assert index.misses == 3
+
+
+@pytest.mark.parametrize(
+    "question",
+    [
+        "Which planet in our solar system is the smallest planet by mass and by diameter?",
+        "Which planet in our solar system is NOT the largest planet by mass and by diameter?",
+        "Which planet in our solar system isn't the largest planet by mass and by diameter?",
+        "Which planet in our solar system is the largest planet by mass and by diameter, except for Jupiter?",
+    ],
+)
+def test_lookup_rejects_opposite_meaning(planet_index, question):
+    """Test that a question differing from a past one by a negation or an antonym is not answered from it."""
+    quiz_question = QuizQuestion(question=question, answer_choices=PLANETS, correct_answer_index=None)
+
+    assert planet_index.lookup(quiz_question) is None
+
+
+def test_lookup_keeps_meaning_preserving_rewording(planet_index):
+    """Test that a rewording using the same contrast terms is still answered from the index."""
+    question = "In our solar system, which planet is the largest planet by mass and by diameter?"
+    quiz_question = QuizQuestion(question=question, answer_choices=list(reversed(PLANETS)), correct_answer_index=None)
+
+    assert planet_index.lookup(quiz_question) == 1
+
+
+def test_log_is_replayed(tmp_path, quiz_question):
+    """Test that the index is rebuilt from its log, with the latest answer of a question winning."""
+    path = tmp_path / "index.jsonl"
+    index = SimilarityIndex(path)
+    index.add(quiz_question, 0)
+    index.add(quiz_question, 1)
+    index.add(quiz_question, 1)
+
+    reopened = SimilarityIndex(path)
+
+    assert len(path.read_text().splitlines()) == 2
+    assert len(reopened) == 1
+    assert reopened.lookup(quiz_question) == 1
+
+
+def test_log_without_choices_never_matches(tmp_path, quiz_question):
+    """Test that entries logged without their choices are replayed, but never answer a question."""
+    path = tmp_path / "index.jsonl"
+    path.write_text(json.dumps({"key": "old", "question": quiz_question.question, "answer": "Paris"}) + "\n")
+
+    index = SimilarityIndex(path)
+
+    assert len(index) == 1
+    assert index.lookup(quiz_question) is None
+
+
+def test_answerer_uses_index_before_models(quiz_question):
+    """Test that the answerer answers from the index without a model call, indexes the model's answers, and does not cache index hits."""
+    model = MagicMock()
+    model.generate_content.return_value.text = "1"
+    index = SimilarityIndex()
+    cache = AnswerCache()
+    answerer = Answerer(model_names=["model"], model_factory=lambda model_name: model, similarity_index=index, cache=cache)
+
+    assert answerer.answer(quiz_question) == 1
+    choices = ["Paris", "Madrid", "Berlin"]
+    reworded = QuizQuestion(question="Which city is the capital city of France?", answer_choices=choices, correct_answer_index=None)
+    assert answerer.answer(reworded) == 0
+    assert model.generate_content.call_count == 1
+    assert len(index) == 1
+    assert cache.get(reworded) is None
@@ -0,0 +1,122 @@
+"""Tests for the `AnswerCoordinator` class.
+
+This module contains unit tests to verify that identical in-flight questions are answered with a
+single model call and that the answer strategies are applied per participant.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from slido_quiz_bot.quizz_question import QuizQuestion
+from slido_quiz_bot.single_flight import AnswerCoordinator
+
+
+class GatedAnswerer:
+    """An answer function that blocks until released, so concurrent requests overlap."""
+
+    def __init__(self, answer_index):
+        """Initializes the answerer with the index it will return."""
+        self.answer_index = answer_index
+        self.calls = 0
+        self.release = threading.Event()
+
+    def __call__(self, quiz_question):
+        """Waits for the release event and returns the configured answer index."""
+        self.calls += 1
+        self.release.wait(timeout=5)
+        return self.answer_index
+
+
+def test_concurrent_identical_questions_share_one_call(dummy_quiz_questions):
+    """Test that participants asking the same question concurrently trigger a single model call."""
+    quiz_question = dummy_quiz_questions[0]
+    answerer = GatedAnswerer(quiz_question.correct_answer_index)
+    coordinator = AnswerCoordinator(answerer)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        futures = [executor.submit(coordinator.answer, quiz_question, i) for i in range(5)]
+        while coordinator.model_calls + coordinator.coalesced < 5:
+            threading.Event().wait(0.01)
+        answerer.release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [quiz_question.correct_answer_index] * 5
+    assert answerer.calls == 1
+    assert (coordinator.model_calls, coordinator.coalesced) == (1, 4)
+
+
+def test_shared_answer_follows_shuffled_choices(dummy_quiz_questions):
+    """Test that followers resolve the shared answer against their own choice order."""
+    quiz_question = dummy_quiz_questions[0]
+    shuffled = QuizQuestion(quiz_question.question, list(reversed(quiz_question.answer_choices)), None)
+    answerer = GatedAnswerer(quiz_question.correct_answer_index)
+    coordinator = AnswerCoordinator(answerer)
+
+    async def run():
+        tasks = [asyncio.create_task(coordinator.answer_async(question)) for question in (quiz_question, shuffled)]
+        await asyncio.sleep(0.05)
+        answerer.release.set()
+        return await asyncio.gather(*tasks)
+
+    assert asyncio.run(run()) == [quiz_question.answer_choices.index("Paris"), shuffled.answer_choices.index("Paris")]
+    assert answerer.calls == 1
+
+
+def test_spread_strategy_assigns_different_choices(dummy_quiz_questions):
+    """Test that the spread strategy makes participants cover every choice."""
+    quiz_question = dummy_quiz_questions[0]
+    answerer = GatedAnswerer(quiz_question.correct_answer_index)
+    answerer.release.set()
+    coordinator = AnswerCoordinator(answerer, strategy="spread")
+
+    answers = [coordinator.answer(quiz_question, participant_index) for participant_index in range(4)]
+
+    assert answers[0] == quiz_question.correct_answer_index
+    assert sorted(answers) == [0, 1, 2, 3]
+
+
+def test_cancelled_waiter_does_not_cancel_the_others(dummy_quiz_questions):
+    """Test that cancelling one participant waiting on a shared answer leaves the leader and the other participants unaffected."""
+    quiz_question = dummy_quiz_questions[0]
+    answerer = GatedAnswerer(answer_index=1)
+    coordinator = AnswerCoordinator(answerer)
+
+    async def run():
+        tasks = [asyncio.create_task(coordinator.answer_async(quiz_question, participant_index=index)) for index in range(3)]
+        while answerer.calls == 0:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        tasks[2].cancel()
+        await asyncio.sleep(0.01)
+        answerer.release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    leader, follower, cancelled = asyncio.run(run())
+
+    assert (leader, follower) == (1, 1)
+    assert isinstance(cancelled, asyncio.CancelledError)
+    assert answerer.calls == 1
+    assert coordinator.answer(quiz_question) == 1
+
+
+def test_model_errors_reach_every_participant(dummy_quiz_questions):
+    """Test that a failing model call is reported to the participant and not kept in flight."""
+
+    def failing_answerer(quiz_question):
+        raise RuntimeError("All models failed to generate a valid answer.")
+
+    coordinator = AnswerCoordinator(failing_answerer)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="All models failed"):
+            coordinator.answer(dummy_quiz_questions[0])
+    assert coordinator.model_calls == 2
+
+
+def test_unknown_strategy():
+    """Test that an unknown strategy name is rejected."""
+    with pytest.raises(ValueError, match="Unknown answer strategy"):
+        AnswerCoordinator(strategy="telepathy")
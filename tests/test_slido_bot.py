@@ -0,0 +1,195 @@
+"""Tests for the `slido_bot` module.
+
+This module contains unit tests for the browser interaction helpers, using mocked
+Playwright page objects instead of a running browser.
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from slido_quiz_bot.question_watcher import NEXT_QUESTION_EXPRESSION, QUESTION_WATCHER_SCRIPT, SNAPSHOT_EXPRESSION, option_selector
+from slido_quiz_bot.slido_bot import (
+    JOIN_BUTTON_SELECTOR,
+    PARTICIPANT_NAME_SELECTOR,
+    REJOIN_CHECK_SELECTOR,
+    SEND_BUTTON_SELECTOR,
+    answer_question,
+    enter_participant_name,
+    install_question_watcher,
+    is_last_question_counter,
+    needs_participant_name,
+    wait_for_question,
+)
+
+
+def snapshot(question_text, answer_choices, counter="1/3"):
+    """Builds the object returned by the in-page snapshot of a question."""
+    option_ids = [f"option-{i}" for i in range(len(answer_choices))]
+    return {"question": question_text, "options": answer_choices, "optionIds": option_ids, "counter": counter}
+
+
+def mock_quiz_page(question_text, answer_choices, changed_choices=None, changed_question=None):
+    """Creates a mocked Playwright page showing a question, with one mocked locator per selector.
+
+    The in-page snapshot returns the question, and the options check reports `changed_choices`, if any,
+    with `changed_question` as its question text if given.
+    """
+    page = MagicMock()
+    locators = {}
+
+    def locator(selector):
+        if selector not in locators:
+            locators[selector] = MagicMock()
+        return locators[selector]
+
+    def evaluate(expression, args=None):
+        if expression == SNAPSHOT_EXPRESSION:
+            return snapshot(question_text, answer_choices)
+        if changed_choices is not None and args[0] == answer_choices:
+            return snapshot(changed_question or question_text, changed_choices)
+        return None
+
+    page.locator.side_effect = locator
+    page.evaluate.side_effect = evaluate
+    return page, locator
+
+
+def test_install_question_watcher():
+    """Test that the watcher is registered for future documents and evaluated on the current one."""
+    page = MagicMock()
+
+    install_question_watcher(page)
+
+    page.add_init_script.assert_called_once_with(QUESTION_WATCHER_SCRIPT)
+    page.evaluate.assert_called_once_with(QUESTION_WATCHER_SCRIPT)
+
+
+def test_enter_participant_name_clicks_the_visible_join_button():
+    """Test that the name is submitted with the visible primary button, not the hidden 'Send' button that shares its class."""
+    page, locator = mock_quiz_page("", [])
+
+    enter_participant_name(page, "Ada Lovelace")
+
+    locator(PARTICIPANT_NAME_SELECTOR).fill.assert_called_once_with("Ada Lovelace")
+    locator(JOIN_BUTTON_SELECTOR).click.assert_called_once()
+    assert JOIN_BUTTON_SELECTOR.endswith(":visible")
+
+
+@pytest.mark.parametrize("name_form_shown", [True, False])
+def test_needs_participant_name_waits_for_the_form_or_the_event(name_form_shown):
+    """Test that the rejoin check waits for whichever of the name form and the joined event page shows first."""
+    page = MagicMock()
+    page.locator(PARTICIPANT_NAME_SELECTOR).is_visible.return_value = name_form_shown
+
+    assert needs_participant_name(page, timeout=500) is name_form_shown
+    page.locator.assert_any_call(REJOIN_CHECK_SELECTOR)
+    page.locator(REJOIN_CHECK_SELECTOR).first.wait_for.assert_called_once_with(state="visible", timeout=500)
+    assert "[data-testid='question-counter']:visible" in REJOIN_CHECK_SELECTOR
+    assert "#event" not in REJOIN_CHECK_SELECTOR
+
+
+def test_wait_for_question_returns_new_question():
+    """Test that the key of the new question reported by the watcher is returned."""
+    page = MagicMock()
+    page.evaluate.return_value = "2/3␞Which planet is known as the Red Planet?"
+
+    assert wait_for_question(page, timeout=500, previous_question="1/3␞What is the capital of France?") == page.evaluate.return_value
+    page.evaluate.assert_called_once_with(NEXT_QUESTION_EXPRESSION, ["1/3␞What is the capital of France?", 500])
+
+
+def test_wait_for_question_survives_a_reload():
+    """Test that a wait interrupted by a reload of the page goes on, for the rest of the timeout, on the new document."""
+    page = MagicMock()
+    reloaded = PlaywrightError("Execution context was destroyed, most likely because of a navigation")
+    page.evaluate.side_effect = [reloaded, "2/3␞Which planet is known as the Red Planet?"]
+
+    question = wait_for_question(page, timeout=500, previous_question="1/3␞What is the capital of France?")
+
+    assert question == "2/3␞Which planet is known as the Red Planet?"
+    assert page.evaluate.call_count == 2
+    expression, (previous_question, remaining) = page.evaluate.call_args.args
+    assert (expression, previous_question) == (NEXT_QUESTION_EXPRESSION, "1/3␞What is the capital of France?")
+    assert 0 < remaining <= 500
+
+
+def test_wait_for_question_reports_other_errors():
+    """Test that an error other than a navigation is not retried."""
+    page = MagicMock()
+    page.evaluate.side_effect = PlaywrightError("Target page, context or browser has been closed")
+
+    with pytest.raises(Exception, match="unexpected error occurred while waiting for a question"):
+        wait_for_question(page, timeout=500)
+    page.evaluate.assert_called_once()
+
+
+def test_wait_for_question_timeout():
+    """Test that a timeout reported by the watcher raises a TimeoutError."""
+    page = MagicMock()
+    page.evaluate.return_value = None
+
+    with pytest.raises(TimeoutError, match="No new question"):
+        wait_for_question(page, timeout=500)
+
+
+def test_answer_question_restarts_when_options_change():
+    """Test that a speculative model call is restarted with the new choices when the options change."""
+    page, locator = mock_quiz_page("What is the capital of France?", ["Berlin", "Madrid"], changed_choices=["Berlin", "Madrid", "Paris", "Rome"])
+    release_first_call = threading.Event()
+    asked_choices = []
+
+    def fake_answer_quiz_question(quiz_question, cache=None):
+        asked_choices.append(quiz_question.answer_choices)
+        if len(asked_choices) == 1:
+            release_first_call.wait(timeout=5)
+            return 0
+        return 2
+
+    with patch("slido_quiz_bot.slido_bot.answer_quiz_question", side_effect=fake_answer_quiz_question):
+        answered = answer_question(page)
+    release_first_call.set()
+
+    assert asked_choices == [["Berlin", "Madrid"], ["Berlin", "Madrid", "Paris", "Rome"]]
+    assert answered.options[2] == "Paris"
+    locator(option_selector("option-2")).click.assert_called_once()
+    locator(SEND_BUTTON_SELECTOR).click.assert_called_once()
+
+
+def test_answer_question_restart_uses_the_changed_question():
+    """Test that a restarted model call is asked the question of the changed snapshot, whose key is returned."""
+    page, _ = mock_quiz_page("Loading...", ["Berlin", "Madrid"], changed_choices=["Paris", "Rome"], changed_question="What is the capital of France?")
+    release_first_call = threading.Event()
+    asked_questions = []
+
+    def fake_answer_quiz_question(quiz_question, cache=None):
+        asked_questions.append(quiz_question.question)
+        if len(asked_questions) == 1:
+            release_first_call.wait(timeout=5)
+        return 0
+
+    with patch("slido_quiz_bot.slido_bot.answer_quiz_question", side_effect=fake_answer_quiz_question):
+        answered = answer_question(page)
+    release_first_call.set()
+
+    assert asked_questions == ["Loading...", "What is the capital of France?"]
+    assert answered.key == "1/3␞What is the capital of France?"
+
+
+def test_answer_question_clicks_answers_with_quotes_by_id():
+    """Test that an answer containing quotes is clicked by its identifier, after a single snapshot round-trip."""
+    page, locator = mock_quiz_page("Who said it?", ["Ada", 'O\'Brien "Jr"'])
+
+    with patch("slido_quiz_bot.slido_bot.answer_quiz_question", return_value=1):
+        answered = answer_question(page)
+
+    assert answered.counter == "1/3"
+    assert page.evaluate.call_args_list[0].args == (SNAPSHOT_EXPRESSION,)
+    locator('[data-slido-quiz-bot-option="option-1"]').click.assert_called_once()
+
+
+def test_is_last_question_counter():
+    """Test that the question counter of the snapshot tells whether the last question was reached."""
+    assert is_last_question_counter("3/3")
+    assert not is_last_question_counter("2/3")
@@ -0,0 +1,78 @@
+"""Tests for the `SlidoStandInServer` class and the load test report.
+
+This module contains tests that play a scripted quiz on the local stand-in server through its
+HTTP/event-stream protocol, without a browser.
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+from slido_quiz_bot.load_test import summarize_results
+from slido_quiz_bot.stand_in_server import PARTICIPANT_PAGE, SlidoStandInServer
+
+
+def post(server, path, payload):
+    """Posts a JSON payload to the server and returns the status code and decoded response."""
+    request = urllib.request.Request(server.base_url + path, data=json.dumps(payload).encode(), headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def states(server, participant_id):
+    """Yields the states pushed to a participant on the event stream."""
+    with urllib.request.urlopen(f"{server.base_url}/api/stream?participant_id={participant_id}", timeout=5) as stream:
+        for line in stream:
+            if line.startswith(b"data:"):
+                yield json.loads(line[len(b"data:") :])
+
+
+def test_participant_page_has_the_dom_contract():
+    """Test that the participant page contains every element the bot relies on."""
+    for selector in (
+        'name="participantName"',
+        "btn-primary",
+        'data-testid="poll-title"',
+        "poll-question-options",
+        "MuiFormControlLabel-label",
+        "aria-label",
+        "poll__btn-submit",
+        'data-testid="question-counter"',
+    ):
+        assert selector in PARTICIPANT_PAGE
+
+
+def test_scripted_quiz_over_the_protocol(dummy_quiz_questions):
+    """Test joining, receiving every poll, voting and reading back the time-to-answer."""
+    quiz_questions = dummy_quiz_questions[:2]
+    with SlidoStandInServer(quiz_questions, expected_participants=1, question_gap=0.01) as server:
+        with urllib.request.urlopen(server.url, timeout=5) as response:
+            assert b"participantName" in response.read()
+
+        assert server.state() == {"status": "waiting", "total": 2, "poll": None, "answered_poll_ids": []}
+
+        _, joined = post(server, "/api/participants", {"name": "Alan Turing"})
+        participant_id = joined["participant_id"]
+
+        seen_questions = []
+        for state in states(server, participant_id):
+            poll = state["poll"]
+            if state["status"] == "poll" and poll["poll_id"] not in state["answered_poll_ids"]:
+                seen_questions.append(poll["question"])
+                correct_option = poll["options"][quiz_questions[poll["number"] - 1].correct_answer_index]
+                vote = {"participant_id": participant_id, "poll_id": poll["poll_id"], "option_id": correct_option["id"]}
+                assert post(server, "/api/votes", vote) == (200, {"accepted": True})
+                assert post(server, "/api/votes", vote) == (409, {"accepted": False})
+            if state["status"] == "finished":
+                break
+
+        assert server.wait_until_finished(timeout=5)
+        results = server.results()
+
+    assert seen_questions == [quiz.question for quiz in quiz_questions]
+    report = summarize_results(results, participants=1, questions=2, wall_time=1.0)
+    assert (report.votes, report.expected_votes, report.accuracy) == (2, 2, 1.0)
+    assert 0 < report.p50 <= report.p99
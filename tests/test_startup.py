@@ -0,0 +1,30 @@
+"""Tests for the `startup` module.
+
+This module contains startup regression tests: importing the CLI must not load the heavy modules,
+and the CLI must join a local stand-in quiz within a few seconds.
+"""
+
+from slido_quiz_bot.startup import measure_import_time, measure_time_to_ready, parse_import_times
+
+
+def test_parse_import_times():
+    """Test that the `-X importtime` report is parsed into seconds, skipping its header."""
+    output = "import time: self [us] | cumulative | imported package\nimport time:       216 |      22255 |     certifi.core\n"
+
+    assert parse_import_times(output) == {"certifi.core": (0.000216, 0.022255)}
+
+
+def test_cli_import_does_not_load_heavy_modules():
+    """Test that importing the CLI entry point loads neither Playwright nor the model library."""
+    report = measure_import_time()
+
+    assert report.heavy_modules == []
+    assert report.total > 0
+
+
+def test_cli_is_ready_quickly(chromium, monkeypatch):
+    """Test that the CLI joins a local quiz within the startup budget."""
+    # The CLI runs the browser headless inside Docker, which it detects from the HOSTNAME variable
+    monkeypatch.setenv("HOSTNAME", "slido-quiz-bot-tests")
+
+    assert measure_time_to_ready(timeout=30, cli_args=("--no_warm_up",)) < 10